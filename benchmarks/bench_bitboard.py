@@ -0,0 +1,103 @@
+# bench_bitboard.py - Full-tree Tic Tac Toe minimax on the 2D list board vs the bitboard
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'gemini_enemy')))
+
+from bitboard import EMPTY_CELLS, FIRST_LINE, FULL, winner
+
+
+def list_winner(b):
+    """check_winner as it was before the bitboard"""
+    for i in range(3):
+        if b[i][0] == b[i][1] == b[i][2] != ' ':
+            return b[i][0]
+    for i in range(3):
+        if b[0][i] == b[1][i] == b[2][i] != ' ':
+            return b[0][i]
+    if b[0][0] == b[1][1] == b[2][2] != ' ':
+        return b[0][0]
+    if b[0][2] == b[1][1] == b[2][0] != ' ':
+        return b[0][2]
+    return None
+
+
+def list_minimax(b, is_maximizing, counter):
+    """The old uncached minimax: rescans the nested lists at every node"""
+    counter[0] += 1
+    result = list_winner(b)
+    if result == 'X':
+        return 1
+    if result == 'O':
+        return -1
+    if all(b[i][j] != ' ' for i in range(3) for j in range(3)):
+        return 0
+    player = 'X' if is_maximizing else 'O'
+    best = -2 if is_maximizing else 2
+    for i in range(3):
+        for j in range(3):
+            if b[i][j] == ' ':
+                b[i][j] = player
+                score = list_minimax(b, not is_maximizing, counter)
+                b[i][j] = ' '
+                best = max(best, score) if is_maximizing else min(best, score)
+    return best
+
+
+def bit_minimax(x, o, is_maximizing, counter):
+    """Same search on two 9-bit masks with table lookups for win, draw and moves"""
+    counter[0] += 1
+    result = winner(x, o)
+    if result == 'X':
+        return 1
+    if result == 'O':
+        return -1
+    occupied = x | o
+    if occupied == FULL:
+        return 0
+    if is_maximizing:
+        best = -2
+        for i in EMPTY_CELLS[occupied]:
+            best = max(best, bit_minimax(x | 1 << i, o, False, counter))
+    else:
+        best = 2
+        for i in EMPTY_CELLS[occupied]:
+            best = min(best, bit_minimax(x, o | 1 << i, True, counter))
+    return best
+
+
+def time_search(search, repeats):
+    best = float('inf')
+    for _ in range(repeats):
+        counter = [0]
+        start = time.perf_counter()
+        value = search(counter)
+        best = min(best, time.perf_counter() - start)
+    return best, counter[0], value
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark full-tree minimax on list vs bitboard")
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+
+    # FIRST_LINE and friends are built at import; make sure that is not in the timing
+    assert len(FIRST_LINE) == FULL + 1
+
+    empty = [[' '] * 3 for _ in range(3)]
+    list_s, list_nodes, list_value = time_search(
+        lambda counter: list_minimax(empty, True, counter), args.repeats)
+    bit_s, bit_nodes, bit_value = time_search(
+        lambda counter: bit_minimax(0, 0, True, counter), args.repeats)
+    assert (list_nodes, list_value) == (bit_nodes, bit_value)
+
+    print(f"full game tree from the empty board: {list_nodes} nodes, value {list_value}")
+    print(f"2D lists: {list_s * 1000:8.1f} ms  ({list_nodes / list_s / 1e3:6.0f}k nodes/s)")
+    print(f"bitboard: {bit_s * 1000:8.1f} ms  ({bit_nodes / bit_s / 1e3:6.0f}k nodes/s)")
+    print(f"speedup:  {list_s / bit_s:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
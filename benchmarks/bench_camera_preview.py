@@ -0,0 +1,80 @@
+# bench_camera_preview.py - Per-frame cost of the camera preview path at 1080p
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import cv2
+import numpy as np
+import pygame
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'gesturedetectTT')))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'game_ui')))
+
+from camera_preview import CameraPreview
+
+
+class FakeState:
+    def __init__(self, frame_id, frame, rgb):
+        self.frame_id = frame_id
+        self.frame = frame
+        self.rgb = rgb
+
+
+def old_path(screen, frame, dest_size):
+    """What the game windows did before: convert again, allocate, scale, blit"""
+    h, w, _ = frame.shape
+    size = min(h, w)
+    frame_square = frame[0:size, 0:size]
+    frame_surface = pygame.surfarray.make_surface(
+        cv2.cvtColor(frame_square, cv2.COLOR_BGR2RGB).swapaxes(0, 1)
+    )
+    scaled_frame = pygame.transform.scale(frame_surface, dest_size)
+    screen.blit(scaled_frame, (0, 0))
+
+
+def time_it(fn, iterations):
+    start = time.perf_counter()
+    for i in range(iterations):
+        fn(i)
+    return (time.perf_counter() - start) / iterations * 1000.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the camera preview path")
+    parser.add_argument('--iterations', type=int, default=200)
+    parser.add_argument('--screen', default="1920x1080")
+    args = parser.parse_args()
+    width, height = (int(v) for v in args.screen.split('x'))
+
+    pygame.init()
+    screen = pygame.display.set_mode((width, height))
+    dest_size = (width // 2, height)
+
+    # A 1080p camera frame; the model already has its RGB copy
+    frame = np.random.randint(0, 255, (1080, 1920, 3), dtype=np.uint8)
+    rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+    preview = CameraPreview((0, 0) + dest_size)
+
+    def new_path(i):
+        preview.update(FakeState(i + 1, frame, rgb))
+        preview.draw(screen)
+
+    old_ms = time_it(lambda i: old_path(screen, frame, dest_size), args.iterations)
+    new_ms = time_it(new_path, args.iterations)
+    # Render frames between camera frames only need the blit
+    blit_ms = time_it(lambda i: preview.draw(screen), args.iterations)
+
+    print(f"1080p camera -> {dest_size[0]}x{dest_size[1]} preview, {args.iterations} frames")
+    print(f"old path (convert + make_surface + scale): {old_ms:.2f} ms/frame")
+    print(f"new path, new camera frame:                {new_ms:.2f} ms/frame")
+    print(f"new path, repeated camera frame:           {blit_ms:.2f} ms/frame")
+    print(f"saved per camera frame:                    {old_ms - new_ms:.2f} ms")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+# bench_gesture_accuracy.py - Accuracy and speed of the hand-rule gesture classifiers
+#
+# Runs recorded sessions (see gesturedetectTT/session.py, record with GESTURE_RECORD_LABEL set)
+# or a generated synthetic dataset through every classifier and reports per-gesture
+# precision/recall, a confusion matrix, throughput and frames until a stable recognition.
+import argparse
+import json
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'gesturedetectTT')))
+
+from gesture_classifier import GESTURES, NO_GESTURE, classify_batch
+from gestures import o_sign, paper, rock, scissors
+from gestures_ui import HandTracker
+from session import ReplaySession
+
+CLASSES = GESTURES + ("none",)
+
+# Knuckle and tip landmark per finger, thumb first (thumb "knuckle" is landmark 2)
+FINGERS = ((2, 4), (5, 8), (9, 12), (13, 16), (17, 20))
+# Which fingers are extended for each synthetic pose
+POSES = {
+    "rock": (False, False, False, False, False),
+    "paper": (True, True, True, True, True),
+    "scissors": (False, True, True, False, False),
+    "o_sign": (True, True, True, True, True),
+    "point": (False, True, False, False, False),
+    "thumbs_up": (True, False, False, False, False),
+}
+# Synthetic poses that should not be recognized as anything
+NONE_POSES = ("point", "thumbs_up")
+
+
+def make_pose(name):
+    """Canonical (21, 3) hand for a pose, wrist at the bottom, y pointing down"""
+    hand = np.zeros((21, 3), dtype=np.float64)
+    hand[0] = (0.5, 0.8, 0.0)
+    knuckle_x = (0.40, 0.44, 0.50, 0.56, 0.61)
+    for finger, (base, tip) in enumerate(FINGERS):
+        extended = POSES[name][finger]
+        base_y = 0.62 if finger else 0.68
+        tip_x = knuckle_x[finger]
+        if finger == 0 and extended:
+            # An open thumb points out to the side
+            tip_x -= 0.1
+        if name == "scissors" and finger in (1, 2):
+            tip_x += -0.07 if finger == 1 else 0.07
+        tip_y = base_y - 0.2 if extended else base_y + 0.08
+        if name == "o_sign" and finger in (0, 1):
+            tip_x, tip_y = 0.43, 0.5
+        # Joints between knuckle and tip are spread evenly
+        for step, index in enumerate(range(base, tip + 1)):
+            t = step / (tip - base)
+            hand[index] = (knuckle_x[finger] * (1 - t) + tip_x * t, base_y * (1 - t) + tip_y * t, 0.0)
+    hand[1] = (0.45, 0.74, 0.0)
+    return hand
+
+
+def transform(hand, rng):
+    """Random roll, scale and offset for one segment; per-frame noise is added later"""
+    angle = rng.normal(0, 0.25)
+    scale = rng.uniform(0.7, 1.3)
+    cos, sin = np.cos(angle), np.sin(angle)
+    centered = hand[:, :2] - hand[0, :2]
+    rotated = centered @ np.array([[cos, sin], [-sin, cos]]) * scale
+    out = hand.copy()
+    out[:, :2] = rotated + hand[0, :2] + rng.normal(0, 0.05, 2)
+    return out
+
+
+def synthetic_dataset(segments, seed, jitter=0.012, transition=6):
+    """Segments of held poses with short blends between them, like someone switching gestures"""
+    rng = np.random.default_rng(seed)
+    names = list(GESTURES) + list(NONE_POSES)
+    frames, labels = [], []
+    previous = None
+    for _ in range(segments):
+        name = names[rng.integers(len(names))]
+        target = transform(make_pose(name), rng)
+        length = int(rng.integers(30, 60))
+        for i in range(length):
+            pose = target
+            if previous is not None and i < transition:
+                t = (i + 1) / (transition + 1)
+                pose = previous * (1 - t) + target * t
+            frames.append(pose + rng.normal(0, jitter, pose.shape))
+            labels.append(GESTURES.index(name) if name in GESTURES else NO_GESTURE)
+        previous = target
+    return np.array(frames, dtype=np.float32), np.array(labels, dtype=np.int8)
+
+
+def load_sessions(paths):
+    """Concatenate labelled recordings; frames without a hand are NaN
+
+    The recorded arrays are scored directly, so every frame counts once without running a
+    pipeline (game_ui/replay_game.py plays a session through a game frame by frame).
+    """
+    landmarks, labels = [], []
+    for path in paths:
+        session = ReplaySession(path)
+        landmarks.append(session.landmarks)
+        labels.append(session.labels)
+    return np.concatenate(landmarks), np.concatenate(labels)
+
+
+def rules_classifier(hand):
+    """gestures.rock/paper/scissors/o_sign in the menu's priority order"""
+    if hand is None:
+        return None
+    if o_sign(hand)[0]:
+        return "o_sign"
+    if scissors(hand):
+        return "scissors"
+    if paper(hand):
+        return "paper"
+    if rock(hand):
+        return "rock"
+    return None
+
+
+def hand_tracker_classifier(hand):
+    """HandTracker.detect_gesture without opening a camera"""
+    return HandTracker.detect_gesture(SimpleNamespace(landmarks=hand))
+
+
+def run_per_hand(classifier, hands):
+    """Classify one hand at a time from Python lists, the way the live code sees them"""
+    inputs = [None if np.isnan(hand[0, 0]) else hand.tolist() for hand in hands]
+    start = time.perf_counter()
+    names = [classifier(hand) for hand in inputs]
+    elapsed = time.perf_counter() - start
+    codes = np.array([NO_GESTURE if name is None else GESTURES.index(name) for name in names],
+                     dtype=np.int8)
+    return codes, elapsed
+
+
+def run_batch(hands):
+    start = time.perf_counter()
+    codes = classify_batch(hands)
+    return codes, time.perf_counter() - start
+
+
+def confusion_matrix(labels, codes):
+    """Rows are true classes, columns predictions; 'none' is the last row/column"""
+    size = len(CLASSES)
+    matrix = np.zeros((size, size), dtype=np.int64)
+    # NO_GESTURE (-1) lands in the last slot
+    np.add.at(matrix, (labels % size, codes % size), 1)
+    return matrix
+
+
+def precision_recall(matrix):
+    scores = {}
+    for i, name in enumerate(GESTURES):
+        predicted = matrix[:, i].sum()
+        actual = matrix[i, :].sum()
+        scores[name] = {
+            'precision': float(matrix[i, i] / predicted) if predicted else 0.0,
+            'recall': float(matrix[i, i] / actual) if actual else 0.0,
+            'support': int(actual),
+        }
+    return scores
+
+
+def frames_to_stable(labels, codes, stable):
+    """Frames from the start of each labelled segment until `stable` matching frames in a row"""
+    latencies = []
+    missed = 0
+    start = 0
+    while start < len(labels):
+        end = start
+        while end < len(labels) and labels[end] == labels[start]:
+            end += 1
+        if labels[start] != NO_GESTURE:
+            run = 0
+            found = None
+            for i in range(start, end):
+                run = run + 1 if codes[i] == labels[start] else 0
+                if run == stable:
+                    found = i - start + 1
+                    break
+            if found is None:
+                missed += 1
+            else:
+                latencies.append(found)
+        start = end
+    return latencies, missed
+
+
+def evaluate(name, codes, elapsed, labels, stable):
+    matrix = confusion_matrix(labels, codes)
+    latencies, missed = frames_to_stable(labels, codes, stable)
+    return {
+        'classifier': name,
+        'frames': int(len(labels)),
+        'accuracy': float(np.trace(matrix) / matrix.sum()),
+        'per_second': float(len(labels) / elapsed) if elapsed > 0 else float('inf'),
+        'gestures': precision_recall(matrix),
+        'confusion': matrix.tolist(),
+        'stable_frames_mean': float(np.mean(latencies)) if latencies else None,
+        'stable_frames_p95': float(np.percentile(latencies, 95)) if latencies else None,
+        'segments_never_stable': missed,
+    }
+
+
+def print_report(result, reference=None):
+    print(f"\n== {result['classifier']} ==")
+    print(f"frames {result['frames']}, accuracy {result['accuracy']:.3f}, "
+          f"{result['per_second']:,.0f} classifications/s")
+    if reference is not None and result['confusion'] == reference['confusion']:
+        print(f"predictions identical to {reference['classifier']}")
+        return
+    print(f"{'gesture':<10}{'precision':>10}{'recall':>8}{'support':>9}")
+    for gesture, score in result['gestures'].items():
+        print(f"{gesture:<10}{score['precision']:>10.3f}{score['recall']:>8.3f}{score['support']:>9}")
+
+    print("confusion (rows true, columns predicted):")
+    print(" " * 10 + "".join(f"{name:>10}" for name in CLASSES))
+    for name, row in zip(CLASSES, result['confusion']):
+        print(f"{name:<10}" + "".join(f"{count:>10}" for count in row))
+
+    if result['stable_frames_mean'] is not None:
+        print(f"frames to stable recognition: mean {result['stable_frames_mean']:.1f}, "
+              f"p95 {result['stable_frames_p95']:.1f}, "
+              f"never stable in {result['segments_never_stable']} segments")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark gesture classifier accuracy and speed")
+    parser.add_argument('sessions', nargs='*',
+                        help="Recorded session directories; a synthetic dataset is used if none")
+    parser.add_argument('--segments', type=int, default=400, help="Synthetic segments to generate")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--stable', type=int, default=5,
+                        help="Matching frames in a row that count as a stable recognition")
+    parser.add_argument('--json', help="Also write the results to this file")
+    args = parser.parse_args()
+
+    if args.sessions:
+        hands, labels = load_sessions(args.sessions)
+        print(f"{len(labels)} recorded frames from {len(args.sessions)} sessions")
+    else:
+        hands, labels = synthetic_dataset(args.segments, args.seed)
+        print(f"{len(labels)} synthetic frames in {args.segments} segments (seed {args.seed})")
+
+    results = []
+    for name, classifier in (("gestures rules", rules_classifier),
+                             ("HandTracker.detect_gesture", hand_tracker_classifier)):
+        codes, elapsed = run_per_hand(classifier, hands)
+        results.append(evaluate(name, codes, elapsed, labels, args.stable))
+    codes, elapsed = run_batch(hands)
+    results.append(evaluate("vectorized batch", codes, elapsed, labels, args.stable))
+
+    for result in results:
+        print_report(result, results[0] if result is not results[0] else None)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
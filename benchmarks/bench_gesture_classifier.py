@@ -0,0 +1,60 @@
+# bench_gesture_classifier.py - Per-tuple gesture rules vs the vectorized NumPy classifier
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'gesturedetectTT')))
+
+from gesture_classifier import GESTURES, NO_GESTURE, classify, classify_batch
+from gestures import detect_gesture
+
+
+def make_hands(count, seed):
+    """Random hands, with thumb/index and index/middle tips pulled close in some of them"""
+    rng = np.random.default_rng(seed)
+    hands = rng.random((count, 21, 3)).astype(np.float32)
+    hands[::3, 8, :2] = hands[::3, 4, :2] + rng.normal(0, 0.05, (len(hands[::3]), 2))
+    hands[1::3, 12, :2] = hands[1::3, 8, :2] + rng.normal(0, 0.1, (len(hands[1::3]), 2))
+    return hands
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the gesture classifiers")
+    parser.add_argument('--hands', type=int, default=100000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    hands = make_hands(args.hands, args.seed)
+
+    # Old path: landmarks as Python lists, one hand at a time
+    start = time.perf_counter()
+    tuple_results = [detect_gesture(hand.tolist()) for hand in hands]
+    tuple_s = time.perf_counter() - start
+
+    # New path, one hand at a time; pays NumPy call overhead for every hand
+    start = time.perf_counter()
+    single_results = [classify(hand) for hand in hands]
+    single_s = time.perf_counter() - start
+
+    # New path, whole recording at once
+    start = time.perf_counter()
+    codes = classify_batch(hands)
+    batch_s = time.perf_counter() - start
+    batch_results = [None if code == NO_GESTURE else GESTURES[code] for code in codes]
+
+    mismatches = sum(a != b for a, b in zip(tuple_results, single_results))
+    mismatches += sum(a != b for a, b in zip(tuple_results, batch_results))
+
+    print(f"{args.hands} hands")
+    print(f"per-tuple rules:          {tuple_s / args.hands * 1e6:8.2f} us/hand")
+    print(f"vectorized, single hand:  {single_s / args.hands * 1e6:8.2f} us/hand")
+    print(f"vectorized, batch:        {batch_s / args.hands * 1e6:8.2f} us/hand "
+          f"({tuple_s / batch_s:.0f}x faster)")
+    print(f"mismatches: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+# bench_inference_backend.py - Main-loop frame time with the thread vs process inference backend
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+module_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'gesturedetectTT'))
+sys.path.insert(0, module_dir)
+
+from inference_backend import make_backend
+from pipeline import HandPipeline
+from vision import GAME_CONFIG
+
+
+class SyntheticCamera:
+    """Stand-in for CameraStream that produces frames at a fixed rate"""
+
+    def __init__(self, width=1280, height=720, fps=30):
+        self.interval = 1.0 / fps
+        ramp = np.linspace(0, 255, width, dtype=np.uint8)
+        self.frame = np.repeat(np.tile(ramp, (height, 1))[:, :, None], 3, axis=2)
+        self.start = time.perf_counter()
+        self.running = True
+
+    @property
+    def frame_id(self):
+        return int((time.perf_counter() - self.start) / self.interval) + 1
+
+    def wait_for_frame(self, last_id, timeout=None):
+        deadline = time.perf_counter() + (timeout or 0)
+        while self.running and self.frame_id == last_id and time.perf_counter() < deadline:
+            time.sleep(0.002)
+        return self.frame_id
+
+    def read_latest(self, image=None):
+        return self.frame.copy(), time.perf_counter(), self.frame_id
+
+    def isOpened(self):
+        return True
+
+    def release(self):
+        self.running = False
+
+
+def simulate_render(canvas, rects):
+    """Roughly what a pygame frame costs: array work plus Python-level drawing logic"""
+    canvas += 1
+    total = 0
+    for x, y, w, h in rects:
+        total += (x * w + y * h) % 7
+    return total
+
+
+def run(backend_name, seconds, width, height):
+    camera = SyntheticCamera(width, height)
+    backend = make_backend(backend_name)
+    backend.configure(GAME_CONFIG)
+    pipeline = HandPipeline(camera, backend)
+    pipeline.start()
+
+    # Let the model warm up before measuring
+    time.sleep(1.0)
+
+    canvas = np.zeros((1080, 1920, 3), dtype=np.uint8)
+    rects = [(i, i * 2, 40, 40) for i in range(2000)]
+    frame_times = []
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        start = time.perf_counter()
+        simulate_render(canvas, rects)
+        _ = pipeline.latest
+        frame_times.append(time.perf_counter() - start)
+
+    inferences = pipeline.stats["inference"].count
+    inference_ms = pipeline.stats["inference"].avg_ms
+    pipeline.stop()
+    backend.close()
+    camera.release()
+
+    times = np.array(frame_times) * 1000.0
+    return {
+        'frames': len(times),
+        'mean': times.mean(),
+        'p95': np.percentile(times, 95),
+        'p99': np.percentile(times, 99),
+        'inferences': inferences,
+        'inference_ms': inference_ms,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare inference backends")
+    parser.add_argument('--seconds', type=float, default=5.0)
+    parser.add_argument('--width', type=int, default=1280)
+    parser.add_argument('--height', type=int, default=720)
+    args = parser.parse_args()
+
+    print(f"Main-loop frame time over {args.seconds:.0f}s, {args.width}x{args.height} camera")
+    print(f"{'backend':<10}{'frames':>8}{'mean ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'infer/s':>10}{'infer ms':>10}")
+    for name in ('thread', 'process'):
+        result = run(name, args.seconds, args.width, args.height)
+        print(f"{name:<10}{result['frames']:>8}{result['mean']:>10.2f}{result['p95']:>10.2f}"
+              f"{result['p99']:>10.2f}{result['inferences'] / args.seconds:>10.1f}{result['inference_ms']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# bench_mcts.py - MCTS playouts per second and strength at each difficulty budget
+import argparse
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'gemini_enemy')))
+
+from alphabeta import random_move
+from bitboard import GridBoard
+from mcts import MCTS_BUDGETS, MCTSEngine
+
+VARIANTS = ((3, 3), (4, 4), (5, 4))
+
+
+def playout_rate(size, k, batch, seconds):
+    """Random playouts per second from the empty board"""
+    engine = MCTSEngine(size, k, time_budget=seconds, batch=batch, seed=0)
+    engine.best_move(GridBoard(size, k), 'X')
+    return engine.playouts_per_second
+
+
+def play_random(engine, size, k, seed):
+    """One game: random player O moves first, the engine plays X"""
+    random.seed(seed)
+    engine.reset()
+    board = GridBoard(size, k)
+    player = 'O'
+    while True:
+        move = engine.best_move(board, 'X') if player == 'X' else random_move(board)
+        board.play(move, player)
+        result = board.winner()
+        if result or board.is_full():
+            return result
+        player = 'O' if player == 'X' else 'X'
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the MCTS engine")
+    parser.add_argument('--seconds', type=float, default=1.0, help="Search time for the rate test")
+    parser.add_argument('--games', type=int, default=10, help="Games against a random player per budget")
+    args = parser.parse_args()
+
+    print("random playouts per second from the empty board")
+    for size, k in VARIANTS:
+        rates = [f"batch {batch}: {playout_rate(size, k, batch, args.seconds):>10,.0f}" for batch in (1, 8, 32, 128)]
+        print(f"  {size}x{size} k={k}  " + "  ".join(rates))
+
+    print(f"\nengine (X, moving second) vs random player over {args.games} games")
+    for size, k in VARIANTS:
+        for difficulty, budget in MCTS_BUDGETS.items():
+            engine = MCTSEngine(size, k, seed=0, **budget)
+            results = [play_random(engine, size, k, seed) for seed in range(args.games)]
+            print(f"  {size}x{size} {difficulty:<7} {budget}: "
+                  f"won {results.count('X')}, lost {results.count('O')}, drew {results.count(None)}")
+
+
+if __name__ == "__main__":
+    main()
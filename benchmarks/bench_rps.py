@@ -0,0 +1,60 @@
+# bench_rps.py - Rock Paper Scissors strategies against scripted players: win rates and cost per move
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'gemini_enemy')))
+
+from rps_bots import BOTS
+from rps_predictors import STRATEGIES, outcome
+
+
+def play(strategy, bot, rounds):
+    """Return (ai wins, ties, ai losses, seconds spent in the strategy)"""
+    wins = ties = losses = 0
+    last_self = last_ai = None
+    spent = 0.0
+    clock = time.perf_counter
+    for _ in range(rounds):
+        player_move = bot.next_move(last_self, last_ai)
+        start = clock()
+        ai_move = strategy.choose()
+        strategy.update(player_move, ai_move)
+        spent += clock() - start
+        result = outcome(ai_move, player_move)
+        if result == 1:
+            wins += 1
+        elif result == 0:
+            ties += 1
+        else:
+            losses += 1
+        last_self, last_ai = player_move, ai_move
+    return wins, ties, losses, spent
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Rock Paper Scissors strategies")
+    parser.add_argument('--rounds', type=int, default=100000, help="Rounds per strategy and bot")
+    parser.add_argument('--strategies', nargs='+', default=list(STRATEGIES), choices=list(STRATEGIES))
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    print(f"{args.rounds:,} rounds per match; win/tie/loss from the AI's side")
+    for name in args.strategies:
+        print(f"\n{name}")
+        total_rounds = 0
+        total_spent = 0.0
+        for bot in BOTS:
+            wins, ties, losses, spent = play(STRATEGIES[name](), bot, args.rounds)
+            total_rounds += args.rounds
+            total_spent += spent
+            print(f"  vs {bot.name:<20} win {wins / args.rounds:6.1%}  tie {ties / args.rounds:6.1%}  "
+                  f"loss {losses / args.rounds:6.1%}")
+        print(f"  {total_spent / total_rounds * 1e6:.2f} us per move")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,57 +1,47 @@
+from bitboard import make_board
+
 class Board():
     #Create 2D list to store board values: ' ', X, O
     #empty ' ',
     #Player X
     #Computer O
-    def __init__(self):
-        self.board = [
-            [' ', ' ', ' '],
-            [' ', ' ', ' '],
-            [' ', ' ', ' ']
-        ]
+    #The bitboard is the source of truth; the 2D list is kept in sync for rendering
+    def __init__(self, size=3, k=None):
+        self.size = size
+        self.bits = make_board(size, k)
+        self.board = [[' '] * size for _ in range(size)]
 
         self.game_over = False
-    
+
     def mark_square(self, player, row, col):
-        if self.board[row][col] != ' ':
+        index = row * self.size + col
+        if not self.bits.is_empty(index):
             return False
 
+        self.bits.play(index, player)
         self.board[row][col] = player
         if self.win_check():
             print(f"Player {player} wins!")
             self.game_over = True
-        
+
         return True
 
     def win_check(self):
-        #Check rows
-        for row in range(3):
-            if self.board[row][0] == self.board[row][1] == self.board[row][2] != ' ':
-                self.game_over = True
-                return self.board[row][0]
-        #Check columns
-        for col in range(3):
-            if self.board[0][col] == self.board[1][col] == self.board[2][col] != ' ':
-                self.game_over = True
-                return self.board[0][col]
-        #Check diagonals
-        if self.board[0][0] == self.board[1][1] == self.board[2][2] != ' ':
+        winner = self.bits.winner()
+        if winner:
             self.game_over = True
-            return self.board[0][0]
-        if self.board[0][2] == self.board[1][1] == self.board[2][0] != ' ':
-            self.game_over = True
-            return self.board[0][2]
-        return None
-    
+        return winner
+
     def is_tie(self):
-        for row in self.board:
-            if ' ' in row:
-                return False
+        if not self.bits.is_full():
+            return False
         self.game_over = True
         return True
 
-            
+    def winning_line(self):
+        """Cell indices of the winning line, or None"""
+        return self.bits.winning_line()
+
     def print_board(self):
-        print(self.board[0])
-        print(self.board[1])
-        print(self.board[2])
\ No newline at end of file
+        for row in self.board:
+            print(row)
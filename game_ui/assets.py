@@ -0,0 +1,115 @@
+# assets.py - Load-once image cache with per-size scaling and a texture atlas for the small custom icons
+import os
+
+import pygame
+
+# Paths are relative to game_ui, whatever the working directory is
+ASSET_DIR = os.path.dirname(os.path.abspath(__file__))
+CUSTOM_DIR = os.path.join('sprites', 'custom')
+# Images in sprites/custom this small or smaller are packed into the atlas
+ATLAS_MAX_SIZE = 64
+ATLAS_WIDTH = 256
+ATLAS_PADDING = 1
+
+
+def asset_path(*parts):
+    return os.path.join(ASSET_DIR, *parts)
+
+
+class Atlas:
+    """Pack small images into one surface; each image becomes a subsurface of it"""
+
+    def __init__(self, images, width=ATLAS_WIDTH, padding=ATLAS_PADDING):
+        # Shelf packing: tallest first, left to right, a new row when one fills up
+        order = sorted(images, key=lambda name: -images[name].get_height())
+        positions = {}
+        x = y = row_height = 0
+        for name in order:
+            w, h = images[name].get_size()
+            if x + w > width:
+                x, y = 0, y + row_height + padding
+                row_height = 0
+            positions[name] = pygame.Rect(x, y, w, h)
+            x += w + padding
+            row_height = max(row_height, h)
+
+        self.surface = pygame.Surface((width, max(1, y + row_height)), pygame.SRCALPHA).convert_alpha()
+        self.surface.fill((0, 0, 0, 0))
+        self.regions = {}
+        for name, rect in positions.items():
+            self.surface.blit(images[name], rect)
+            # Subsurfaces share the atlas pixels; nothing is copied
+            self.regions[name] = self.surface.subsurface(rect)
+
+    def get(self, name):
+        return self.regions.get(name)
+
+
+class AssetManager:
+    """Load, convert and scale each image once; later requests are dictionary lookups"""
+
+    def __init__(self):
+        self.images = {}
+        self.scaled = {}
+        self.atlas = None
+
+    def build_atlas(self):
+        images = {}
+        directory = asset_path(CUSTOM_DIR)
+        if os.path.isdir(directory):
+            for filename in sorted(os.listdir(directory)):
+                if not filename.endswith('.png'):
+                    continue
+                path = os.path.join(CUSTOM_DIR, filename)
+                image = pygame.image.load(os.path.join(directory, filename)).convert_alpha()
+                if image.get_width() <= ATLAS_MAX_SIZE and image.get_height() <= ATLAS_MAX_SIZE:
+                    images[path] = image
+                else:
+                    # Already decoded to check its size, so keep it
+                    self.images[(path, True)] = image
+        self.atlas = Atlas(images)
+
+    def load(self, path, alpha=True):
+        """Converted image for a path relative to game_ui, or None if it does not exist"""
+        key = (path, alpha)
+        if key in self.images:
+            return self.images[key]
+
+        if self.atlas is None:
+            self.build_atlas()
+        image = self.atlas.get(path) if alpha else None
+        if image is None:
+            full_path = asset_path(path)
+            if os.path.exists(full_path):
+                image = pygame.image.load(full_path)
+                image = image.convert_alpha() if alpha else image.convert()
+        self.images[key] = image
+        return image
+
+    def image(self, path, size=None, alpha=True):
+        """Image scaled to `size` (width, height), cached per size; None if missing"""
+        if size is None:
+            return self.load(path, alpha)
+        key = (path, tuple(size), alpha)
+        image = self.scaled.get(key)
+        if image is None and key not in self.scaled:
+            original = self.load(path, alpha)
+            image = None if original is None else pygame.transform.scale(original, size)
+            self.scaled[key] = image
+        return image
+
+    def clear(self):
+        self.images.clear()
+        self.scaled.clear()
+        self.atlas = None
+
+
+_assets = None
+
+
+def get_assets():
+    """Shared asset manager; needs a display mode set before the first load"""
+    global _assets
+    if _assets is None:
+        _assets = AssetManager()
+    return _assets
@@ -0,0 +1,66 @@
+# camera_preview.py - Camera preview renderer that reuses its surfaces every frame
+import pygame
+
+from gestures import HAND_CONNECTIONS
+
+# Colors match what the old cv2 overlay looked like once converted to RGB
+LANDMARK_COLOR = (241, 102, 99)
+CONNECTION_COLOR = (249, 245, 241)
+CROSSHAIR_COLOR = (246, 130, 59)
+
+
+class CameraPreview:
+    """Show the square camera crop scaled into a fixed screen rect"""
+
+    def __init__(self, rect):
+        self.rect = pygame.Rect(rect)
+
+        # Persistent surfaces: one at camera resolution, one at screen size
+        self.source = None
+        self.scaled = pygame.Surface(self.rect.size).convert()
+        self.last_frame_id = None
+
+    def update(self, state):
+        """Upload a new frame; does nothing if this frame is already shown"""
+        if state is None or state.rgb is None or state.frame_id == self.last_frame_id:
+            return
+        self.last_frame_id = state.frame_id
+
+        h, w, _ = state.rgb.shape
+        size = min(h, w)
+        if self.source is None or self.source.get_size() != (size, size):
+            self.source = pygame.Surface((size, size)).convert()
+
+        # Reuse the RGB frame the model saw; surfarray wants (x, y) order
+        pygame.surfarray.blit_array(self.source, state.rgb[0:size, 0:size].swapaxes(0, 1))
+        pygame.transform.scale(self.source, self.rect.size, self.scaled)
+
+    def draw(self, surface):
+        if self.last_frame_id is not None:
+            surface.blit(self.scaled, self.rect)
+
+    def to_screen(self, x, y):
+        """Map square-crop normalized coordinates to screen pixels"""
+        return (int(self.rect.x + x * self.rect.width), int(self.rect.y + y * self.rect.height))
+
+    def draw_landmarks(self, surface, landmarks):
+        """Draw square-crop normalized landmarks over the preview"""
+        points = [self.to_screen(x, y) for x, y, _ in landmarks]
+        previous_clip = surface.get_clip()
+        surface.set_clip(self.rect)
+        for start, end in HAND_CONNECTIONS:
+            pygame.draw.line(surface, CONNECTION_COLOR, points[start], points[end], 2)
+        for point in points:
+            pygame.draw.circle(surface, (255, 255, 255), point, 6, 2)
+            pygame.draw.circle(surface, LANDMARK_COLOR, point, 5, 2)
+        surface.set_clip(previous_clip)
+
+    def draw_crosshair(self, surface, x, y):
+        """Draw a targeting crosshair at square-crop normalized coordinates"""
+        cx, cy = self.to_screen(x, y)
+        pygame.draw.circle(surface, CROSSHAIR_COLOR, (cx, cy), 15, 3)
+        pygame.draw.circle(surface, CROSSHAIR_COLOR, (cx, cy), 3)
+        pygame.draw.line(surface, CROSSHAIR_COLOR, (cx - 25, cy), (cx - 10, cy), 2)
+        pygame.draw.line(surface, CROSSHAIR_COLOR, (cx + 10, cy), (cx + 25, cy), 2)
+        pygame.draw.line(surface, CROSSHAIR_COLOR, (cx, cy - 25), (cx, cy - 10), 2)
+        pygame.draw.line(surface, CROSSHAIR_COLOR, (cx, cy + 10), (cx, cy + 25), 2)
@@ -0,0 +1,72 @@
+# compositor.py - Cache a screen's static layers and push only the regions that changed
+import pygame
+
+# Past this many dirty rects one bounding box is cheaper to push than the list
+MAX_RECTS = 48
+
+
+class Compositor:
+    """Static layers are drawn once and kept as one backdrop surface; dynamic drawing reports dirty rects
+
+    A frame is begin(), dynamic drawing with mark() around each blit or draw call, then present().
+    Screens that redraw everything call invalidate() instead of begin() and get a full flip.
+    """
+
+    def __init__(self, screen):
+        self.screen = screen
+        self.screen_rect = screen.get_rect()
+        self.key = None
+        self.backdrop = None
+        self.previous = []
+        self.dirty = []
+        self.full = True
+
+    def begin(self, key, layers):
+        """Start a frame over the static layers for `key`, drawing and caching them on first use
+
+        Each layer is a function that draws onto the screen; the result is snapshotted once.
+        Areas marked last frame are restored from the snapshot so dynamic content can move.
+        """
+        if key != self.key or self.backdrop is None:
+            for draw_layer in layers:
+                draw_layer()
+            if self.backdrop is None or self.backdrop.get_size() != self.screen.get_size():
+                self.backdrop = self.screen.copy()
+            else:
+                self.backdrop.blit(self.screen, (0, 0))
+            self.key = key
+            self.previous = []
+            self.full = True
+        else:
+            for rect in self.previous:
+                self.screen.blit(self.backdrop, rect, rect)
+        self.dirty = []
+
+    def invalidate(self):
+        """Nothing on screen can be reused; the next present() flips the whole frame"""
+        self.key = None
+        self.previous = []
+        self.full = True
+
+    def mark(self, rect):
+        """Record a region drawn this frame; returns the rect so blit and draw calls can be wrapped"""
+        # Kept on full frames too, so the next frame knows what to erase
+        if rect is not None and self.key is not None:
+            rect = pygame.Rect(rect).clip(self.screen_rect)
+            if rect.width and rect.height:
+                self.dirty.append(rect)
+        return rect
+
+    def present(self):
+        if self.full:
+            pygame.display.flip()
+            # Only a screen drawn over a backdrop can do partial updates next frame
+            self.full = self.key is None
+        else:
+            rects = self.previous + self.dirty
+            if len(rects) > MAX_RECTS:
+                rects = [rects[0].unionall(rects[1:])]
+            if rects:
+                pygame.display.update(rects)
+        self.previous = self.dirty
+        self.dirty = []
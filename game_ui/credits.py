@@ -1,5 +1,6 @@
 # credits.py - Credits page
 import pygame
+from text_cache import render_text
 import math
 
 class CreditsPage:
@@ -17,10 +18,10 @@ class CreditsPage:
         self.COLOR_HIGHLIGHT = (59, 130, 246)
         
         # Fonts
-        self.title_font = pygame.font.Font(None, 80)
-        self.heading_font = pygame.font.Font(None, 48)
-        self.body_font = pygame.font.Font(None, 32)
-        self.small_font = pygame.font.Font(None, 26)
+        self.title_size = 80
+        self.heading_size = 48
+        self.body_size = 32
+        self.small_size = 26
         
         # Animation
         self.animation_time = 0
@@ -35,8 +36,8 @@ class CreditsPage:
     def draw_section(self, y, title, items, color):
         """Draw a credit section with title and items"""
         # Title with underline + shadow
-        title_shadow = self.heading_font.render(title, True, self.COLOR_TEXT_DIM)
-        title_surface = self.heading_font.render(title, True, color)
+        title_shadow = render_text(title, self.heading_size, self.COLOR_TEXT_DIM)
+        title_surface = render_text(title, self.heading_size, color)
         title_rect = title_surface.get_rect(center=(self.WINDOW_WIDTH // 2, y))
         title_shadow_rect = title_rect.copy()
         title_shadow_rect.x += 2
@@ -53,8 +54,8 @@ class CreditsPage:
         # Items + shadow
         item_y = y + 65
         for item in items:
-            item_shadow = self.body_font.render(item, True, self.COLOR_TEXT_DIM)
-            item_surface = self.body_font.render(item, True, self.COLOR_TEXT)
+            item_shadow = render_text(item, self.body_size, self.COLOR_TEXT_DIM)
+            item_surface = render_text(item, self.body_size, self.COLOR_TEXT)
             item_rect = item_surface.get_rect(center=(self.WINDOW_WIDTH // 2, item_y))
             item_shadow_rect = item_rect.copy()
             item_shadow_rect.x += 2
@@ -78,29 +79,33 @@ class CreditsPage:
         pygame.draw.rect(self.screen, self.COLOR_ACCENT, card_rect, 3, border_radius=15)
         
         # Tech name
-        name_surface = self.heading_font.render(tech_name, True, self.COLOR_ACCENT)
+        name_surface = render_text(tech_name, self.heading_size, self.COLOR_ACCENT)
         name_rect = name_surface.get_rect(center=(x + card_width // 2, y + 45))
         self.screen.blit(name_surface, name_rect)
         
         # Purpose
-        purpose_surface = self.small_font.render(purpose, True, self.COLOR_TEXT_DIM)
+        purpose_surface = render_text(purpose, self.small_size, self.COLOR_TEXT_DIM)
         purpose_rect = purpose_surface.get_rect(center=(x + card_width // 2, y + 90))
         self.screen.blit(purpose_surface, purpose_rect)
     
     def draw(self):
+        self.draw_static()
+        self.draw_animated()
+    
+    def draw_static(self):
+        """Everything except the pulsing tech cards"""
         self.screen.fill(self.COLOR_BG)
-        self.animation_time += 0.05
         
         # Back button (fixed position)
         pygame.draw.rect(self.screen, self.COLOR_CARD_BG, self.back_button, border_radius=10)
         pygame.draw.rect(self.screen, self.COLOR_ACCENT, self.back_button, 2, border_radius=10)
-        back_text = self.body_font.render("Back", True, self.COLOR_TEXT)
+        back_text = render_text("Back", self.body_size, self.COLOR_TEXT)
         back_rect = back_text.get_rect(center=self.back_button.center)
         self.screen.blit(back_text, back_rect)
         
         # Main title + shadow
-        title_shadow = self.title_font.render("Credits", True, self.COLOR_TEXT_DIM)
-        title = self.title_font.render("Credits", True, self.COLOR_TEXT)
+        title_shadow = render_text("Credits", self.title_size, self.COLOR_TEXT_DIM)
+        title = render_text("Credits", self.title_size, self.COLOR_TEXT)
         title_rect = title.get_rect(center=(self.WINDOW_WIDTH // 2, 80))
         title_shadow_rect = title_rect.copy()
         title_shadow_rect.x += 4
@@ -108,7 +113,7 @@ class CreditsPage:
         self.screen.blit(title_shadow, title_shadow_rect)
         self.screen.blit(title, title_rect)
         
-        subtitle = self.body_font.render("Gesture Games - Hand Gesture Gaming System", True, self.COLOR_TEXT_DIM)
+        subtitle = render_text("Gesture Games - Hand Gesture Gaming System", self.body_size, self.COLOR_TEXT_DIM)
         subtitle_rect = subtitle.get_rect(center=(self.WINDOW_WIDTH // 2, 140))
         self.screen.blit(subtitle, subtitle_rect)
         
@@ -124,9 +129,9 @@ class CreditsPage:
         
         # Technologies Used + shadow
         current_y += 20
-        tech_title = self.heading_font.render("Technologies Used", True, self.COLOR_HIGHLIGHT)
+        tech_title = render_text("Technologies Used", self.heading_size, self.COLOR_HIGHLIGHT)
         tech_rect = tech_title.get_rect(center=(self.WINDOW_WIDTH // 2, current_y))
-        tech_shadow = self.heading_font.render("Technologies Used", True, self.COLOR_TEXT_DIM)
+        tech_shadow = render_text("Technologies Used", self.heading_size, self.COLOR_TEXT_DIM)
         tech_shadow_rect = tech_rect.copy()
         tech_shadow_rect.x += 2
         tech_shadow_rect.y += 2
@@ -152,12 +157,23 @@ class CreditsPage:
         total_width = cards_per_row * card_width + (cards_per_row - 1) * card_spacing
         start_x = (self.WINDOW_WIDTH - total_width) // 2
         
+        self.tech_card_positions = []
         for i, (name, purpose) in enumerate(tech_cards):
             row = i // cards_per_row
             col = i % cards_per_row
             x = start_x + col * (card_width + card_spacing)
             y = tech_y + row * 170
+            self.tech_card_positions.append((x, y, name, purpose))
+    
+    def draw_animated(self):
+        """Draw the tech cards over the static page; returns the areas they can cover"""
+        self.animation_time += 0.05
+        areas = []
+        for x, y, name, purpose in self.tech_card_positions:
             self.draw_tech_card(x, y, name, purpose)
+            # The pulse grows a card by up to 2px on each side
+            areas.append(pygame.Rect(x - 3, y - 3, 380 + 6, 140 + 6))
+        return areas
 
     def handle_click(self, pos):
         """Handle mouse/gesture clicks, return True if should go back"""
@@ -1,5 +1,7 @@
 # difficulty_select.py - Difficulty selection screen
 import pygame
+from effects import rect_surface
+from text_cache import render_text
 
 class DifficultySelect:
     def __init__(self, screen, game_type):
@@ -54,10 +56,9 @@ class DifficultySelect:
             self.screen.fill((44, 62, 80))
 
         # Draw title + shadow
-        font = pygame.font.Font(None, 96)
         title = f"Select {self.game_type} Difficulty"
-        title_shadow = font.render(title, True, (100, 100, 100))
-        title = font.render(title, True, (255, 255, 255))
+        title_shadow = render_text(title, 96, (100, 100, 100))
+        title = render_text(title, 96, (255, 255, 255))
         title_rect = title.get_rect(center=(self.WINDOW_WIDTH // 2, 100))
         title_shadow_rect = title_rect.copy()
         title_shadow_rect.x += 4
@@ -82,15 +83,12 @@ class DifficultySelect:
             
             # Hover effect
             if is_hovered:
-                glow = pygame.Surface((difficulty['rect'].width, difficulty['rect'].height), 
-                                    pygame.SRCALPHA)
-                pygame.draw.rect(glow, (255, 255, 255, 80), 
-                               glow.get_rect(), border_radius=20)
+                glow = rect_surface(difficulty['rect'].size, (255, 255, 255, 80), border_radius=20)
                 self.screen.blit(glow, difficulty['rect'])
             
             # Difficulty name + shadow
-            title_shadow = font.render(difficulty['name'], True, (100, 100, 100))
-            title = font.render(difficulty['name'], True, (255, 255, 255))
+            title_shadow = render_text(difficulty['name'], 96, (100, 100, 100))
+            title = render_text(difficulty['name'], 96, (255, 255, 255))
             title_rect = title.get_rect(centerx=difficulty['rect'].centerx,
                                         centery=difficulty['rect'].centery - 20)
             title_shadow_rect = title_rect.copy()
@@ -100,15 +98,13 @@ class DifficultySelect:
             self.screen.blit(title, title_rect)
             
             # Description
-            desc_font = pygame.font.Font(None, 32)
-            desc_text = desc_font.render(difficulty['description'], True, (255, 255, 255))
+            desc_text = render_text(difficulty['description'], 32, (255, 255, 255))
             desc_rect = desc_text.get_rect(centerx=difficulty['rect'].centerx,
                                           centery=difficulty['rect'].centery + 40)
             self.screen.blit(desc_text, desc_rect)
         
         # Instructions
-        inst_font = pygame.font.Font(None, 32)
-        inst_text = inst_font.render("Click or make 'O' gesture to select", True, (255, 255, 255))
+        inst_text = render_text("Click or make 'O' gesture to select", 32, (255, 255, 255))
         inst_rect = inst_text.get_rect(center=(self.WINDOW_WIDTH // 2, self.WINDOW_HEIGHT - 50))
         self.screen.blit(inst_text, inst_rect)
     
@@ -0,0 +1,113 @@
+# effects.py - Glow, panel and overlay surfaces built once per shape and kept in a bounded LRU cache
+from collections import OrderedDict
+
+import pygame
+
+# Pixel memory the cached effect surfaces may use before the least recently drawn go
+CACHE_BUDGET = 32 * 1024 * 1024
+# The budget always holds this many full-screen 32-bit layers (menu overlay, vignette, ...)
+FULL_SCREEN_LAYERS = 4
+
+
+class EffectCache:
+    """Effect surfaces keyed by (shape, size, colors, ...); each is drawn the first time it is asked for"""
+
+    def __init__(self, budget=CACHE_BUDGET):
+        self.budget = budget
+        self.surfaces = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, build):
+        """Cached surface for `key`, calling build() on a miss; blit it but never draw on it"""
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = build()
+        self.surfaces[key] = surface
+        self.bytes += surface.get_pitch() * surface.get_height()
+        # Keep the newest surface even if it alone is over budget
+        while self.bytes > self.budget and len(self.surfaces) > 1:
+            _, old = self.surfaces.popitem(last=False)
+            self.bytes -= old.get_pitch() * old.get_height()
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+        self.bytes = 0
+
+
+_effects = None
+
+
+def get_effects():
+    """Shared effect cache; create it after the display mode is set so the budget fits the screen"""
+    global _effects
+    if _effects is None:
+        budget = CACHE_BUDGET
+        screen = pygame.display.get_surface()
+        if screen is not None:
+            # At 4K one full-screen layer alone is about 33 MB
+            budget = max(budget, FULL_SCREEN_LAYERS * screen.get_width() * screen.get_height() * 4)
+        _effects = EffectCache(budget)
+    return _effects
+
+
+def rect_surface(size, color, width=0, border_radius=0):
+    """A (possibly translucent) rectangle, filled or outlined, on a transparent surface"""
+    size = (int(size[0]), int(size[1]))
+    color = tuple(color)
+
+    def build():
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.rect(surface, color, surface.get_rect(), width, border_radius=border_radius)
+        return surface
+
+    return get_effects().get(('rect', size, color, width, border_radius), build)
+
+
+def panel_surface(size, fill, outline=None, width=2, border_radius=0):
+    """Badge-style panel: a translucent fill with an optional solid outline"""
+    size = (int(size[0]), int(size[1]))
+    fill = tuple(fill)
+    outline = tuple(outline) if outline is not None else None
+
+    def build():
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.rect(surface, fill, surface.get_rect(), border_radius=border_radius)
+        if outline is not None:
+            pygame.draw.rect(surface, outline, surface.get_rect(), width, border_radius=border_radius)
+        return surface
+
+    return get_effects().get(('panel', size, fill, outline, width, border_radius), build)
+
+
+def circle_surface(radius, color):
+    """A (possibly translucent) disc on a transparent (2 * radius) square"""
+    color = tuple(color)
+
+    def build():
+        surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surface, color, (radius, radius), radius)
+        return surface
+
+    return get_effects().get(('circle', radius, color), build)
+
+
+def overlay_surface(size, color, alpha):
+    """Solid surface blended with a per-surface alpha; cheaper than per-pixel alpha for full-screen tints"""
+    size = (int(size[0]), int(size[1]))
+    color = tuple(color)
+
+    def build():
+        surface = pygame.Surface(size)
+        surface.fill(color)
+        surface.set_alpha(alpha)
+        return surface
+
+    return get_effects().get(('overlay', size, color, alpha), build)
@@ -1,5 +1,8 @@
 # game_select.py - Game selection screen
 import pygame
+from assets import CUSTOM_DIR, get_assets
+from effects import rect_surface
+from text_cache import render_text
 import os
 
 class GameSelect:
@@ -33,17 +36,14 @@ class GameSelect:
         
     def load_game_sprites(self):
         self.icon_size = 120
-        sprite_path = os.path.join(os.path.dirname(__file__), 'sprites', 'custom')
+        assets = get_assets()
         
         # Load RPS sprites
         self.rps_sprites = {}
         for name in ['rock_icon', 'paper_icon', 'scissors_icon']:
-            path = os.path.join(sprite_path, f'{name}.png')
-            if os.path.exists(path):
-                self.rps_sprites[name] = pygame.transform.scale(
-                    pygame.image.load(path).convert_alpha(),
-                    (self.icon_size, self.icon_size)
-                )
+            sprite = assets.image(os.path.join(CUSTOM_DIR, f'{name}.png'), (self.icon_size, self.icon_size))
+            if sprite:
+                self.rps_sprites[name] = sprite
             else:
                 # Create fallback
                 surf = pygame.Surface((self.icon_size, self.icon_size), pygame.SRCALPHA)
@@ -64,10 +64,8 @@ class GameSelect:
         # Draw title        
         COLOR_TEXT = (241, 245, 249)
         COLOR_TEXT_DIM = (148, 163, 184)
-        title_font = pygame.font.Font(None, 96)
-        title_font_small = pygame.font.Font(None, 46)
-        title_shadow = title_font.render("Select a Game", True, COLOR_TEXT_DIM)
-        title = title_font.render("Select a Game", True, COLOR_TEXT)
+        title_shadow = render_text("Select a Game", 96, COLOR_TEXT_DIM)
+        title = render_text("Select a Game", 96, COLOR_TEXT)
         title_rect = title.get_rect(center=(self.WINDOW_WIDTH // 2, 100))
         title_shadow_rect = title_rect.copy()
         title_shadow_rect.x += 4
@@ -82,8 +80,8 @@ class GameSelect:
             pygame.draw.rect(self.screen, (41, 128, 185), box, border_radius=30, width=3)
             
             # Title
-            title_shadow = title_font_small.render(title, True, COLOR_TEXT_DIM)
-            title = title_font_small.render(title, True, COLOR_TEXT)
+            title_shadow = render_text(title, 46, COLOR_TEXT_DIM)
+            title = render_text(title, 46, COLOR_TEXT)
             title_rect = title.get_rect(centerx=box.centerx, top=box.top + 30)
             title_shadow_rect = title_rect.copy()
             title_shadow_rect.x += 4
@@ -133,13 +131,10 @@ class GameSelect:
             # Hover effect
             mouse_pos = pygame.mouse.get_pos()
             if box.collidepoint(mouse_pos):
-                glow = pygame.Surface((box.width, box.height), pygame.SRCALPHA)
-                pygame.draw.rect(glow, (41, 128, 185, 50), glow.get_rect(), border_radius=30)
-                self.screen.blit(glow, box)
+                self.screen.blit(rect_surface(box.size, (41, 128, 185, 50), border_radius=30), box)
         
         # Draw instructions
-        font = pygame.font.Font(None, 32)
-        inst_text = font.render("Click or make 'O' gesture to select", True, (255, 255, 255))
+        inst_text = render_text("Click or make 'O' gesture to select", 32, (255, 255, 255))
         inst_rect = inst_text.get_rect(center=(self.WINDOW_WIDTH // 2, self.WINDOW_HEIGHT - 50))
         self.screen.blit(inst_text, inst_rect)
     
@@ -14,7 +14,16 @@ sys.path.insert(0, module_dir2)
 
 from gestures_ui import (cleanup_hand_tracking, get_current_gesture, 
                       get_hand_position, setup_hand_tracking, 
-                      update_hand_tracking, draw_hand_indicator)
+                      update_hand_tracking, draw_hand_indicator,
+                      set_hand_tracking_fidelity)
+from profiler import get_profiler
+from assets import get_assets
+from compositor import Compositor
+from effects import circle_surface, overlay_surface
+from scheduler import FIDELITY_NONE, FIDELITY_TRACKING
+from spritesheet import get_nine_slice
+from text_cache import render_text
+from vision import GAME_CONFIG, get_vision_service
 
 # Import game windows
 from ttt_game import TicTacToeGame
@@ -40,17 +49,19 @@ class Particle:
         self.life -= 1
         self.size = max(0, self.size - 0.05)
 
-    def draw(self, surface):
+    def draw(self, surface, color=None):
+        """Draw in `color` if given, else the particle's own; returns the area drawn"""
         if self.size > 0:
-            pygame.draw.rect(surface, self.color, (self.x, self.y, self.size, self.size))
+            return pygame.draw.rect(surface, color or self.color, (self.x, self.y, self.size, self.size))
+        return None
 
 class MainMenu:
     current_background = None
 
     def add_shadow(self, text, x, y):
         shadow_offset = 5
-        title_shadow = self.font.render(text, True, self.BLACK)
-        title_text = self.font.render(text, True, self.WHITE)
+        title_shadow = render_text(text, self.font_size, self.BLACK)
+        title_text = render_text(text, self.font_size, self.WHITE)
 
         title_rect = title_text.get_rect(center=(x, y))
         shadow_rect = title_rect.copy()
@@ -71,8 +82,9 @@ class MainMenu:
         self.background = self.load_random_background()
         MainMenu.current_background = self.background
         
-        # Initialize hand tracking
-        setup_hand_tracking(self)
+        # Initialize hand tracking and warm up the model the games use
+        setup_hand_tracking(self, render_text=render_text, glow_surface=circle_surface)
+        get_vision_service().preload(**GAME_CONFIG)
         
         # Background grid
         self.grid_size = 40
@@ -92,8 +104,6 @@ class MainMenu:
         # Fonts
         self.font_size = 128
         self.button_font_size = 75
-        self.font = pygame.font.Font(None, self.font_size)
-        self.button_font = pygame.font.Font(None, self.button_font_size)
         
         # Button dimensions
         self.button_width = 450
@@ -132,6 +142,12 @@ class MainMenu:
             }
         ]
         
+        # Menu dimming overlay, built once
+        self.overlay = overlay_surface((self.WINDOW_WIDTH, self.WINDOW_HEIGHT), self.BACKGROUND, 100)
+        
+        # Static screens are cached and only their moving parts are pushed to the display
+        self.compositor = Compositor(self.screen)
+        
         # Click detection
         self.last_click_time = 0
         self.click_cooldown = 500
@@ -193,40 +209,59 @@ class MainMenu:
         pygame.draw.rect(self.screen, self.BLUE, (x + 25, y + 60, 10, 20))
 
     def draw_button(self, button, hover=False):
-        color = self.DARK_BLUE if hover else self.BLUE
-        self.draw_pixelated_rect(self.screen, color, button['rect'])
+        # UI pack panel stretched to the button, scaled up so its pixels match the backgrounds
+        panel = get_nine_slice('blue_pressed' if hover else 'blue', scale=3)
+        if panel:
+            self.screen.blit(panel.render(button['rect'].size), button['rect'])
+        else:
+            color = self.DARK_BLUE if hover else self.BLUE
+            self.draw_pixelated_rect(self.screen, color, button['rect'])
 
-        shadow_text = self.button_font.render(button['text'], True, self.BLACK)
-        text_surface = self.button_font.render(button['text'], True, self.WHITE)
+        shadow_text = render_text(button['text'], self.button_font_size, self.BLACK)
+        text_surface = render_text(button['text'], self.button_font_size, self.WHITE)
         shadow_rect = shadow_text.get_rect(center=(button['rect'].centerx + 4, button['rect'].centery + 4))
         text_rect = text_surface.get_rect(center=button['rect'].center)
         self.screen.blit(shadow_text, shadow_rect)
         self.screen.blit(text_surface, text_rect)
 
+    def draw_menu_title(self):
+        # Title with shadow
+        self.add_shadow("Gesture Games", self.WINDOW_WIDTH // 2, 100)
+        
+        self.draw_mascot(self.WINDOW_WIDTH // 2 - 30, 150)
+    
+    def draw_menu_backdrop(self):
+        """Static layers of the menu over a background image"""
+        self.screen.blit(self.background, (0, 0))
+        self.screen.blit(self.overlay, (0, 0))
+        self.draw_menu_title()
+    
+    def dimmed(self, color):
+        """A color as it looks under the menu overlay"""
+        alpha = self.overlay.get_alpha()
+        return tuple((b * alpha + c * (255 - alpha)) // 255 for b, c in zip(self.BACKGROUND, color))
+    
     def draw_main_menu(self, mouse_pos):
         if self.background:
-            self.screen.blit(self.background, (0, 0))
+            self.compositor.begin("main_menu", [self.draw_menu_backdrop])
+            # Particles sit under the overlay, so draw them pre-dimmed on top of the cached backdrop
+            for particle in self.particles:
+                self.compositor.mark(particle.draw(self.screen, self.dimmed(particle.color)))
         else:
+            # The animated grid changes every frame; nothing is reusable
+            self.compositor.invalidate()
             self.screen.fill(self.BACKGROUND)
             self.draw_background()
-        
-        for particle in self.particles:
-            particle.draw(self.screen)
-        
-        overlay = pygame.Surface((self.WINDOW_WIDTH, self.WINDOW_HEIGHT))
-        overlay.fill(self.BACKGROUND)
-        overlay.set_alpha(100)
-        self.screen.blit(overlay, (0, 0))
-        
-        # Title with shadow
-        self.add_shadow("Gesture Games", self.WINDOW_WIDTH // 2, 100)
-        
-        self.draw_mascot(self.WINDOW_WIDTH // 2 - 30, 150)
+            for particle in self.particles:
+                particle.draw(self.screen)
+            self.screen.blit(self.overlay, (0, 0))
+            self.draw_menu_title()
         
         # Draw buttons
         for button in self.buttons:
             hover = button['rect'].collidepoint(mouse_pos)
             self.draw_button(button, hover)
+            self.compositor.mark(button['rect'])
             
             if hover and random.random() < 0.1:
                 self.particles.append(Particle(
@@ -235,8 +270,8 @@ class MainMenu:
                 ))
 
     def load_random_background(self):
-        background_path = os.path.join(os.path.dirname(__file__), 'backgrounds', 
-                                      'craftpix-net-823949-free-nature-backgrounds-pixel-art')
+        background_dir = os.path.join('backgrounds', 'craftpix-net-823949-free-nature-backgrounds-pixel-art')
+        background_path = os.path.join(os.path.dirname(__file__), background_dir)
         
         if os.path.exists(background_path):
             nature_folders = [f for f in os.listdir(background_path) 
@@ -249,12 +284,17 @@ class MainMenu:
                 background_files = [f for f in os.listdir(folder_path) if f.endswith('.png')]
                 
                 if background_files:
-                    bg_path = os.path.join(folder_path, background_files[0])
-                    background = pygame.image.load(bg_path)
-                    return pygame.transform.scale(background, (self.WINDOW_WIDTH, self.WINDOW_HEIGHT))
+                    bg_path = os.path.join(background_dir, chosen_folder, background_files[0])
+                    return get_assets().image(bg_path, (self.WINDOW_WIDTH, self.WINDOW_HEIGHT), alpha=False)
         
         return None
 
+    def dump_profile(self):
+        """Write the frame timings out if anything was recorded"""
+        paths = get_profiler().dump()
+        if paths:
+            print(f"Frame profile written to {paths[0]} and {paths[1]}")
+
     def run(self):
         clock = pygame.time.Clock()
         current_screen = "main_menu"
@@ -264,8 +304,12 @@ class MainMenu:
         game_window = None
         rules_page = None
         credits_page = None
+        # F3 toggles the timing overlay
+        profiler = get_profiler()
         
         while True:
+            profiler.frame()
+            started = profiler.start()
             update_hand_tracking(self)
             hand_pos = get_hand_position(self)
             mouse_pos = hand_pos if hand_pos else pygame.mouse.get_pos()
@@ -324,12 +368,14 @@ class MainMenu:
                                 game_window = RockPaperScissorsGame(self.screen, difficulty)
                             current_screen = "game"
                             difficulty_select = None
+                            set_hand_tracking_fidelity(self, FIDELITY_NONE)
             
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     if game_window:
                         game_window.cleanup()
                     cleanup_hand_tracking(self)
+                    self.dump_profile()
                     pygame.quit()
                     sys.exit()
                 
@@ -387,6 +433,7 @@ class MainMenu:
                                     game_window = RockPaperScissorsGame(self.screen, difficulty)
                                 current_screen = "game"
                                 difficulty_select = None
+                                set_hand_tracking_fidelity(self, FIDELITY_NONE)
                         
                         elif current_screen == "game" and game_window:
                             if hasattr(game_window, 'handle_click'):
@@ -399,8 +446,9 @@ class MainMenu:
                                 game_window.cleanup()
                                 game_window = None
                             current_screen = "main_menu"
-                            setup_hand_tracking(self)
+                            set_hand_tracking_fidelity(self, FIDELITY_TRACKING)
                         elif current_screen == "main_menu":
+                            self.dump_profile()
                             exit()
                         elif current_screen in ["difficulty_select", "game_select", "rules", "credits"]:
                             current_screen = "main_menu"
@@ -409,31 +457,48 @@ class MainMenu:
                             rules_page = None
                             credits_page = None
                     
+                    if event.key == pygame.K_F3:
+                        profiler.toggle_overlay()
+                    
                     # Pass other key events to game windows
                     if current_screen == "game" and game_window:
                         if hasattr(game_window, 'handle_event'):
                             game_window.handle_event(event)
             
+            profiler.stop("input", started)
+            
+            started = profiler.start()
             self.update_particles()
-            self.screen.fill(self.BACKGROUND)
+            compositor = self.compositor
             
             if current_screen == "main_menu":
                 self.draw_main_menu(mouse_pos)
-            elif current_screen == "game_select":
-                game_select.draw()
-            elif current_screen == "difficulty_select":
-                difficulty_select.draw()
             elif current_screen == "rules":
-                rules_page.draw()
+                # Nothing on the rules page moves
+                compositor.begin(rules_page, [rules_page.draw])
             elif current_screen == "credits":
-                credits_page.draw()
-            elif current_screen == "game":
-                if game_window:
-                    game_window.draw()
+                compositor.begin(credits_page, [credits_page.draw_static])
+                for area in credits_page.draw_animated():
+                    compositor.mark(area)
+            else:
+                # Selection screens and games redraw everything (the games show the live camera)
+                compositor.invalidate()
+                self.screen.fill(self.BACKGROUND)
+                if current_screen == "game_select":
+                    game_select.draw()
+                elif current_screen == "difficulty_select":
+                    difficulty_select.draw()
+                elif current_screen == "game":
+                    if game_window:
+                        game_window.draw()
 
-            draw_hand_indicator(self)
+            compositor.mark(draw_hand_indicator(self))
+            profiler.stop("draw", started)
+            compositor.mark(profiler.draw_overlay(self.screen))
             
-            pygame.display.flip()
+            started = profiler.start()
+            compositor.present()
+            profiler.stop("flip", started)
             clock.tick(60)
 
 if __name__ == "__main__":
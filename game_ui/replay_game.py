@@ -0,0 +1,121 @@
+# replay_game.py - Play a recorded session through a game window, headless and repeatable
+#
+#   python game_ui/replay_game.py sessions/run1 --game ttt --difficulty medium
+#
+# Frames go through the game one at a time (lockstep replay), the game clock advances a fixed
+# step per frame and the AI is seeded, so the same session gives the same game every run.
+import argparse
+import os
+import sys
+import tempfile
+from collections import Counter
+from concurrent.futures import wait
+
+module_dir1 = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'gesturedetectTT'))
+module_dir2 = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'gemini_enemy'))
+
+sys.path.insert(0, module_dir1)
+sys.path.insert(0, module_dir2)
+
+# Seconds without a new frame before the run is treated as stuck
+STALL_TIMEOUT = 10.0
+
+
+class FrameClock:
+    """Stands in for pygame.time.get_ticks; moves only when the runner steps it"""
+
+    def __init__(self, fps):
+        self.step = 1000.0 / fps
+        self.frames = 0
+
+    def advance(self):
+        self.frames += 1
+
+    def __call__(self):
+        return int(self.frames * self.step)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a recorded gesture session through a game")
+    parser.add_argument("session", help="directory written by GESTURE_RECORD")
+    parser.add_argument("--game", choices=("ttt", "rps"), default="ttt")
+    parser.add_argument("--difficulty", choices=("easy", "medium", "hard"), default="medium")
+    parser.add_argument("--board-size", type=int, choices=(3, 4, 5), default=3)
+    parser.add_argument("--fps", type=float, default=30.0, help="game clock step per replayed frame")
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    # Everything below reads these at import time
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ["GESTURE_REPLAY"] = args.session
+    os.environ["GESTURE_REPLAY_REALTIME"] = "0"
+    # A fresh store so what earlier games taught the RPS opponent does not leak in
+    memory_dir = tempfile.TemporaryDirectory()
+    os.environ["GESTURE_MEMORY_DB"] = os.path.join(memory_dir.name, 'memory.db')
+
+    import random
+
+    import numpy as np
+    import pygame
+
+    random.seed(args.seed)
+    np.random.seed(args.seed)
+
+    pygame.init()
+    screen = pygame.display.set_mode((1280, 720))
+    clock = FrameClock(args.fps)
+    pygame.time.get_ticks = clock
+
+    from vision import get_vision_service
+    if args.game == "ttt":
+        from ttt_game import TicTacToeGame
+        game = TicTacToeGame(screen, args.difficulty, args.board_size)
+    else:
+        from rps_game import RockPaperScissorsGame
+        game = RockPaperScissorsGame(screen, args.difficulty)
+    service = get_vision_service()
+
+    gestures = Counter()
+    last_id = 0
+    stalled = False
+    try:
+        while not service.replay_finished():
+            state = service.wait_for_result(last_id, timeout=STALL_TIMEOUT)
+            if state is None:
+                if service.replay_finished():
+                    break
+                stalled = True
+                print(f"Replay stalled after frame {last_id}")
+                break
+            last_id = state.frame_id
+            gestures[state.gesture or "none"] += 1
+
+            # Let a background AI search finish so when its move lands never depends on speed
+            pending = getattr(game, 'pending_ai_move', None)
+            if pending is not None:
+                wait([pending])
+            pygame.event.pump()
+            game.draw()
+            clock.advance()
+    finally:
+        game.cleanup()
+        pygame.quit()
+        memory_dir.cleanup()
+
+    print(f"frames: {clock.frames}")
+    print("gestures: " + ", ".join(f"{name}={count}" for name, count in sorted(gestures.items())))
+    if args.game == "ttt":
+        for row in game.board.board:
+            print(" ".join(cell if cell != ' ' else '.' for cell in row))
+        print(f"game over: {game.board.game_over}, winner: {game.board.win_check() or 'none'}")
+    else:
+        print(f"score: {game.game.player_score} - {game.game.computer_score}, phase: {game.phase}")
+    return 1 if stalled else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,16 @@
 # rps_game.py - Rock Paper Scissors game window
 import pygame
-import cv2
 import os
-import mediapipe as mp
+from memory_store import get_memory_store
 from rpsai import RPS
+from assets import CUSTOM_DIR, get_assets
+from camera_preview import CameraPreview
+from profiler import get_profiler
+from spritesheet import NineSlice
+from effects import panel_surface, rect_surface
+from text_cache import render_text
+from scheduler import FIDELITY_NONE, FIDELITY_PRESENCE, FIDELITY_TRACKING
+from vision import GAME_CONFIG, get_vision_service
 
 class RockPaperScissorsGame:
     def __init__(self, screen, difficulty):
@@ -13,7 +20,8 @@ class RockPaperScissorsGame:
         self.WINDOW_HEIGHT = pygame.display.Info().current_h
         
         # Initialize game
-        self.game = RPS()
+        self.memory = get_memory_store()
+        self.game = RPS(difficulty, self.memory)
         
         # Game state phases
         self.PHASE_COUNTDOWN = "countdown"
@@ -33,24 +41,14 @@ class RockPaperScissorsGame:
         
         # Load sprites
         self.rps_sprites = self.load_rps_sprites()
+        self.card_panels = {}
         
-        # Initialize camera
-        self.cap = cv2.VideoCapture(0)
-        if not self.cap.isOpened():
-            print("Error: Could not open camera")
-            
-        # Initialize MediaPipe
-        self.hand_model = mp.solutions.hands.Hands(
-            model_complexity=0,
-            min_detection_confidence=0.6,
-            min_tracking_confidence=0.6,
-            static_image_mode=False
-        )
-        self.drawer = mp.solutions.drawing_utils
+        # Subscribe to the shared camera and hand model
+        self.vision = get_vision_service().subscribe("rps", **GAME_CONFIG)
+        self.preview = CameraPreview((0, 0, self.WINDOW_WIDTH // 2, self.WINDOW_HEIGHT))
         
         # Import gesture detection
-        from gestures import get_hand_landmarks, rock, paper, scissors
-        self.get_hand_landmarks = get_hand_landmarks
+        from gestures import rock, paper, scissors
         self.rock = rock
         self.paper = paper
         self.scissors = scissors
@@ -67,16 +65,13 @@ class RockPaperScissorsGame:
     
     def load_rps_sprites(self):
         sprites = {}
-        sprite_path = os.path.join(os.path.dirname(__file__), 'sprites', 'custom')
+        assets = get_assets()
         
         # Load RPS icons
         for name in ['rock', 'paper', 'scissors']:
-            path = os.path.join(sprite_path, f'{name}_icon.png')
-            if os.path.exists(path):
-                sprites[name] = pygame.transform.scale(
-                    pygame.image.load(path).convert_alpha(),
-                    (220, 220)
-                )
+            sprite = assets.image(os.path.join(CUSTOM_DIR, f'{name}_icon.png'), (220, 220))
+            if sprite:
+                sprites[name] = sprite
             else:
                 # Create prettier fallback sprites
                 surf = pygame.Surface((220, 220), pygame.SRCALPHA)
@@ -98,15 +93,13 @@ class RockPaperScissorsGame:
                 pygame.draw.circle(surf, (255, 255, 255, 60), (95, 95), 30)
                 
                 # Draw symbol - use ASCII fallback instead of emoji
-                font = pygame.font.Font(None, 80)
                 symbols = {'rock': 'R', 'paper': 'P', 'scissors': 'S'}
-                text = font.render(symbols[name], True, (255, 255, 255))
+                text = render_text(symbols[name], 80, (255, 255, 255))
                 surf.blit(text, text.get_rect(center=(110, 110)))
                 
                 sprites[name] = surf
         
         # Create countdown sprites with animations
-        font = pygame.font.Font(None, 200)
         for i in range(1, 4):
             surf = pygame.Surface((250, 250), pygame.SRCALPHA)
             
@@ -116,10 +109,10 @@ class RockPaperScissorsGame:
             
             # Number with shadow
             num_text = str(4-i)
-            shadow = font.render(num_text, True, (0, 0, 0, 100))
+            shadow = render_text(num_text, 200, (0, 0, 0, 100))
             surf.blit(shadow, shadow.get_rect(center=(128, 128)))
             
-            text = font.render(num_text, True, (255, 255, 255))
+            text = render_text(num_text, 200, (255, 255, 255))
             surf.blit(text, text.get_rect(center=(125, 125)))
             
             sprites[f'countdown_{i}'] = surf
@@ -135,11 +128,10 @@ class RockPaperScissorsGame:
         pygame.draw.circle(go_surf, (239, 68, 68), (140, 140), 100)
         pygame.draw.circle(go_surf, (255, 255, 255), (140, 140), 100, 6)
         
-        go_font = pygame.font.Font(None, 140)
-        shadow = go_font.render("GO!", True, (0, 0, 0, 150))
+        shadow = render_text("GO!", 140, (0, 0, 0, 150))
         go_surf.blit(shadow, shadow.get_rect(center=(143, 143)))
         
-        go_text = go_font.render("GO!", True, (255, 255, 255))
+        go_text = render_text("GO!", 140, (255, 255, 255))
         go_surf.blit(go_text, go_text.get_rect(center=(140, 140)))
         
         sprites['go'] = go_surf
@@ -155,6 +147,14 @@ class RockPaperScissorsGame:
         self.current_held_gesture = None
         self.gesture_hold_start = None
     
+    def required_fidelity(self):
+        """How much hand input the current phase needs"""
+        if self.phase == self.PHASE_CAPTURE:
+            return FIDELITY_TRACKING
+        if self.phase == self.PHASE_COUNTDOWN:
+            return FIDELITY_PRESENCE
+        return FIDELITY_NONE
+    
     def detect_rps_gesture(self, landmarks):
         """Detect rock, paper, or scissors gesture"""
         if self.rock(landmarks):
@@ -224,46 +224,27 @@ class RockPaperScissorsGame:
         
         # Draw camera feed and detect gestures
         detected_gesture = None
-        if self.cap and self.cap.isOpened():
-            ret, frame = self.cap.read()
-            if ret:
-                frame = cv2.flip(frame, 1)
-                h, w, _ = frame.shape
-                size = min(h, w)
-                frame_square = frame[0:size, 0:size]
-                rgb_frame = cv2.cvtColor(frame_square, cv2.COLOR_BGR2RGB)
-                
-                # Process hands
-                hand_results = self.hand_model.process(rgb_frame)
-                
-                if hand_results.multi_hand_landmarks:
-                    for hand in hand_results.multi_hand_landmarks:
-                        # Draw landmarks with custom colors
-                        self.drawer.draw_landmarks(
-                            frame_square, 
-                            hand, 
-                            mp.solutions.hands.HAND_CONNECTIONS,
-                            self.drawer.DrawingSpec(color=(99, 102, 241), thickness=2, circle_radius=4),
-                            self.drawer.DrawingSpec(color=(241, 245, 249), thickness=2)
-                        )
-                        landmarks = self.get_hand_landmarks(hand)
-                        detected_gesture = self.detect_rps_gesture(landmarks)
-                
-                # Display camera with rounded corners effect
-                frame_surface = pygame.surfarray.make_surface(
-                    cv2.cvtColor(frame_square, cv2.COLOR_BGR2RGB).swapaxes(0,1)
-                )
-                scaled_frame = pygame.transform.scale(
-                    frame_surface, 
-                    (self.WINDOW_WIDTH // 2, self.WINDOW_HEIGHT)
-                )
-                self.screen.blit(scaled_frame, (0, 0))
-                
-                # Add vignette effect to camera
-                vignette = pygame.Surface((self.WINDOW_WIDTH // 2, self.WINDOW_HEIGHT), pygame.SRCALPHA)
-                pygame.draw.rect(vignette, (0, 0, 0, 60), vignette.get_rect(), 40)
-                self.screen.blit(vignette, (0, 0))
-        
+        profiler = get_profiler()
+        self.vision.set_fidelity(self.required_fidelity())
+        state = self.vision.read()
+        if state is not None:
+            # Display camera
+            started = profiler.start()
+            self.preview.update(state)
+            self.preview.draw(self.screen)
+            profiler.stop("rps.preview", started)
+            
+            if state.square_landmarks is not None:
+                # Draw landmarks with custom colors
+                started = profiler.start()
+                self.preview.draw_landmarks(self.screen, state.square_landmarks)
+                profiler.stop("rps.landmarks", started)
+                detected_gesture = self.detect_rps_gesture(state.square_landmarks)
+            
+            # Add vignette effect to camera
+            vignette = rect_surface((self.WINDOW_WIDTH // 2, self.WINDOW_HEIGHT), (0, 0, 0, 60), 40)
+            self.screen.blit(vignette, (0, 0))
+    
         # Draw elegant dividing line
         line_x = self.WINDOW_WIDTH // 2
         pygame.draw.line(self.screen, self.COLOR_DIVIDER, (line_x, 0), (line_x, self.WINDOW_HEIGHT), 4)
@@ -271,10 +252,7 @@ class RockPaperScissorsGame:
         # Add subtle glow to divider
         for i in range(1, 4):
             alpha = 20 - (i * 5)
-            color_with_alpha = (self.COLOR_ACCENT[0], self.COLOR_ACCENT[1], self.COLOR_ACCENT[2], alpha)
-            # Create a surface for alpha blending
-            glow_surf = pygame.Surface((1, self.WINDOW_HEIGHT), pygame.SRCALPHA)
-            glow_surf.fill(color_with_alpha)
+            glow_surf = rect_surface((1, self.WINDOW_HEIGHT), (*self.COLOR_ACCENT, alpha))
             self.screen.blit(glow_surf, (line_x - i, 0))
             self.screen.blit(glow_surf, (line_x + i, 0))
         
@@ -283,26 +261,26 @@ class RockPaperScissorsGame:
         self.update_phase(current_time, detected_gesture)
         
         # Draw game area
+        started = profiler.start()
         self.draw_game_area(detected_gesture)
+        profiler.stop("rps.game_area", started)
     
     def draw_game_area(self, detected_gesture):
         right_center_x = self.WINDOW_WIDTH * 3 // 4
         center_y = self.WINDOW_HEIGHT // 2
         
         # Draw title with decorative elements
-        title_font = pygame.font.Font(None, 64)
-        title_text = title_font.render(f"Rock Paper Scissors", True, self.COLOR_TEXT)
+        title_text = render_text(f"Rock Paper Scissors", 64, self.COLOR_TEXT)
         title_rect = title_text.get_rect(center=(right_center_x, 70))
         self.screen.blit(title_text, title_rect)
         
         # Difficulty badge
-        diff_font = pygame.font.Font(None, 32)
-        diff_text = diff_font.render(self.difficulty.upper(), True, self.COLOR_ACCENT)
-        diff_bg = pygame.Surface((diff_text.get_width() + 30, 35), pygame.SRCALPHA)
-        pygame.draw.rect(diff_bg, (*self.COLOR_ACCENT, 40), diff_bg.get_rect(), border_radius=8)
-        pygame.draw.rect(diff_bg, self.COLOR_ACCENT, diff_bg.get_rect(), 2, border_radius=8)
-        diff_bg.blit(diff_text, (15, 5))
-        self.screen.blit(diff_bg, (right_center_x - diff_bg.get_width() // 2, 110))
+        diff_text = render_text(self.difficulty.upper(), 32, self.COLOR_ACCENT)
+        diff_bg = panel_surface((diff_text.get_width() + 30, 35), (*self.COLOR_ACCENT, 40), self.COLOR_ACCENT,
+                                border_radius=8)
+        diff_x = right_center_x - diff_bg.get_width() // 2
+        self.screen.blit(diff_bg, (diff_x, 110))
+        self.screen.blit(diff_text, (diff_x + 15, 115))
         
         if self.phase == self.PHASE_FINISHED:
             self.draw_game_over(right_center_x, center_y)
@@ -321,18 +299,15 @@ class RockPaperScissorsGame:
             sprite = self.rps_sprites[f'countdown_{self.countdown_value}']
             self.screen.blit(sprite, sprite.get_rect(center=(x, y)))
             
-            font = pygame.font.Font(None, 40)
-            text = font.render("Get ready with your gesture!", True, self.COLOR_TEXT_DIM)
+            text = render_text("Get ready with your gesture!", 40, self.COLOR_TEXT_DIM)
             self.screen.blit(text, text.get_rect(center=(x, y + 180)))
     
     def draw_capture_phase(self, x, y, detected_gesture):
         sprite = self.rps_sprites['go']
         self.screen.blit(sprite, sprite.get_rect(center=(x, y)))
         
-        font = pygame.font.Font(None, 44)
-        
         if self.captured_gesture:
-            text = font.render(f"Locked in: {self.captured_gesture.upper()}!", True, self.COLOR_ACCENT)
+            text = render_text(f"Locked in: {self.captured_gesture.upper()}!", 44, self.COLOR_ACCENT)
             self.screen.blit(text, text.get_rect(center=(x, y + 200)))
         elif detected_gesture and self.gesture_hold_start:
             # Show hold progress
@@ -361,11 +336,10 @@ class RockPaperScissorsGame:
                            (bar_x, bar_y, bar_width, bar_height), 3, border_radius=15)
             
             # Text above progress bar
-            text = font.render(f"Hold {detected_gesture.upper()}... {progress * 100:.0f}%", 
-                             True, self.COLOR_TEXT)
+            text = render_text(f"Hold {detected_gesture.upper()}... {progress * 100:.0f}%", 44, self.COLOR_TEXT)
             self.screen.blit(text, text.get_rect(center=(x, bar_y - 30)))
         else:
-            text = font.render("Show your move and HOLD for 4 seconds!", True, self.COLOR_TEXT)
+            text = render_text("Show your move and HOLD for 4 seconds!", 44, self.COLOR_TEXT)
             self.screen.blit(text, text.get_rect(center=(x, y + 200)))
     
     def draw_result_phase(self, x, y):
@@ -382,8 +356,7 @@ class RockPaperScissorsGame:
                               self.game.computer_choice, "Computer", False)
             
             # Draw VS text between cards
-            vs_font = pygame.font.Font(None, 72)
-            vs_text = vs_font.render("VS", True, self.COLOR_TEXT_DIM)
+            vs_text = render_text("VS", 72, self.COLOR_TEXT_DIM)
             self.screen.blit(vs_text, vs_text.get_rect(center=(x, y)))
             
             # Show result below
@@ -398,50 +371,45 @@ class RockPaperScissorsGame:
                 else:
                     result_color = self.COLOR_TIE
                 
-                result_font = pygame.font.Font(None, 52)
-                result_surface = result_font.render(result_text, True, result_color)
+                result_surface = render_text(result_text, 52, result_color)
                 
                 # Result background
-                result_bg = pygame.Surface((result_surface.get_width() + 40, 60), pygame.SRCALPHA)
-                pygame.draw.rect(result_bg, (*result_color, 30), result_bg.get_rect(), border_radius=12)
-                pygame.draw.rect(result_bg, result_color, result_bg.get_rect(), 3, border_radius=12)
-                result_bg.blit(result_surface, (20, 12))
-                
-                self.screen.blit(result_bg, result_bg.get_rect(center=(x, y + 200)))
+                result_bg = panel_surface((result_surface.get_width() + 40, 60), (*result_color, 30), result_color,
+                                          3, border_radius=12)
+                result_rect = self.screen.blit(result_bg, result_bg.get_rect(center=(x, y + 200)))
+                self.screen.blit(result_surface, (result_rect.x + 20, result_rect.y + 12))
+    
+    def card_panel(self, color):
+        """9-slice card frame in one color, drawn once and stretched to any card size"""
+        panel = self.card_panels.get(color)
+        if panel is None:
+            template = pygame.Surface((64, 64), pygame.SRCALPHA)
+            pygame.draw.rect(template, (30, 41, 59), template.get_rect(), border_radius=20)
+            pygame.draw.rect(template, color, template.get_rect(), 3, border_radius=20)
+            # The border band must hold the whole rounded corner
+            panel = NineSlice(template, border=24)
+            self.card_panels[color] = panel
+        return panel
     
     def draw_move_card(self, x, y, move, label, is_player):
         # Card background
         card_width, card_height = 240, 320
-        card = pygame.Surface((card_width, card_height), pygame.SRCALPHA)
-        
-        # Glow effect
+        card = pygame.Rect(0, 0, card_width, card_height)
+        card.center = (x, y)
         glow_color = self.COLOR_ACCENT if is_player else self.COLOR_LOSE
-        for i in range(10, 0, -2):
-            alpha = (10 - i) * 8
-            pygame.draw.rect(card, (*glow_color, alpha), 
-                           (i, i, card_width - 2*i, card_height - 2*i), 
-                           border_radius=20)
-        
-        # Main card
-        pygame.draw.rect(card, (30, 41, 59), (0, 0, card_width, card_height), border_radius=20)
-        pygame.draw.rect(card, glow_color, (0, 0, card_width, card_height), 3, border_radius=20)
+        self.screen.blit(self.card_panel(glow_color).render(card.size), card)
         
         # Label
-        label_font = pygame.font.Font(None, 36)
-        label_surface = label_font.render(label, True, self.COLOR_TEXT)
-        card.blit(label_surface, label_surface.get_rect(center=(card_width // 2, 30)))
+        label_surface = render_text(label, 36, self.COLOR_TEXT)
+        self.screen.blit(label_surface, label_surface.get_rect(center=(card.centerx, card.top + 30)))
         
         # Move sprite
         sprite = self.rps_sprites[move]
-        sprite_rect = sprite.get_rect(center=(card_width // 2, card_height // 2 + 10))
-        card.blit(sprite, sprite_rect)
+        self.screen.blit(sprite, sprite.get_rect(center=(card.centerx, card.centery + 10)))
         
         # Move name
-        name_font = pygame.font.Font(None, 32)
-        name_surface = name_font.render(move.upper(), True, glow_color)
-        card.blit(name_surface, name_surface.get_rect(center=(card_width // 2, card_height - 30)))
-        
-        self.screen.blit(card, card.get_rect(center=(x, y)))
+        name_surface = render_text(move.upper(), 32, glow_color)
+        self.screen.blit(name_surface, name_surface.get_rect(center=(card.centerx, card.bottom - 30)))
     
     def draw_game_over(self, x, y):
         # Determine winner
@@ -459,26 +427,21 @@ class RockPaperScissorsGame:
             color = self.COLOR_TIE
         
         # Large result text
-        result_font = pygame.font.Font(None, 120)
-        result_text = result_font.render(result, True, color)
+        result_text = render_text(result, 120, color)
         self.screen.blit(result_text, result_text.get_rect(center=(x, y - 60)))
         
         # Subtitle
-        subtitle_font = pygame.font.Font(None, 40)
-        subtitle_text = subtitle_font.render(subtitle, True, self.COLOR_TEXT_DIM)
+        subtitle_text = render_text(subtitle, 40, self.COLOR_TEXT_DIM)
         self.screen.blit(subtitle_text, subtitle_text.get_rect(center=(x, y + 20)))
         
         # Final score
-        score_font = pygame.font.Font(None, 48)
-        score_text = score_font.render(
-            f"Final Score: {self.game.player_score} - {self.game.computer_score}", 
-            True, self.COLOR_TEXT
+        score_text = render_text(
+            f"Final Score: {self.game.player_score} - {self.game.computer_score}", 48, self.COLOR_TEXT
         )
         self.screen.blit(score_text, score_text.get_rect(center=(x, y + 80)))
         
         # Return instruction
-        inst_font = pygame.font.Font(None, 36)
-        inst_text = inst_font.render("Press ESC to return to menu", True, self.COLOR_TEXT_DIM)
+        inst_text = render_text("Press ESC to return to menu", 36, self.COLOR_TEXT_DIM)
         self.screen.blit(inst_text, inst_text.get_rect(center=(x, y + 160)))
     
     def draw_score_bar(self, x):
@@ -486,29 +449,25 @@ class RockPaperScissorsGame:
         bar_y = self.WINDOW_HEIGHT - bar_height
         
         # Background
-        bar_bg = pygame.Surface((self.WINDOW_WIDTH // 2, bar_height), pygame.SRCALPHA)
-        pygame.draw.rect(bar_bg, (30, 41, 59, 200), bar_bg.get_rect())
-        pygame.draw.line(bar_bg, self.COLOR_DIVIDER, (0, 0), (self.WINDOW_WIDTH // 2, 0), 2)
+        bar_bg = rect_surface((self.WINDOW_WIDTH // 2, bar_height), (30, 41, 59, 200))
         self.screen.blit(bar_bg, (self.WINDOW_WIDTH // 2, bar_y))
+        pygame.draw.line(self.screen, self.COLOR_DIVIDER, (self.WINDOW_WIDTH // 2, bar_y),
+                         (self.WINDOW_WIDTH, bar_y), 2)
         
         # Round progress
-        round_font = pygame.font.Font(None, 36)
-        round_text = round_font.render(
-            f"Round {self.game.rounds_played}/{self.game.max_rounds}", 
-            True, self.COLOR_TEXT_DIM
+        round_text = render_text(
+            f"Round {self.game.rounds_played}/{self.game.max_rounds}", 36, self.COLOR_TEXT_DIM
         )
         self.screen.blit(round_text, round_text.get_rect(center=(x, bar_y + 25)))
         
         # Score
-        score_font = pygame.font.Font(None, 48)
         score_str = f"{self.game.player_score}  -  {self.game.computer_score}"
-        score_text = score_font.render(score_str, True, self.COLOR_TEXT)
+        score_text = render_text(score_str, 48, self.COLOR_TEXT)
         self.screen.blit(score_text, score_text.get_rect(center=(x, bar_y + 65)))
         
         # Player and Computer labels
-        label_font = pygame.font.Font(None, 28)
-        player_label = label_font.render("YOU", True, self.COLOR_ACCENT)
-        comp_label = label_font.render("CPU", True, self.COLOR_LOSE)
+        player_label = render_text("YOU", 28, self.COLOR_ACCENT)
+        comp_label = render_text("CPU", 28, self.COLOR_LOSE)
         
         self.screen.blit(player_label, player_label.get_rect(center=(x - 100, bar_y + 65)))
         self.screen.blit(comp_label, comp_label.get_rect(center=(x + 100, bar_y + 65)))
@@ -520,7 +479,6 @@ class RockPaperScissorsGame:
     
     def cleanup(self):
         """Clean up resources"""
-        if self.cap:
-            self.cap.release()
-        if hasattr(self, 'hand_model'):
-            self.hand_model.close()
\ No newline at end of file
+        if self.memory is not None:
+            self.memory.flush()
+        self.vision.release()
\ No newline at end of file
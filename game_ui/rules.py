@@ -1,5 +1,15 @@
 # rules.py - Rules and instructions page
+import os
 import pygame
+from assets import CUSTOM_DIR, get_assets
+from text_cache import render_text
+
+HAND_IMAGES = {
+    "Rock": "rock_hand.png",
+    "Paper": "paper_hand.png",
+    "Scissors": "scissors_hand.png",
+    "O-Sign": "o_hand.png",
+}
 
 class RulesPage:
     def __init__(self, screen):
@@ -16,10 +26,10 @@ class RulesPage:
         self.COLOR_HIGHLIGHT = (59, 130, 246)
         
         # Fonts
-        self.title_font = pygame.font.Font(None, 72)
-        self.heading_font = pygame.font.Font(None, 48)
-        self.body_font = pygame.font.Font(None, 32)
-        self.small_font = pygame.font.Font(None, 28)
+        self.title_size = 72
+        self.heading_size = 48
+        self.body_size = 32
+        self.small_size = 28
         
         # Back button
         self.back_button = pygame.Rect(50, 50, 150, 60)
@@ -32,7 +42,7 @@ class RulesPage:
         pygame.draw.rect(self.screen, self.COLOR_ACCENT, card_rect, 3, border_radius=15)
         
         # Title
-        title_surface = self.heading_font.render(title, True, self.COLOR_ACCENT)
+        title_surface = render_text(title, self.heading_size, self.COLOR_ACCENT)
         self.screen.blit(title_surface, (x + 30, y + 20))
         
         # Content lines
@@ -42,7 +52,7 @@ class RulesPage:
             pygame.draw.circle(self.screen, self.COLOR_HIGHLIGHT, (x + 40, y_offset + 12), 5)
             
             # Text
-            text_surface = self.body_font.render(line, True, self.COLOR_TEXT)
+            text_surface = render_text(line, self.body_size, self.COLOR_TEXT)
             self.screen.blit(text_surface, (x + 60, y_offset))
             y_offset += 45
     
@@ -68,24 +78,10 @@ class RulesPage:
             pygame.draw.rect(self.screen, self.COLOR_CARD_BG, card_rect, border_radius=12)
             pygame.draw.rect(self.screen, self.COLOR_HIGHLIGHT, card_rect, 2, border_radius=12)
             
-            # Placeholder for gesture icon (large circle)
-            # add images from game_ui/sprites/custom/o_hand.png inside the circle
-            if name == "O-Sign":
-                o_hand = pygame.image.load("game_ui/sprites/custom/o_hand.png")
-                o_hand = pygame.transform.scale(o_hand, (80, 80))
-                self.screen.blit(o_hand, (card_x + card_width // 2 - 42, card_y + 32))
-            elif name == "Rock":
-                rock_hand = pygame.image.load("game_ui/sprites/custom/rock_hand.png")
-                rock_hand = pygame.transform.scale(rock_hand, (80, 80))
-                self.screen.blit(rock_hand, (card_x + card_width // 2 - 42, card_y + 32))
-            elif name == "Paper":
-                paper_hand = pygame.image.load("game_ui/sprites/custom/paper_hand.png")
-                paper_hand = pygame.transform.scale(paper_hand, (80, 80))
-                self.screen.blit(paper_hand, (card_x + card_width // 2 - 42, card_y + 32))
-            elif name == "Scissors":
-                scissors_hand = pygame.image.load("game_ui/sprites/custom/scissors_hand.png")
-                scissors_hand = pygame.transform.scale(scissors_hand, (80, 80))
-                self.screen.blit(scissors_hand, (card_x + card_width // 2 - 42, card_y + 32))
+            # Gesture icon inside the circle; loaded and scaled once by the asset manager
+            hand = get_assets().image(os.path.join(CUSTOM_DIR, HAND_IMAGES[name]), (80, 80))
+            if hand:
+                self.screen.blit(hand, (card_x + card_width // 2 - 42, card_y + 32))
 
 
             center_x = card_x + card_width // 2
@@ -93,12 +89,12 @@ class RulesPage:
             pygame.draw.circle(self.screen, self.COLOR_ACCENT, (center_x, center_y), 40, 3)
             
             # Name
-            name_surface = self.heading_font.render(name, True, self.COLOR_ACCENT)
+            name_surface = render_text(name, self.heading_size, self.COLOR_ACCENT)
             name_rect = name_surface.get_rect(center=(center_x, card_y + 135))
             self.screen.blit(name_surface, name_rect)
             
             # Description
-            desc_surface = self.small_font.render(desc, True, self.COLOR_TEXT_DIM)
+            desc_surface = render_text(desc, self.small_size, self.COLOR_TEXT_DIM)
             desc_rect = desc_surface.get_rect(center=(center_x, card_y + 170))
             self.screen.blit(desc_surface, desc_rect)
     
@@ -106,8 +102,8 @@ class RulesPage:
         self.screen.fill(self.COLOR_BG)
         
         # Title + shadow
-        title_shadow = self.title_font.render("How to Play", True, self.COLOR_TEXT_DIM)
-        title = self.title_font.render("How to Play", True, self.COLOR_TEXT)
+        title_shadow = render_text("How to Play", self.title_size, self.COLOR_TEXT_DIM)
+        title = render_text("How to Play", self.title_size, self.COLOR_TEXT)
         title_rect = title.get_rect(center=(self.WINDOW_WIDTH // 2, 80))
         title_shadow_rect = title_rect.copy()
         title_shadow_rect.x += 4
@@ -118,7 +114,7 @@ class RulesPage:
         # Back button
         pygame.draw.rect(self.screen, self.COLOR_CARD_BG, self.back_button, border_radius=10)
         pygame.draw.rect(self.screen, self.COLOR_ACCENT, self.back_button, 2, border_radius=10)
-        back_text = self.body_font.render("Back", True, self.COLOR_TEXT)
+        back_text = render_text("Back", self.body_size, self.COLOR_TEXT)
         back_rect = back_text.get_rect(center=self.back_button.center)
         self.screen.blit(back_text, back_rect)
         
@@ -151,8 +147,8 @@ class RulesPage:
         
         # Gesture Guide Section (same si)
         gesture_y = content_y + 320
-        gesture_shadow = self.title_font.render("Hand Gestures", True, self.COLOR_TEXT_DIM)
-        gesture = self.title_font.render("Hand Gestures", True, self.COLOR_TEXT)
+        gesture_shadow = render_text("Hand Gestures", self.title_size, self.COLOR_TEXT_DIM)
+        gesture = render_text("Hand Gestures", self.title_size, self.COLOR_TEXT)
         gesture_rect = gesture.get_rect(center=(self.WINDOW_WIDTH // 2, gesture_y))
         gesture_shadow_rect = gesture_rect.copy()
         gesture_shadow_rect.x += 4
@@ -0,0 +1,157 @@
+# spritesheet.py - Slice the UI pack sheet into tiles and build 9-slice panels from them, cached per size
+import os
+import re
+from collections import OrderedDict
+
+import pygame
+
+from assets import asset_path, get_assets
+
+SHEET_DIR = os.path.join('sprites', 'Spritesheet')
+SHEET_IMAGE = os.path.join(SHEET_DIR, 'UIpackSheet_transparent.png')
+SHEET_INFO = os.path.join(SHEET_DIR, 'spritesheetInfo.txt')
+# Top-left tile of each 3x3 panel on the sheet (the same art as sprites/9-Slice/Colored)
+SHEET_PANELS = {
+    'grey': (0, 2), 'grey_pressed': (0, 5),
+    'yellow': (6, 2), 'yellow_pressed': (6, 5),
+    'green': (12, 2), 'green_pressed': (12, 5),
+    'red': (18, 2), 'red_pressed': (18, 5),
+    'blue': (24, 2), 'blue_pressed': (24, 5),
+}
+# Scaled panels kept per NineSlice before the least recently used size goes
+PANEL_CACHE_SIZE = 32
+
+
+def parse_sheet_info(path):
+    """(tile_width, tile_height, margin) from a spritesheetInfo.txt"""
+    with open(path) as f:
+        text = f.read()
+    size = re.search(r'TILE SIZE:\s*(\d+)\s*x\s*(\d+)', text)
+    margin = re.search(r'MARGIN:\s*(\d+)', text)
+    if size is None:
+        raise ValueError(f"{path} has no TILE SIZE line")
+    return int(size.group(1)), int(size.group(2)), int(margin.group(1)) if margin else 0
+
+
+class SpriteSheet:
+    """A grid of equally sized tiles separated by a margin; tiles are subsurfaces of the sheet"""
+
+    def __init__(self, image_path=SHEET_IMAGE, info_path=SHEET_INFO):
+        self.tile_width, self.tile_height, self.margin = parse_sheet_info(asset_path(info_path))
+        self.surface = get_assets().load(image_path)
+        if self.surface is None:
+            raise FileNotFoundError(asset_path(image_path))
+        width, height = self.surface.get_size()
+        self.columns = (width + self.margin) // (self.tile_width + self.margin)
+        self.rows = (height + self.margin) // (self.tile_height + self.margin)
+        self.tiles = {}
+        self.panels = {}
+
+    def tile(self, col, row):
+        """Tile at a grid position; shares pixels with the sheet"""
+        key = (col, row)
+        tile = self.tiles.get(key)
+        if tile is None:
+            if not (0 <= col < self.columns and 0 <= row < self.rows):
+                raise IndexError(f"tile ({col}, {row}) is outside the {self.columns}x{self.rows} sheet")
+            rect = pygame.Rect(col * (self.tile_width + self.margin), row * (self.tile_height + self.margin),
+                               self.tile_width, self.tile_height)
+            tile = self.surface.subsurface(rect)
+            self.tiles[key] = tile
+        return tile
+
+    def panel(self, col, row, size=3):
+        """A size x size block of tiles joined without the margins, e.g. the nine parts of a panel"""
+        key = (col, row, size)
+        panel = self.panels.get(key)
+        if panel is None:
+            panel = pygame.Surface((size * self.tile_width, size * self.tile_height), pygame.SRCALPHA).convert_alpha()
+            panel.fill((0, 0, 0, 0))
+            for dy in range(size):
+                for dx in range(size):
+                    panel.blit(self.tile(col + dx, row + dy), (dx * self.tile_width, dy * self.tile_height))
+            self.panels[key] = panel
+        return panel
+
+
+class NineSlice:
+    """Stretch a panel to any size while its corners keep their pixels"""
+
+    def __init__(self, source, border=None, cache_size=PANEL_CACHE_SIZE):
+        self.source = source
+        # The packaged panels are three equal bands each way
+        self.border = border if border is not None else min(source.get_size()) // 3
+        self.cache = OrderedDict()
+        self.cache_size = cache_size
+
+    def render(self, size):
+        """Panel of (width, height), built once per size"""
+        size = (int(size[0]), int(size[1]))
+        panel = self.cache.get(size)
+        if panel is not None:
+            self.cache.move_to_end(size)
+            return panel
+
+        panel = self.build(size)
+        self.cache[size] = panel
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return panel
+
+    def build(self, size):
+        src_w, src_h = self.source.get_size()
+        width, height = max(size[0], 2 * self.border), max(size[1], 2 * self.border)
+        b = self.border
+        panel = pygame.Surface((width, height), pygame.SRCALPHA).convert_alpha()
+        panel.fill((0, 0, 0, 0))
+
+        # Source and target column/row bands: fixed border, stretched middle, fixed border
+        src_cols = ((0, b), (b, src_w - 2 * b), (src_w - b, b))
+        src_rows = ((0, b), (b, src_h - 2 * b), (src_h - b, b))
+        dst_cols = ((0, b), (b, width - 2 * b), (width - b, b))
+        dst_rows = ((0, b), (b, height - 2 * b), (height - b, b))
+        for (sx, sw), (dx, dw) in zip(src_cols, dst_cols):
+            for (sy, sh), (dy, dh) in zip(src_rows, dst_rows):
+                if sw <= 0 or sh <= 0 or dw <= 0 or dh <= 0:
+                    continue
+                piece = self.source.subsurface((sx, sy, sw, sh))
+                if (sw, sh) != (dw, dh):
+                    piece = pygame.transform.scale(piece, (dw, dh))
+                panel.blit(piece, (dx, dy))
+        return panel
+
+
+_panels = {}
+
+
+def get_nine_slice(name, scale=1):
+    """Shared NineSlice for a panel on the UI pack sheet, e.g. 'blue' or 'blue_pressed'
+
+    `scale` enlarges the tiles first, so pixel-art corners stay crisp on big screens.
+    Returns None if the sheet is missing.
+    """
+    key = (name, scale)
+    panel = _panels.get(key)
+    if panel is None:
+        try:
+            source = get_spritesheet().panel(*SHEET_PANELS[name])
+        except FileNotFoundError:
+            return None
+        if scale != 1:
+            width, height = source.get_size()
+            source = pygame.transform.scale(source, (width * scale, height * scale))
+        # One tile per border band
+        panel = NineSlice(source)
+        _panels[key] = panel
+    return panel
+
+
+_sheet = None
+
+
+def get_spritesheet():
+    """The UI pack sheet, sliced on first use"""
+    global _sheet
+    if _sheet is None:
+        _sheet = SpriteSheet()
+    return _sheet
@@ -0,0 +1,70 @@
+# text_cache.py - Shared font registry and an LRU cache of rendered text surfaces
+from collections import OrderedDict
+
+import pygame
+
+# Pixel memory the cached text surfaces may use before the least recently drawn go
+CACHE_BUDGET = 16 * 1024 * 1024
+
+
+class TextCache:
+    """Fonts are built once per (name, size); text is rasterized once per (text, size, color, antialias)"""
+
+    def __init__(self, budget=CACHE_BUDGET):
+        self.budget = budget
+        self.fonts = {}
+        self.surfaces = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def font(self, size, name=None):
+        key = (name, size)
+        font = self.fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(name, size)
+            self.fonts[key] = font
+        return font
+
+    def render(self, text, size, color, antialias=True, name=None):
+        """Rendered text; the surface is shared, so blit it but never draw on it"""
+        key = (text, size, tuple(color), antialias, name)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self.font(size, name).render(text, antialias, color)
+        self.surfaces[key] = surface
+        self.bytes += surface.get_pitch() * surface.get_height()
+        # Keep the newest surface even if it alone is over budget
+        while self.bytes > self.budget and len(self.surfaces) > 1:
+            _, old = self.surfaces.popitem(last=False)
+            self.bytes -= old.get_pitch() * old.get_height()
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+        self.bytes = 0
+
+
+_cache = None
+
+
+def get_text_cache():
+    global _cache
+    if _cache is None:
+        _cache = TextCache()
+    return _cache
+
+
+def get_font(size, name=None):
+    """Shared pygame Font; None is pygame's default font"""
+    return get_text_cache().font(size, name)
+
+
+def render_text(text, size, color, antialias=True, name=None):
+    """Cached equivalent of pygame.font.Font(name, size).render(text, antialias, color)"""
+    return get_text_cache().render(text, size, color, antialias, name)
@@ -1,43 +1,47 @@
 # ttt_game.py - Tic Tac Toe game window
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import pygame
-import cv2
-import mediapipe as mp
 from Board import Board
-from ttai import call_tt, easy_tt_random, medium_tt
+from camera_preview import CameraPreview
+from profiler import get_profiler
+from effects import panel_surface, rect_surface
+from text_cache import render_text
+from scheduler import FIDELITY_NONE, FIDELITY_PRESENCE, FIDELITY_TRACKING
+from vision import GAME_CONFIG, get_vision_service
+from ttai import call_tt, easy_tt_random, medium_tt, warm_tt
+from alphabeta import AlphaBetaEngine, random_move
+from mcts import MCTS_BUDGETS, MCTSEngine
+
+# Board size -> how many in a row wins
+BOARD_VARIANTS = {3: 3, 4: 4, 5: 4}
+
+# 'minimax' (exact 3x3 play, alpha-beta on larger boards) or 'mcts' (difficulty = playout budget)
+AI_ENGINE = os.environ.get("TTT_ENGINE", "minimax")
 
 class TicTacToeGame:
-    def __init__(self, screen, difficulty):
+    def __init__(self, screen, difficulty, board_size=3):
         self.screen = screen
         self.difficulty = difficulty
         self.WINDOW_WIDTH = pygame.display.Info().current_w
         self.WINDOW_HEIGHT = pygame.display.Info().current_h
         
-        # Initialize board
-        self.board = Board()
-        
         # Game state
         self.last_o_gesture_time = 0
         self.o_gesture_cooldown = 800
         self.ai_move_delay = 500
         self.ai_move_scheduled = None
         self.pending_ai_move = None
+        self.ai_cancel = None
         self.current_hover = None
         self.winner_line = None
         self.game_over_time = None
         
-        # Initialize camera
-        self.cap = cv2.VideoCapture(0)
-        if not self.cap.isOpened():
-            print("Error: Could not open camera")
-            
-        # Initialize MediaPipe
-        self.hand_model = mp.solutions.hands.Hands(
-            model_complexity=0,
-            min_detection_confidence=0.6,
-            min_tracking_confidence=0.6,
-            static_image_mode=False
-        )
-        self.drawer = mp.solutions.drawing_utils
+        # Subscribe to the shared camera and hand model
+        self.vision = get_vision_service().subscribe("ttt", **GAME_CONFIG)
+        self.preview = CameraPreview((0, 0, self.WINDOW_WIDTH // 2, self.WINDOW_HEIGHT))
         
         # Colors
         self.COLOR_BG = (15, 23, 42)
@@ -52,75 +56,115 @@ class TicTacToeGame:
         self.COLOR_TIE = (251, 191, 36)
         self.COLOR_HOVER = (99, 102, 241, 60)
         
-        # Board dimensions
-        self.cell_size = 140
-        self.board_width = self.cell_size * 3
-        self.board_height = self.cell_size * 3
-        self.board_x = self.WINDOW_WIDTH // 2 + (self.WINDOW_WIDTH // 4 - self.board_width // 2)
-        self.board_y = (self.WINDOW_HEIGHT - self.board_height) // 2
+        # One worker, so a cancelled search finishes before the next one starts
+        self.ai_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="TicTacToeAI")
+        self.set_board_size(board_size)
         
         # Import gesture detection
-        from gestures import get_hand_landmarks, o_sign
-        self.get_hand_landmarks = get_hand_landmarks
+        from gestures import o_sign
         self.o_sign = o_sign
     
+    def set_board_size(self, size):
+        """Start a fresh game on a size x size board"""
+        self.board_size = size
+        self.win_length = BOARD_VARIANTS[size]
+        
+        # Board dimensions; the board keeps the same footprint at every size
+        self.cell_size = 420 // size
+        self.board_width = self.cell_size * size
+        self.board_height = self.cell_size * size
+        self.board_x = self.WINDOW_WIDTH // 2 + (self.WINDOW_WIDTH // 4 - self.board_width // 2)
+        self.board_y = (self.WINDOW_HEIGHT - self.board_height) // 2
+        self.grid_layer = self.build_grid_layer()
+        
+        # 3x3 keeps the exact minimax; larger boards search within the AI delay
+        self.engine = None
+        if AI_ENGINE == "mcts":
+            self.engine = MCTSEngine(size, self.win_length, **MCTS_BUDGETS[self.difficulty])
+        elif size == 3:
+            if self.difficulty == 'hard':
+                # Solve once now so no AI move pays for the search
+                warm_tt()
+        elif self.difficulty != 'easy':
+            max_depth = 2 if self.difficulty == 'medium' else None
+            self.engine = AlphaBetaEngine(size, self.win_length,
+                                          time_budget=self.ai_move_delay * 0.8 / 1000,
+                                          max_depth=max_depth)
+        self.reset_game()
+    
     def is_board_full(self):
         """Check if board is full (tie game)"""
-        for row in self.board.board:
-            for cell in row:
-                if cell == ' ':
-                    return False
-        return True
+        return self.board.bits.is_full()
+    
+    def required_fidelity(self):
+        """How much hand input the game needs right now"""
+        if self.board.game_over:
+            return FIDELITY_NONE
+        if self.ai_move_scheduled:
+            return FIDELITY_PRESENCE
+        return FIDELITY_TRACKING
     
     def get_cell_from_position(self, finger_x, finger_y):
         """Convert normalized finger position to board cell"""
-        row = int(finger_y * 3)
-        col = int(finger_x * 3)
-        if 0 <= row < 3 and 0 <= col < 3:
+        row = int(finger_y * self.board_size)
+        col = int(finger_x * self.board_size)
+        if 0 <= row < self.board_size and 0 <= col < self.board_size:
             return row, col
         return None, None
     
     def get_winning_line(self):
         """Check for winning line and return coordinates"""
-        board = self.board.board
-        
-        # Check rows
-        for row in range(3):
-            if board[row][0] == board[row][1] == board[row][2] != ' ':
-                return [(row, 0), (row, 2)]
-        
-        # Check columns
-        for col in range(3):
-            if board[0][col] == board[1][col] == board[2][col] != ' ':
-                return [(0, col), (2, col)]
-        
-        # Check diagonals
-        if board[0][0] == board[1][1] == board[2][2] != ' ':
-            return [(0, 0), (2, 2)]
-        if board[0][2] == board[1][1] == board[2][0] != ' ':
-            return [(0, 2), (2, 0)]
-        
-        return None
+        line = self.board.winning_line()
+        if line is None:
+            return None
+        start, end = line[0], line[-1]
+        size = self.board_size
+        return [(start // size, start % size), (end // size, end % size)]
     
-    def schedule_ai_move(self):
-        """Schedule AI move with delay"""
-        if self.difficulty == 'easy':
-            ai_move = easy_tt_random(self.board.board)
+    def compute_ai_move(self, bits, engine, cancel):
+        """Pick the AI move; runs on the AI worker thread"""
+        if engine or self.board_size != 3:
+            if engine:
+                cell = engine.best_move(bits, 'X', cancel)
+            else:
+                cell = random_move(bits)
+            return None if cell is None else divmod(cell, self.board_size)
+        elif self.difficulty == 'easy':
+            return easy_tt_random(bits)
         elif self.difficulty == 'medium':
-            ai_move = medium_tt(self.board.board)
-        else:
-            ai_move = call_tt(self.board.board)
-        
-        if ai_move:
-            self.pending_ai_move = ai_move
-            self.ai_move_scheduled = pygame.time.get_ticks()
+            return medium_tt(bits)
+        return call_tt(bits)
+    
+    def schedule_ai_move(self):
+        """Start the AI search in the background; the move is applied after the delay"""
+        self.ai_cancel = threading.Event()
+        self.pending_ai_move = self.ai_executor.submit(
+            self.compute_ai_move, self.board.bits.copy(), self.engine, self.ai_cancel)
+        self.ai_move_scheduled = pygame.time.get_ticks()
+    
+    def cancel_ai_move(self):
+        """Drop any search in flight; its result is never applied"""
+        if self.pending_ai_move:
+            self.ai_cancel.set()
+            self.pending_ai_move.cancel()
+        self.pending_ai_move = None
+        self.ai_move_scheduled = None
     
     def execute_ai_move(self):
         """Execute the pending AI move"""
         if self.pending_ai_move:
-            self.board.mark_square('X', self.pending_ai_move[0], self.pending_ai_move[1])
+            try:
+                ai_move = self.pending_ai_move.result()
+            except Exception as e:
+                # A broken engine must not take the render loop down; play any legal move instead
+                print(f"AI move failed ({type(e).__name__}: {e}); playing a random move")
+                cell = random_move(self.board.bits)
+                ai_move = None if cell is None else divmod(cell, self.board_size)
             self.pending_ai_move = None
             self.ai_move_scheduled = None
+            if ai_move is None:
+                return
+            self.board.mark_square('X', ai_move[0], ai_move[1])
             
             # Check if game ended
             winner = self.board.win_check()
@@ -131,123 +175,114 @@ class TicTacToeGame:
     
     def reset_game(self):
         """Reset the game for a new round"""
-        self.board = Board()
+        self.cancel_ai_move()
+        self.board = Board(self.board_size, self.win_length)
         self.winner_line = None
         self.game_over_time = None
-        self.pending_ai_move = None
-        self.ai_move_scheduled = None
         self.current_hover = None
         self.last_o_gesture_time = 0
     
     def draw(self):
         self.screen.fill(self.COLOR_BG)
         
-        # Check if AI move should be executed
+        # Apply the AI move once the delay has passed and the search is done;
+        # until then we keep rendering while it thinks
         if self.ai_move_scheduled:
             current_time = pygame.time.get_ticks()
-            if current_time - self.ai_move_scheduled >= self.ai_move_delay:
+            if (current_time - self.ai_move_scheduled >= self.ai_move_delay and
+                    self.pending_ai_move.done()):
                 self.execute_ai_move()
         
         # Draw camera feed and detect gestures
         detected_cell = None
         is_gesture_active = False
         
-        if self.cap and self.cap.isOpened():
-            ret, frame = self.cap.read()
-            if ret:
-                frame = cv2.flip(frame, 1)
-                h, w, _ = frame.shape
-                size = min(h, w)
-                frame_square = frame[0:size, 0:size]
-                rgb_frame = cv2.cvtColor(frame_square, cv2.COLOR_BGR2RGB)
+        profiler = get_profiler()
+        self.vision.set_fidelity(self.required_fidelity())
+        state = self.vision.read()
+        if state is not None:
+            # Display camera
+            started = profiler.start()
+            self.preview.update(state)
+            self.preview.draw(self.screen)
+            profiler.stop("ttt.preview", started)
+            
+            if state.square_landmarks is not None:
+                started = profiler.start()
+                self.preview.draw_landmarks(self.screen, state.square_landmarks)
+                profiler.stop("ttt.landmarks", started)
                 
-                # Process hands
-                hand_results = self.hand_model.process(rgb_frame)
+                landmarks = state.square_landmarks
+                is_o_sign, fingertip_x, fingertip_y = self.o_sign(landmarks)
                 
-                if hand_results.multi_hand_landmarks:
-                    for hand in hand_results.multi_hand_landmarks:
-                        self.drawer.draw_landmarks(
-                            frame_square, 
-                            hand, 
-                            mp.solutions.hands.HAND_CONNECTIONS,
-                            self.drawer.DrawingSpec(color=(99, 102, 241), thickness=2, circle_radius=4),
-                            self.drawer.DrawingSpec(color=(241, 245, 249), thickness=2)
-                        )
-                        
-                        landmarks = self.get_hand_landmarks(hand)
-                        is_o_sign, fingertip_x, fingertip_y = self.o_sign(landmarks)
+                if is_o_sign:
+                    is_gesture_active = True
+                    row, col = self.get_cell_from_position(fingertip_x, fingertip_y)
+                    
+                    if row is not None and col is not None:
+                        detected_cell = (row, col)
+                        self.current_hover = detected_cell
                         
-                        if is_o_sign:
-                            is_gesture_active = True
-                            row, col = self.get_cell_from_position(fingertip_x, fingertip_y)
+                        if (self.board.board[row][col] == ' ' and 
+                            not self.board.game_over and 
+                            not self.ai_move_scheduled):
                             
-                            if row is not None and col is not None:
-                                detected_cell = (row, col)
-                                self.current_hover = detected_cell
-                                
-                                if (self.board.board[row][col] == ' ' and 
-                                    not self.board.game_over and 
-                                    not self.ai_move_scheduled):
+                            current_time = pygame.time.get_ticks()
+                            if current_time - self.last_o_gesture_time > self.o_gesture_cooldown:
+                                if self.board.mark_square('O', row, col):
+                                    self.last_o_gesture_time = current_time
                                     
-                                    current_time = pygame.time.get_ticks()
-                                    if current_time - self.last_o_gesture_time > self.o_gesture_cooldown:
-                                        if self.board.mark_square('O', row, col):
-                                            self.last_o_gesture_time = current_time
-                                            
-                                            # Check if game ended with player's move
-                                            winner = self.board.win_check()
-                                            if winner or self.is_board_full():
-                                                self.board.game_over = True
-                                                self.winner_line = self.get_winning_line()
-                                                self.game_over_time = current_time
-                                            else:
-                                                self.schedule_ai_move()
-                            
-                            # Draw crosshair on camera
-                            center_x = int(fingertip_x * size)
-                            center_y = int(fingertip_y * size)
-                            cv2.circle(frame_square, (center_x, center_y), 15, (59, 130, 246), 3)
-                            cv2.circle(frame_square, (center_x, center_y), 3, (59, 130, 246), -1)
-                            cv2.line(frame_square, (center_x - 25, center_y), (center_x - 10, center_y), (59, 130, 246), 2)
-                            cv2.line(frame_square, (center_x + 10, center_y), (center_x + 25, center_y), (59, 130, 246), 2)
-                            cv2.line(frame_square, (center_x, center_y - 25), (center_x, center_y - 10), (59, 130, 246), 2)
-                            cv2.line(frame_square, (center_x, center_y + 10), (center_x, center_y + 25), (59, 130, 246), 2)
-                
-                if not is_gesture_active:
-                    self.current_hover = None
-                
-                # Display camera
-                frame_surface = pygame.surfarray.make_surface(
-                    cv2.cvtColor(frame_square, cv2.COLOR_BGR2RGB).swapaxes(0,1)
-                )
-                scaled_frame = pygame.transform.scale(
-                    frame_surface, 
-                    (self.WINDOW_WIDTH // 2, self.WINDOW_HEIGHT)
-                )
-                self.screen.blit(scaled_frame, (0, 0))
+                                    # Check if game ended with player's move
+                                    winner = self.board.win_check()
+                                    if winner or self.is_board_full():
+                                        self.board.game_over = True
+                                        self.winner_line = self.get_winning_line()
+                                        self.game_over_time = current_time
+                                    else:
+                                        self.schedule_ai_move()
+                    
+                    # Draw crosshair on camera
+                    self.preview.draw_crosshair(self.screen, fingertip_x, fingertip_y)
+            
+            if not is_gesture_active:
+                self.current_hover = None
         
         # Draw dividing line
         line_x = self.WINDOW_WIDTH // 2
         pygame.draw.line(self.screen, self.COLOR_DIVIDER, (line_x, 0), (line_x, self.WINDOW_HEIGHT), 4)
         
+        started = profiler.start()
         self.draw_game_board()
+        profiler.stop("ttt.board", started)
+    
+    def build_grid_layer(self):
+        """Border and grid lines on a transparent surface, drawn once per board size"""
+        layer = pygame.Surface((self.board_width, self.board_height), pygame.SRCALPHA)
+        pygame.draw.rect(layer, self.COLOR_GRID, layer.get_rect(), 3, border_radius=15)
+        for i in range(1, self.board_size):
+            # Vertical
+            x = i * self.cell_size
+            pygame.draw.line(layer, self.COLOR_GRID, (x, 8), (x, self.board_height - 8), 3)
+            # Horizontal
+            y = i * self.cell_size
+            pygame.draw.line(layer, self.COLOR_GRID, (8, y), (self.board_width - 8, y), 3)
+        return layer
     
     def draw_game_board(self):
         right_center_x = self.WINDOW_WIDTH * 3 // 4
         
         # Draw title
-        title_font = pygame.font.Font(None, 56)
-        title_text = title_font.render("Tic Tac Toe", True, self.COLOR_TEXT)
+        title_text = render_text("Tic Tac Toe", 56, self.COLOR_TEXT)
         self.screen.blit(title_text, title_text.get_rect(center=(right_center_x, 50)))
         
         # Difficulty badge
-        diff_font = pygame.font.Font(None, 28)
-        diff_text = diff_font.render(self.difficulty.upper(), True, self.COLOR_GRID)
-        diff_bg = pygame.Surface((diff_text.get_width() + 24, 32), pygame.SRCALPHA)
-        pygame.draw.rect(diff_bg, (*self.COLOR_GRID, 40), diff_bg.get_rect(), border_radius=8)
-        pygame.draw.rect(diff_bg, self.COLOR_GRID, diff_bg.get_rect(), 2, border_radius=8)
-        diff_bg.blit(diff_text, (12, 6))
-        self.screen.blit(diff_bg, (right_center_x - diff_bg.get_width() // 2, 90))
+        diff_label = f"{self.difficulty.upper()}  {self.board_size}x{self.board_size}"
+        diff_text = render_text(diff_label, 28, self.COLOR_GRID)
+        diff_bg = panel_surface((diff_text.get_width() + 24, 32), (*self.COLOR_GRID, 40), self.COLOR_GRID,
+                                border_radius=8)
+        diff_x = right_center_x - diff_bg.get_width() // 2
+        self.screen.blit(diff_bg, (diff_x, 90))
+        self.screen.blit(diff_text, (diff_x + 12, 96))
         
         # Draw player indicators
         self.draw_player_indicators(right_center_x)
@@ -263,38 +298,22 @@ class TicTacToeGame:
             if self.board.board[row][col] == ' ':
                 hover_x = self.board_x + col * self.cell_size
                 hover_y = self.board_y + row * self.cell_size
-                hover_surf = pygame.Surface((self.cell_size, self.cell_size), pygame.SRCALPHA)
-                pygame.draw.rect(hover_surf, self.COLOR_HOVER, hover_surf.get_rect())
-                self.screen.blit(hover_surf, (hover_x, hover_y))
+                self.screen.blit(rect_surface((self.cell_size, self.cell_size), self.COLOR_HOVER),
+                                 (hover_x, hover_y))
         
-        # Draw border
-        pygame.draw.rect(self.screen, self.COLOR_GRID,
-                        (self.board_x, self.board_y, self.board_width, self.board_height), 
-                        3, border_radius=15)
-        
-        # Draw grid lines
-        for i in range(1, 3):
-            # Vertical
-            x = self.board_x + i * self.cell_size
-            pygame.draw.line(self.screen, self.COLOR_GRID,
-                           (x, self.board_y + 8),
-                           (x, self.board_y + self.board_height - 8), 3)
-            # Horizontal
-            y = self.board_y + i * self.cell_size
-            pygame.draw.line(self.screen, self.COLOR_GRID,
-                           (self.board_x + 8, y),
-                           (self.board_x + self.board_width - 8, y), 3)
+        # Draw border and grid lines
+        self.screen.blit(self.grid_layer, (self.board_x, self.board_y))
         
         # Draw X's and O's
-        for row in range(3):
-            for col in range(3):
+        for row in range(self.board_size):
+            for col in range(self.board_size):
                 cell_x = self.board_x + col * self.cell_size
                 cell_y = self.board_y + row * self.cell_size
                 center_x = cell_x + self.cell_size // 2
                 center_y = cell_y + self.cell_size // 2
                 
                 if self.board.board[row][col] == 'X':
-                    padding = 30
+                    padding = self.cell_size * 3 // 14
                     pygame.draw.line(self.screen, self.COLOR_X,
                                    (cell_x + padding, cell_y + padding),
                                    (cell_x + self.cell_size - padding, cell_y + self.cell_size - padding), 6)
@@ -303,7 +322,7 @@ class TicTacToeGame:
                                    (cell_x + padding, cell_y + self.cell_size - padding), 6)
                 
                 elif self.board.board[row][col] == 'O':
-                    radius = self.cell_size // 2 - 30
+                    radius = self.cell_size // 2 - self.cell_size * 3 // 14
                     pygame.draw.circle(self.screen, self.COLOR_O,
                                      (center_x, center_y), radius, 6)
         
@@ -334,50 +353,42 @@ class TicTacToeGame:
         indicator_y = 150
         
         # Player (O)
-        player_surf = pygame.Surface((160, 50), pygame.SRCALPHA)
+        px, py = center_x - 180, indicator_y
         is_player_turn = not self.board.game_over and not self.ai_move_scheduled
         
         if is_player_turn:
-            pygame.draw.rect(player_surf, (*self.COLOR_O, 40), player_surf.get_rect(), border_radius=8)
-            pygame.draw.rect(player_surf, self.COLOR_O, player_surf.get_rect(), 2, border_radius=8)
+            player_bg = panel_surface((160, 50), (*self.COLOR_O, 40), self.COLOR_O, border_radius=8)
             o_color = self.COLOR_O
         else:
-            pygame.draw.rect(player_surf, (*self.COLOR_TEXT_DIM, 20), player_surf.get_rect(), border_radius=8)
+            player_bg = panel_surface((160, 50), (*self.COLOR_TEXT_DIM, 20), border_radius=8)
             o_color = self.COLOR_TEXT_DIM
+        self.screen.blit(player_bg, (px, py))
         
-        pygame.draw.circle(player_surf, o_color, (25, 25), 12, 3)
-        font = pygame.font.Font(None, 28)
-        text = font.render("YOU", True, o_color)
-        player_surf.blit(text, (50, 17))
-        
-        self.screen.blit(player_surf, (center_x - 180, indicator_y))
+        pygame.draw.circle(self.screen, o_color, (px + 25, py + 25), 12, 3)
+        text = render_text("YOU", 28, o_color)
+        self.screen.blit(text, (px + 50, py + 17))
         
         # Computer (X)
-        comp_surf = pygame.Surface((160, 50), pygame.SRCALPHA)
+        cx, cy = center_x + 20, indicator_y
         is_ai_turn = not self.board.game_over and self.ai_move_scheduled
         
         if is_ai_turn:
-            pygame.draw.rect(comp_surf, (*self.COLOR_X, 40), comp_surf.get_rect(), border_radius=8)
-            pygame.draw.rect(comp_surf, self.COLOR_X, comp_surf.get_rect(), 2, border_radius=8)
+            comp_bg = panel_surface((160, 50), (*self.COLOR_X, 40), self.COLOR_X, border_radius=8)
             x_color = self.COLOR_X
         else:
-            pygame.draw.rect(comp_surf, (*self.COLOR_TEXT_DIM, 20), comp_surf.get_rect(), border_radius=8)
+            comp_bg = panel_surface((160, 50), (*self.COLOR_TEXT_DIM, 20), border_radius=8)
             x_color = self.COLOR_TEXT_DIM
+        self.screen.blit(comp_bg, (cx, cy))
         
-        pygame.draw.line(comp_surf, x_color, (15, 15), (35, 35), 3)
-        pygame.draw.line(comp_surf, x_color, (35, 15), (15, 35), 3)
-        text = font.render("CPU", True, x_color)
-        comp_surf.blit(text, (50, 17))
-        
-        self.screen.blit(comp_surf, (center_x + 20, indicator_y))
+        pygame.draw.line(self.screen, x_color, (cx + 15, cy + 15), (cx + 35, cy + 35), 3)
+        pygame.draw.line(self.screen, x_color, (cx + 35, cy + 15), (cx + 15, cy + 35), 3)
+        text = render_text("CPU", 28, x_color)
+        self.screen.blit(text, (cx + 50, cy + 17))
     
     def draw_status(self, center_x):
         """Draw status text and instructions"""
         status_y = self.board_y + self.board_height + 50
         
-        font = pygame.font.Font(None, 44)
-        inst_font = pygame.font.Font(None, 28)
-        
         if self.board.game_over:
             winner = self.board.win_check()
             if winner == 'O':
@@ -390,15 +401,15 @@ class TicTacToeGame:
                 status_text = "It's a Tie!"
                 status_color = self.COLOR_TIE
             
-            text = font.render(status_text, True, status_color)
+            text = render_text(status_text, 44, status_color)
             self.screen.blit(text, text.get_rect(center=(center_x, status_y)))
             
             # Play again button
-            button_text = inst_font.render("Press R to Play Again", True, self.COLOR_TEXT)
+            button_text = render_text("Press R to Play Again", 28, self.COLOR_TEXT)
             self.screen.blit(button_text, button_text.get_rect(center=(center_x, status_y + 50)))
             
             # ESC instruction
-            esc_text = inst_font.render("Press ESC to return to menu", True, self.COLOR_TEXT_DIM)
+            esc_text = render_text("Press ESC to return to menu", 28, self.COLOR_TEXT_DIM)
             self.screen.blit(esc_text, esc_text.get_rect(center=(center_x, status_y + 85)))
             
         else:
@@ -409,18 +420,18 @@ class TicTacToeGame:
                 status_text = "Your turn!"
                 status_color = self.COLOR_O
             
-            text = font.render(status_text, True, status_color)
+            text = render_text(status_text, 44, status_color)
             self.screen.blit(text, text.get_rect(center=(center_x, status_y)))
             
             # Instructions
-            inst1 = inst_font.render("Make 'O' gesture and point at cell", True, self.COLOR_TEXT_DIM)
+            inst1 = render_text("Make 'O' gesture and point at cell", 28, self.COLOR_TEXT_DIM)
             self.screen.blit(inst1, inst1.get_rect(center=(center_x, status_y + 40)))
             
-            inst2 = inst_font.render("Hold steady to place your mark", True, self.COLOR_TEXT_DIM)
+            inst2 = render_text("Hold steady to place your mark", 28, self.COLOR_TEXT_DIM)
             self.screen.blit(inst2, inst2.get_rect(center=(center_x, status_y + 70)))
             
             # ESC instruction
-            esc_text = inst_font.render("Press ESC for menu", True, self.COLOR_TEXT_DIM)
+            esc_text = render_text("Press ESC for menu, 3/4/5 for board size", 28, self.COLOR_TEXT_DIM)
             self.screen.blit(esc_text, esc_text.get_rect(center=(center_x, status_y + 105)))
     
     def handle_event(self, event):
@@ -429,6 +440,8 @@ class TicTacToeGame:
             if event.key == pygame.K_r:
                 if self.board.game_over:
                     self.reset_game()
+            elif event.key in (pygame.K_3, pygame.K_4, pygame.K_5):
+                self.set_board_size(event.key - pygame.K_0)
     
     def handle_click(self, pos):
         """Handle mouse clicks on the board"""
@@ -439,7 +452,8 @@ class TicTacToeGame:
             col = board_rel_x // self.cell_size
             row = board_rel_y // self.cell_size
             
-            if 0 <= row < 3 and 0 <= col < 3 and not self.board.game_over and not self.ai_move_scheduled:
+            if (0 <= row < self.board_size and 0 <= col < self.board_size and
+                    not self.board.game_over and not self.ai_move_scheduled):
                 if self.board.mark_square('O', row, col):
                     winner = self.board.win_check()
                     if winner or self.is_board_full():
@@ -451,7 +465,6 @@ class TicTacToeGame:
     
     def cleanup(self):
         """Clean up resources"""
-        if self.cap:
-            self.cap.release()
-        if hasattr(self, 'hand_model'):
-            self.hand_model.close()
\ No newline at end of file
+        self.cancel_ai_move()
+        self.ai_executor.shutdown(wait=False, cancel_futures=True)
+        self.vision.release()
\ No newline at end of file
@@ -0,0 +1,155 @@
+# alphabeta.py - Alpha-beta search for N x N, K-in-a-row boards under a time budget
+import random
+import time
+
+from bitboard import GridGeometry
+
+WIN_SCORE = 1000000
+# Heuristic weight for a line holding this many stones of one player and none of the other
+LINE_WEIGHTS = (0, 1, 10, 100, 1000, 10000)
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+class AlphaBetaEngine:
+    """Negamax with alpha-beta, a transposition table and iterative deepening"""
+
+    def __init__(self, size, k, time_budget=0.4, max_depth=None):
+        self.geometry = GridGeometry.get(size, k)
+        self.time_budget = time_budget
+        self.max_depth = max_depth
+        self.weights = LINE_WEIGHTS[:k] + (0,) * (len(LINE_WEIGHTS) - k)
+        self.table = {}
+        self.deadline = 0.0
+        self.cancel = None
+
+        # Stats from the last search
+        self.nodes = 0
+        self.depth_reached = 0
+        self.elapsed = 0.0
+
+    def evaluate(self, me, opp):
+        """Score open lines from the side to move's point of view"""
+        score = 0
+        weights = self.weights
+        for line in self.geometry.line_masks:
+            mine = me & line
+            theirs = opp & line
+            if mine and not theirs:
+                score += weights[mine.bit_count()]
+            elif theirs and not mine:
+                score -= weights[theirs.bit_count()]
+        return score
+
+    def ordered_moves(self, empty, first=None):
+        moves = [cell for cell in self.geometry.order if empty >> cell & 1]
+        if first is not None and first in moves:
+            moves.remove(first)
+            moves.insert(0, first)
+        return moves
+
+    def negamax(self, me, opp, depth, alpha, beta, ply):
+        self.nodes += 1
+        if self.nodes & 1023 == 0 and (time.perf_counter() > self.deadline or
+                                       (self.cancel and self.cancel.is_set())):
+            raise SearchTimeout()
+
+        empty = self.geometry.full & ~(me | opp)
+        if not empty:
+            return 0
+
+        # Win on the spot if we can
+        completes_line = self.geometry.completes_line
+        for cell in self.geometry.order:
+            if empty >> cell & 1 and completes_line(me | 1 << cell, cell):
+                return WIN_SCORE - ply
+
+        if depth == 0:
+            return self.evaluate(me, opp)
+
+        key = (me, opp)
+        entry = self.table.get(key)
+        best_move = None
+        if entry is not None:
+            entry_depth, entry_score, entry_move = entry
+            best_move = entry_move
+            if entry_depth >= depth:
+                return entry_score
+
+        best = -WIN_SCORE * 2
+        original_alpha = alpha
+        for cell in self.ordered_moves(empty, best_move):
+            score = -self.negamax(opp, me | 1 << cell, depth - 1, -beta, -alpha, ply + 1)
+            if score > best:
+                best = score
+                best_move = cell
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                break
+
+        # Only exact scores are reused as values; bounds still help move ordering
+        if original_alpha < best < beta:
+            self.table[key] = (depth, best, best_move)
+        else:
+            self.table[key] = (-1, best, best_move)
+        return best
+
+    def search_root(self, me, opp, depth, first):
+        empty = self.geometry.full & ~(me | opp)
+        best_score = -WIN_SCORE * 2
+        best_move = None
+        alpha = -WIN_SCORE * 2
+        for cell in self.ordered_moves(empty, first):
+            score = -self.negamax(opp, me | 1 << cell, depth - 1, -WIN_SCORE * 2, -alpha, 1)
+            if score > best_score:
+                best_score = score
+                best_move = cell
+            alpha = max(alpha, score)
+        return best_move, best_score
+
+    def best_move(self, board, player, cancel=None):
+        """Deepen until out of time or cancelled; returns a cell index, or None on a full board"""
+        me, opp = (board.x, board.o) if player == 'X' else (board.o, board.x)
+        empty = self.geometry.full & ~(me | opp)
+        moves = self.ordered_moves(empty)
+        if not moves:
+            return None
+
+        start = time.perf_counter()
+        self.deadline = start + self.time_budget
+        self.cancel = cancel
+        self.nodes = 0
+        self.depth_reached = 0
+        # Scores depend on depth, so entries from the last move are stale
+        self.table = {}
+
+        # Take a win, or block the opponent's, without searching
+        completes_line = self.geometry.completes_line
+        for mask in (me, opp):
+            for cell in moves:
+                if completes_line(mask | 1 << cell, cell):
+                    self.elapsed = time.perf_counter() - start
+                    return cell
+
+        best = moves[0]
+        max_depth = min(self.max_depth or len(moves), len(moves))
+        for depth in range(1, max_depth + 1):
+            try:
+                move, score = self.search_root(me, opp, depth, best)
+            except SearchTimeout:
+                break
+            best = move
+            self.depth_reached = depth
+            # A forced result will not change with more depth
+            if abs(score) >= WIN_SCORE - len(moves):
+                break
+        self.elapsed = time.perf_counter() - start
+        return best
+
+
+def random_move(board):
+    """Any empty cell"""
+    moves = board.legal_moves()
+    return random.choice(moves) if moves else None
@@ -0,0 +1,251 @@
+# bitboard.py - Tic Tac Toe boards stored as one bit mask per player
+# Bit i is cell (i // size, i % size)
+
+FULL = 0x1FF
+
+# Same order check_winner scans in: rows, columns, diagonals
+WIN_LINES = (
+    (0, 1, 2), (3, 4, 5), (6, 7, 8),
+    (0, 3, 6), (1, 4, 7), (2, 5, 8),
+    (0, 4, 8), (2, 4, 6),
+)
+WIN_MASKS = tuple(sum(1 << i for i in line) for line in WIN_LINES)
+
+# Flat index permutations for the 8 rotations and reflections of the board
+SYMMETRIES = (
+    (0, 1, 2, 3, 4, 5, 6, 7, 8),
+    (6, 3, 0, 7, 4, 1, 8, 5, 2),
+    (8, 7, 6, 5, 4, 3, 2, 1, 0),
+    (2, 5, 8, 1, 4, 7, 0, 3, 6),
+    (2, 1, 0, 5, 4, 3, 8, 7, 6),
+    (6, 7, 8, 3, 4, 5, 0, 1, 2),
+    (0, 3, 6, 1, 4, 7, 2, 5, 8),
+    (8, 5, 2, 7, 4, 1, 6, 3, 0),
+)
+
+
+def _first_line(mask):
+    for index, line in enumerate(WIN_MASKS):
+        if mask & line == line:
+            return index
+    return len(WIN_MASKS)
+
+
+def _permute(mask, perm):
+    return sum(1 << i for i, source in enumerate(perm) if mask >> source & 1)
+
+
+# Lookup tables over every possible 9-bit mask
+# Index of the first completed line (len(WIN_MASKS) if none), so ties resolve like check_winner
+FIRST_LINE = tuple(_first_line(mask) for mask in range(FULL + 1))
+# Empty cells of an occupancy mask in row-major order
+EMPTY_CELLS = tuple(tuple(i for i in range(9) if not mask >> i & 1) for mask in range(FULL + 1))
+# Each mask under each symmetry
+PERMUTED = tuple(tuple(_permute(mask, perm) for mask in range(FULL + 1)) for perm in SYMMETRIES)
+
+NO_LINE = len(WIN_MASKS)
+
+
+def winner(x, o):
+    """'X', 'O' or None for a pair of masks"""
+    x_line, o_line = FIRST_LINE[x], FIRST_LINE[o]
+    if x_line == o_line:
+        return None
+    return 'X' if x_line < o_line else 'O'
+
+
+def canonical(x, o):
+    """Smallest encoding of the position among its 8 symmetries"""
+    return min((table[x] << 9) | table[o] for table in PERMUTED)
+
+
+class BitBoard:
+    """Two 9-bit masks, one per player"""
+
+    size = 3
+    k = 3
+
+    def __init__(self, x=0, o=0):
+        self.x = x
+        self.o = o
+
+    @classmethod
+    def from_lists(cls, rows):
+        """Build from the 3x3 list of ' ', 'X', 'O' used for rendering"""
+        x = o = 0
+        for i in range(9):
+            cell = rows[i // 3][i % 3]
+            if cell == 'X':
+                x |= 1 << i
+            elif cell == 'O':
+                o |= 1 << i
+        return cls(x, o)
+
+    def copy(self):
+        return BitBoard(self.x, self.o)
+
+    def cell(self, row, col):
+        bit = 1 << (row * 3 + col)
+        if self.x & bit:
+            return 'X'
+        if self.o & bit:
+            return 'O'
+        return ' '
+
+    def to_lists(self):
+        return [[self.cell(row, col) for col in range(3)] for row in range(3)]
+
+    @property
+    def occupied(self):
+        return self.x | self.o
+
+    def is_empty(self, index):
+        return not (self.x | self.o) >> index & 1
+
+    def is_full(self):
+        return self.x | self.o == FULL
+
+    def winner(self):
+        return winner(self.x, self.o)
+
+    def winning_line(self):
+        """Cell indices of the first completed line, or None"""
+        line = min(FIRST_LINE[self.x], FIRST_LINE[self.o])
+        return None if line == NO_LINE else WIN_LINES[line]
+
+    def legal_moves(self):
+        """Empty cell indices in row-major order"""
+        return EMPTY_CELLS[self.x | self.o]
+
+    def play(self, index, player):
+        if player == 'X':
+            self.x |= 1 << index
+        else:
+            self.o |= 1 << index
+
+    def undo(self, index):
+        mask = ~(1 << index)
+        self.x &= mask
+        self.o &= mask
+
+
+class GridGeometry:
+    """Win lines and move ordering for an N x N board with K in a row"""
+
+    _cache = {}
+
+    def __init__(self, size, k):
+        self.size = size
+        self.k = k
+        self.cells = size * size
+        self.full = (1 << self.cells) - 1
+
+        # Every K-long window, in check_winner's order: rows, columns, diagonals, anti-diagonals
+        lines = []
+        for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+            for row in range(size):
+                for col in range(size):
+                    end_row, end_col = row + dr * (k - 1), col + dc * (k - 1)
+                    if 0 <= end_row < size and 0 <= end_col < size:
+                        lines.append(tuple((row + dr * i) * size + col + dc * i for i in range(k)))
+        self.lines = tuple(lines)
+        self.line_masks = tuple(sum(1 << i for i in line) for line in lines)
+        # Only lines through a cell can be completed by playing it
+        self.cell_lines = tuple(
+            tuple(mask for mask in self.line_masks if mask >> cell & 1) for cell in range(self.cells)
+        )
+        # Central cells first; they sit on the most lines
+        center = (size - 1) / 2
+        self.order = tuple(sorted(range(self.cells),
+                                  key=lambda i: abs(i // size - center) + abs(i % size - center)))
+
+    @classmethod
+    def get(cls, size, k):
+        key = (size, k)
+        if key not in cls._cache:
+            cls._cache[key] = cls(size, k)
+        return cls._cache[key]
+
+    def completes_line(self, mask, cell):
+        """Whether the stones in mask make a line through cell"""
+        for line in self.cell_lines[cell]:
+            if mask & line == line:
+                return True
+        return False
+
+    def first_line(self, mask):
+        for index, line in enumerate(self.line_masks):
+            if mask & line == line:
+                return index
+        return len(self.line_masks)
+
+
+class GridBoard:
+    """BitBoard interface for larger boards, using arbitrary-size int masks"""
+
+    def __init__(self, size, k, x=0, o=0):
+        self.geometry = GridGeometry.get(size, k)
+        self.size = size
+        self.k = k
+        self.x = x
+        self.o = o
+
+    def copy(self):
+        return GridBoard(self.size, self.k, self.x, self.o)
+
+    def cell(self, row, col):
+        bit = 1 << (row * self.size + col)
+        if self.x & bit:
+            return 'X'
+        if self.o & bit:
+            return 'O'
+        return ' '
+
+    def to_lists(self):
+        return [[self.cell(row, col) for col in range(self.size)] for row in range(self.size)]
+
+    @property
+    def occupied(self):
+        return self.x | self.o
+
+    def is_empty(self, index):
+        return not (self.x | self.o) >> index & 1
+
+    def is_full(self):
+        return self.x | self.o == self.geometry.full
+
+    def winner(self):
+        x_line = self.geometry.first_line(self.x)
+        o_line = self.geometry.first_line(self.o)
+        if x_line == o_line:
+            return None
+        return 'X' if x_line < o_line else 'O'
+
+    def winning_line(self):
+        line = min(self.geometry.first_line(self.x), self.geometry.first_line(self.o))
+        if line == len(self.geometry.lines):
+            return None
+        return self.geometry.lines[line]
+
+    def legal_moves(self):
+        occupied = self.x | self.o
+        return tuple(i for i in range(self.geometry.cells) if not occupied >> i & 1)
+
+    def play(self, index, player):
+        if player == 'X':
+            self.x |= 1 << index
+        else:
+            self.o |= 1 << index
+
+    def undo(self, index):
+        mask = ~(1 << index)
+        self.x &= mask
+        self.o &= mask
+
+
+def make_board(size=3, k=None):
+    """BitBoard for the classic game, GridBoard for anything larger"""
+    k = k or size
+    if size == 3 and k == 3:
+        return BitBoard()
+    return GridBoard(size, k)
@@ -0,0 +1,194 @@
+# mcts.py - Monte Carlo Tree Search for N x N, K-in-a-row boards with batched NumPy playouts
+import math
+import time
+
+import numpy as np
+
+from bitboard import GridGeometry
+
+# Playout or time budget per difficulty; more playouts means stronger play
+MCTS_BUDGETS = {
+    'easy': {'playouts': 64},
+    'medium': {'playouts': 512},
+    'hard': {'time_budget': 0.4},
+}
+# A playout budget is spread over at least this many tree iterations, so small budgets
+# still visit every root move instead of spending it all on one batch
+MIN_ITERATIONS = 64
+
+
+def other(player):
+    return 'O' if player == 'X' else 'X'
+
+
+class Node:
+    """One position in the search tree; stats are from the view of the player who moved into it"""
+
+    def __init__(self, geometry, x, o, player, move=None, parent=None, result=None):
+        self.x = x
+        self.o = o
+        # Player to move here
+        self.player = player
+        self.move = move
+        self.parent = parent
+        # 'X', 'O', 'draw' or None while the game goes on
+        self.result = result
+        self.children = {}
+        occupied = x | o
+        self.untried = [] if result else [c for c in geometry.order if not occupied >> c & 1]
+        self.visits = 0
+        self.score = 0.0
+
+    def select_child(self, exploration):
+        log_visits = math.log(self.visits)
+        return max(self.children.values(),
+                   key=lambda c: c.score / c.visits + exploration * math.sqrt(log_visits / c.visits))
+
+
+class Playouts:
+    """Finish many random games from one position at once"""
+
+    def __init__(self, geometry, rng):
+        self.geometry = geometry
+        self.rng = rng
+        self.lines = np.array(geometry.lines, dtype=np.intp)
+
+    def run(self, x, o, player, batch):
+        """Return (x_wins, o_wins, draws) over `batch` random continuations"""
+        cells = self.geometry.cells
+        bits = np.arange(cells)
+        owner = np.zeros(cells, dtype=np.int8)
+        owner[(x >> bits) & 1 == 1] = 1
+        owner[(o >> bits) & 1 == 1] = 2
+        empty = np.flatnonzero(owner == 0)
+
+        # A random order for the empty cells of every game; players alternate along it
+        order = self.rng.random((batch, len(empty))).argsort(axis=1).argsort(axis=1)
+        owners = np.broadcast_to(owner, (batch, cells)).copy()
+        ranks = np.full((batch, cells), -1, dtype=np.intp)
+        ranks[:, empty] = order
+        mover = 1 if player == 'X' else 2
+        owners[:, empty] = np.where(order % 2 == 0, mover, 3 - mover)
+
+        # A line is won when its last cell is played; the earlier completed line wins the game
+        line_owners = owners[:, self.lines]
+        line_done = ranks[:, self.lines].max(axis=2)
+        never = len(empty) + 1
+        x_time = np.where((line_owners == 1).all(axis=2), line_done, never).min(axis=1)
+        o_time = np.where((line_owners == 2).all(axis=2), line_done, never).min(axis=1)
+
+        x_wins = int(np.count_nonzero(x_time < o_time))
+        o_wins = int(np.count_nonzero(o_time < x_time))
+        return x_wins, o_wins, batch - x_wins - o_wins
+
+
+class MCTSEngine:
+    """UCT search whose strength is set by a playout count or a time budget"""
+
+    def __init__(self, size, k, playouts=None, time_budget=None, batch=32, exploration=1.4, seed=None):
+        self.geometry = GridGeometry.get(size, k)
+        self.playout_budget = playouts
+        self.time_budget = time_budget
+        if playouts is None and time_budget is None:
+            self.time_budget = 0.4
+        self.batch = batch
+        if playouts is not None:
+            self.batch = max(1, min(batch, playouts // MIN_ITERATIONS))
+        self.exploration = exploration
+        self.rng = np.random.default_rng(seed)
+        self.playouts = Playouts(self.geometry, self.rng)
+        self.root = None
+
+        # Stats from the last search; solved (terminal) leaves count toward the budget
+        # but only real random games count toward the playout rate
+        self.playout_count = 0
+        self.random_playouts = 0
+        self.elapsed = 0.0
+        self.reused_visits = 0
+
+    @property
+    def playouts_per_second(self):
+        return self.random_playouts / self.elapsed if self.elapsed > 0 else 0.0
+
+    def reset(self):
+        self.root = None
+
+    def find_root(self, x, o, player):
+        """Reuse the subtree for this position if the last search already explored it"""
+        if self.root is not None:
+            # The position is usually the old root or one of its children (the opponent's reply)
+            for node in [self.root] + list(self.root.children.values()):
+                if node.x == x and node.o == o and node.player == player:
+                    node.parent = None
+                    return node
+        return Node(self.geometry, x, o, player)
+
+    def expand(self, node):
+        # Random order, so equal budgets do not always try (and favour) the same cells first
+        cell = node.untried.pop(int(self.rng.integers(len(node.untried))))
+        bit = 1 << cell
+        x, o = (node.x | bit, node.o) if node.player == 'X' else (node.x, node.o | bit)
+        stones = x if node.player == 'X' else o
+        result = None
+        if self.geometry.completes_line(stones, cell):
+            result = node.player
+        elif x | o == self.geometry.full:
+            result = 'draw'
+        child = Node(self.geometry, x, o, other(node.player), cell, node, result)
+        node.children[cell] = child
+        return child
+
+    def simulate(self, node):
+        if node.result == 'X':
+            return self.batch, 0, 0
+        if node.result == 'O':
+            return 0, self.batch, 0
+        if node.result == 'draw':
+            return 0, 0, self.batch
+        self.random_playouts += self.batch
+        return self.playouts.run(node.x, node.o, node.player, self.batch)
+
+    def backpropagate(self, node, x_wins, o_wins, draws):
+        total = x_wins + o_wins + draws
+        while node is not None:
+            # Score for whoever moved into this node
+            wins = o_wins if node.player == 'X' else x_wins
+            node.visits += total
+            node.score += wins + 0.5 * draws
+            node = node.parent
+
+    def best_move(self, board, player, cancel=None):
+        """Search within the budget; returns a cell index, or None on a full board"""
+        root = self.find_root(board.x, board.o, player)
+        if not root.untried and not root.children:
+            return None
+        self.reused_visits = root.visits
+
+        start = time.perf_counter()
+        deadline = start + self.time_budget if self.time_budget else None
+        self.playout_count = 0
+        self.random_playouts = 0
+        while True:
+            node = root
+            while not node.untried and node.children and not node.result:
+                node = node.select_child(self.exploration)
+            if node.untried and not node.result:
+                node = self.expand(node)
+            x_wins, o_wins, draws = self.simulate(node)
+            self.backpropagate(node, x_wins, o_wins, draws)
+            self.playout_count += x_wins + o_wins + draws
+
+            if self.playout_budget and self.playout_count >= self.playout_budget:
+                break
+            if deadline and time.perf_counter() > deadline:
+                break
+            if cancel and cancel.is_set():
+                break
+
+        self.elapsed = time.perf_counter() - start
+        # The most visited move is the most robust choice
+        best = max(root.children.values(), key=lambda c: c.visits)
+        # Keep the chosen subtree for the next move and let the rest go
+        best.parent = None
+        self.root = best
+        return best.move
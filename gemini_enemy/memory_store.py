@@ -0,0 +1,115 @@
+# memory_store.py - SQLite store for per-player move histories, so opponents keep learning across sessions
+import os
+import sqlite3
+import threading
+import time
+
+# GESTURE_MEMORY_DB overrides the location, e.g. a writable path on a kiosk
+DEFAULT_PATH = os.environ.get(
+    "GESTURE_MEMORY_DB",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'memory.db'),
+)
+DEFAULT_PLAYER = 'guest'
+# Rounds kept per player and game; older rounds are evicted
+MAX_HISTORY = 5000
+# Rounds buffered in memory before one transaction writes them
+BATCH_SIZE = 32
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS rounds (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    player TEXT NOT NULL,
+    game TEXT NOT NULL,
+    move INTEGER NOT NULL,
+    ai_move INTEGER NOT NULL,
+    played_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS rounds_by_player ON rounds (player, game, id);
+"""
+
+
+class MemoryStore:
+    """Append-only round log with batched writes and bounded history per player and game"""
+
+    def __init__(self, path=DEFAULT_PATH, max_history=MAX_HISTORY, batch_size=BATCH_SIZE):
+        self.path = path
+        self.max_history = max_history
+        self.batch_size = batch_size
+        self.pending = []
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        # WAL keeps appends cheap and lets readers start without waiting on a writer
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(SCHEMA)
+
+    def record(self, player, game, move, ai_move):
+        """Queue one round; written once a batch fills or on flush()"""
+        with self.lock:
+            self.pending.append((player, game, move, ai_move, time.time()))
+            if len(self.pending) >= self.batch_size:
+                self._flush()
+
+    def flush(self):
+        with self.lock:
+            self._flush()
+
+    def _flush(self):
+        if not self.pending:
+            return
+        rows = self.pending
+        self.pending = []
+        with self.db:
+            self.db.executemany(
+                "INSERT INTO rounds (player, game, move, ai_move, played_at) VALUES (?, ?, ?, ?, ?)", rows)
+            for player, game in {(row[0], row[1]) for row in rows}:
+                self._evict(player, game)
+
+    def _evict(self, player, game):
+        # Delete everything at or below the id just past the newest max_history rounds
+        self.db.execute(
+            "DELETE FROM rounds WHERE player = ? AND game = ? AND id <= ("
+            "SELECT id FROM rounds WHERE player = ? AND game = ? ORDER BY id DESC LIMIT 1 OFFSET ?)",
+            (player, game, player, game, self.max_history))
+
+    def history(self, player, game, limit=None):
+        """(move, ai_move) pairs, oldest first; includes rounds still waiting to be written"""
+        limit = self.max_history if limit is None else limit
+        with self.lock:
+            rows = self.db.execute(
+                "SELECT move, ai_move FROM rounds WHERE player = ? AND game = ? ORDER BY id DESC LIMIT ?",
+                (player, game, limit)).fetchall()
+            rows.reverse()
+            rows += [(row[2], row[3]) for row in self.pending if row[0] == player and row[1] == game]
+        return rows[-limit:] if limit else []
+
+    def forget(self, player, game=None):
+        """Drop a player's history for one game, or for every game"""
+        with self.lock:
+            self.pending = [row for row in self.pending
+                            if row[0] != player or (game is not None and row[1] != game)]
+            with self.db:
+                if game is None:
+                    self.db.execute("DELETE FROM rounds WHERE player = ?", (player,))
+                else:
+                    self.db.execute("DELETE FROM rounds WHERE player = ? AND game = ?", (player, game))
+
+    def close(self):
+        with self.lock:
+            self._flush()
+            self.db.close()
+
+
+_store = None
+
+
+def get_memory_store():
+    """Shared store for the process, opened on first use; None if the database cannot be opened"""
+    global _store
+    if _store is None:
+        try:
+            _store = MemoryStore()
+        except sqlite3.Error as e:
+            print(f"Opponent memory disabled: {e}")
+            return None
+    return _store
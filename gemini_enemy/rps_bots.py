@@ -0,0 +1,47 @@
+# rps_bots.py - Scripted Rock Paper Scissors players with human-like habits, for benchmarks and tournaments
+import random
+
+from rps_predictors import beats, outcome
+
+
+class Bot:
+    """A scripted player; next_move sees its own and the AI's previous moves"""
+
+    def __init__(self, name, next_move):
+        self.name = name
+        self.next_move = next_move
+
+
+def biased(last_self, last_ai):
+    return 0 if random.random() < 0.5 else random.randrange(3)
+
+
+def cycle(last_self, last_ai):
+    return 0 if last_self is None else (last_self + 1) % 3
+
+
+def beat_last(last_self, last_ai):
+    # Play whatever would have beaten the AI last round
+    return random.randrange(3) if last_ai is None else beats(last_ai)
+
+
+def win_stay_lose_shift(last_self, last_ai):
+    if last_self is None:
+        return random.randrange(3)
+    if outcome(last_self, last_ai) == 1:
+        return last_self
+    return beats(last_self)
+
+
+def noisy_cycle(last_self, last_ai):
+    # A cycle that a real player keeps breaking
+    if last_self is None or random.random() < 0.2:
+        return random.randrange(3)
+    return (last_self + 1) % 3
+
+
+def uniform(last_self, last_ai):
+    return random.randrange(3)
+
+
+BOTS = [Bot(fn.__name__, fn) for fn in (uniform, biased, cycle, noisy_cycle, beat_last, win_stay_lose_shift)]
@@ -0,0 +1,178 @@
+# rps_predictors.py - Rock Paper Scissors opponents that learn the player's habits
+# Moves are indices into MOVES; every strategy updates in O(1) per round
+import random
+from array import array
+
+MOVES = ('rock', 'paper', 'scissors')
+MOVE_INDEX = {move: index for index, move in enumerate(MOVES)}
+
+# Counters are halved when one reaches this, so old habits fade and the array stays 16-bit
+COUNT_LIMIT = 1 << 15
+
+
+def beats(move):
+    """The move that beats `move` (paper beats rock, and so on)"""
+    return (move + 1) % 3
+
+
+def outcome(ai_move, player_move):
+    """1 if the AI wins, -1 if it loses, 0 for a tie"""
+    diff = (ai_move - player_move) % 3
+    return 0 if diff == 0 else (1 if diff == 1 else -1)
+
+
+def argmax3(counts, start=0):
+    """Index of the largest of three counters; ties go to a random one"""
+    a, b, c = counts[start], counts[start + 1], counts[start + 2]
+    best = max(a, b, c)
+    if best == 0:
+        return None
+    ties = [i for i, count in enumerate((a, b, c)) if count == best]
+    return ties[0] if len(ties) == 1 else random.choice(ties)
+
+
+class RandomStrategy:
+    """Uniform random play; impossible to exploit and unable to exploit"""
+
+    name = 'random'
+
+    def predict(self):
+        return None
+
+    def choose(self):
+        return random.randrange(3)
+
+    def update(self, player_move, ai_move):
+        pass
+
+
+class FrequencyStrategy:
+    """Counter the player's most frequent move"""
+
+    name = 'frequency'
+
+    def __init__(self):
+        self.counts = array('H', [0, 0, 0])
+
+    def predict(self):
+        """The player's expected next move, or None with no history"""
+        return argmax3(self.counts)
+
+    def choose(self):
+        predicted = self.predict()
+        return random.randrange(3) if predicted is None else beats(predicted)
+
+    def update(self, player_move, ai_move):
+        counts = self.counts
+        counts[player_move] += 1
+        if counts[player_move] >= COUNT_LIMIT:
+            for i in range(3):
+                counts[i] >>= 1
+
+
+class MarkovStrategy:
+    """Counter the move the player most often makes after their last `order` moves"""
+
+    name = 'markov'
+
+    def __init__(self, order=2):
+        self.order = order
+        self.contexts = 3 ** order
+        # One row of three counters per context of the last `order` player moves
+        self.counts = array('H', [0]) * (self.contexts * 3)
+        self.context = 0
+        self.history = 0
+
+    def predict(self):
+        if self.history < self.order:
+            return None
+        return argmax3(self.counts, self.context * 3)
+
+    def choose(self):
+        predicted = self.predict()
+        return random.randrange(3) if predicted is None else beats(predicted)
+
+    def update(self, player_move, ai_move):
+        if self.history >= self.order:
+            slot = self.context * 3
+            counts = self.counts
+            counts[slot + player_move] += 1
+            if counts[slot + player_move] >= COUNT_LIMIT:
+                for i in range(slot, slot + 3):
+                    counts[i] >>= 1
+        else:
+            self.history += 1
+        # Roll the context along as a base-3 number
+        self.context = (self.context * 3 + player_move) % self.contexts
+
+
+class EnsembleStrategy:
+    """Iocaine Powder style: play whichever predictor-and-rotation has been winning lately"""
+
+    name = 'ensemble'
+
+    def __init__(self, predictors=None, decay=0.9):
+        if predictors is None:
+            predictors = [FrequencyStrategy(), MarkovStrategy(1), MarkovStrategy(2), MarkovStrategy(3)]
+        self.predictors = predictors
+        self.decay = decay
+        # Each prediction p suggests three plays: beat p, beat the player beating that, and so on.
+        # Score every (predictor, rotation) pair as if it had been played.
+        self.scores = [0.0] * (len(predictors) * 3)
+        self.candidates = [None] * len(self.scores)
+
+    def choose(self):
+        candidates = self.candidates
+        for i, predictor in enumerate(self.predictors):
+            predicted = predictor.predict()
+            for rotation in range(3):
+                candidates[i * 3 + rotation] = None if predicted is None else (predicted + 1 + rotation) % 3
+
+        best = None
+        best_score = 0.0
+        for candidate, score in zip(candidates, self.scores):
+            if candidate is not None and (best is None or score > best_score):
+                best, best_score = candidate, score
+        # Nothing has earned trust yet
+        if best is None or best_score <= 0:
+            return random.randrange(3)
+        return best
+
+    def update(self, player_move, ai_move):
+        scores = self.scores
+        decay = self.decay
+        for i, candidate in enumerate(self.candidates):
+            scores[i] *= decay
+            if candidate is not None:
+                scores[i] += outcome(candidate, player_move)
+        for predictor in self.predictors:
+            predictor.update(player_move, ai_move)
+
+
+STRATEGIES = {
+    'random': RandomStrategy,
+    'frequency': FrequencyStrategy,
+    'markov': MarkovStrategy,
+    'ensemble': EnsembleStrategy,
+}
+
+# Opponent for each menu difficulty
+DIFFICULTY_STRATEGIES = {
+    'easy': 'frequency',
+    'medium': 'markov',
+    'hard': 'ensemble',
+}
+
+
+def warm_up(strategy, history):
+    """Replay past (player move, ai move) rounds so the strategy starts from what it learned"""
+    for player_move, ai_move in history:
+        # Ensembles score the plays their predictors would have suggested, so ask first
+        strategy.choose()
+        strategy.update(player_move, ai_move)
+    return strategy
+
+
+def make_strategy(name):
+    """A fresh strategy by name or by difficulty"""
+    return STRATEGIES[DIFFICULTY_STRATEGIES.get(name, name)]()
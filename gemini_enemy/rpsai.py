@@ -1,8 +1,19 @@
-import random
+from memory_store import DEFAULT_PLAYER
+from rps_predictors import MOVE_INDEX, MOVES, RandomStrategy, make_strategy, warm_up
+
+# Game name for rounds in the memory store
+MEMORY_GAME = 'rps'
 
 class RPS:
-    def __init__(self):
+    def __init__(self, difficulty=None, memory=None, player=DEFAULT_PLAYER):
         self.choices = ['rock', 'paper', 'scissors']
+        # Learns from every round; plain random play without a difficulty
+        self.strategy = make_strategy(difficulty) if difficulty else RandomStrategy()
+        # With a memory store the strategy picks up where the player's last sessions left off
+        self.memory = memory
+        self.player = player
+        if memory is not None:
+            warm_up(self.strategy, memory.history(player, MEMORY_GAME))
         self.player_score = 0
         self.computer_score = 0
         self.game_finished = False
@@ -19,7 +30,11 @@ class RPS:
         if player_choice not in self.choices:
             return
         
-        self.computer_choice = random.choice(self.choices)
+        ai_move = self.strategy.choose()
+        self.computer_choice = MOVES[ai_move]
+        self.strategy.update(MOVE_INDEX[player_choice], ai_move)
+        if self.memory is not None:
+            self.memory.record(self.player, MEMORY_GAME, MOVE_INDEX[player_choice], ai_move)
         result = self.determine_winner(player_choice, self.computer_choice)
         self.rounds_played += 1
         
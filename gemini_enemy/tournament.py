@@ -0,0 +1,234 @@
+# tournament.py - Headless AI tournament: strength and move latency for every engine, no pygame or camera
+#
+#   python gemini_enemy/tournament.py                  # Tic Tac Toe round robin and RPS strategies vs bots
+#   python gemini_enemy/tournament.py --games 2000 --workers 8
+#   python gemini_enemy/tournament.py --check          # exit 1 if the perfect engine ever loses
+import argparse
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from alphabeta import AlphaBetaEngine
+from bitboard import BitBoard
+from mcts import MCTS_BUDGETS, MCTSEngine
+from rps_bots import BOTS
+from rps_predictors import STRATEGIES, outcome
+from ttai import call_tt, easy_tt_random, medium_tt
+
+# Tic Tac Toe games handed to a worker at a time; an RPS match is one task so its strategy keeps learning
+CHUNK = 50
+
+
+def _ttai_player(choose):
+    """Adapt a ttai function, which always plays X, to play either side"""
+    def move(board, player):
+        me, opp = (board.x, board.o) if player == 'X' else (board.o, board.x)
+        pick = choose(BitBoard(me, opp))
+        return None if pick is None else pick[0] * 3 + pick[1]
+    return move
+
+
+def _engine_player(engine):
+    def move(board, player):
+        return engine.best_move(board, player)
+    move.reset = getattr(engine, 'reset', None)
+    return move
+
+
+# Tic Tac Toe players by name; each factory builds a fresh player inside the worker
+TTT_ENGINES = {
+    'easy_tt_random': lambda seed: _ttai_player(easy_tt_random),
+    'medium_tt': lambda seed: _ttai_player(medium_tt),
+    'call_tt': lambda seed: _ttai_player(call_tt),
+    'alphabeta': lambda seed: _engine_player(AlphaBetaEngine(3, 3, time_budget=0.05)),
+    'mcts': lambda seed: _engine_player(MCTSEngine(3, 3, seed=seed, **MCTS_BUDGETS['medium'])),
+}
+
+# Engines that play perfectly and must never lose a game
+PERFECT_ENGINES = ('call_tt',)
+
+
+def play_ttt(first, second):
+    """One game; returns ('X' | 'O' | None, latencies of X, latencies of O)"""
+    board = BitBoard()
+    players = {'X': first, 'O': second}
+    latencies = {'X': [], 'O': []}
+    for engine in (first, second):
+        if getattr(engine, 'reset', None):
+            engine.reset()
+    player = 'X'
+    while True:
+        start = time.perf_counter()
+        cell = players[player](board, player)
+        latencies[player].append(time.perf_counter() - start)
+        board.play(cell, player)
+        result = board.winner()
+        if result or board.is_full():
+            return result, latencies['X'], latencies['O']
+        player = 'O' if player == 'X' else 'X'
+
+
+def ttt_match(name_a, name_b, games, seed):
+    """Worker task: `games` games between two engines, alternating who moves first"""
+    random.seed(seed)
+    engine_a = TTT_ENGINES[name_a](seed)
+    engine_b = TTT_ENGINES[name_b](seed + 1)
+    wins = draws = losses = 0
+    latency_a = []
+    latency_b = []
+    for game in range(games):
+        a_first = (seed + game) % 2 == 0
+        if a_first:
+            result, first_times, second_times = play_ttt(engine_a, engine_b)
+            a_side, a_times, b_times = 'X', first_times, second_times
+        else:
+            result, first_times, second_times = play_ttt(engine_b, engine_a)
+            a_side, a_times, b_times = 'O', second_times, first_times
+        latency_a += a_times
+        latency_b += b_times
+        if result is None:
+            draws += 1
+        elif result == a_side:
+            wins += 1
+        else:
+            losses += 1
+    return (name_a, name_b), (wins, draws, losses), latency_a, latency_b
+
+
+def rps_match(strategy_name, bot_name, rounds, seed):
+    """Worker task: `rounds` rounds of one strategy against one scripted bot"""
+    random.seed(seed)
+    strategy = STRATEGIES[strategy_name]()
+    bot = next(bot for bot in BOTS if bot.name == bot_name)
+    wins = ties = losses = 0
+    latencies = []
+    last_self = last_ai = None
+    for _ in range(rounds):
+        player_move = bot.next_move(last_self, last_ai)
+        start = time.perf_counter()
+        ai_move = strategy.choose()
+        strategy.update(player_move, ai_move)
+        latencies.append(time.perf_counter() - start)
+        result = outcome(ai_move, player_move)
+        if result == 1:
+            wins += 1
+        elif result == 0:
+            ties += 1
+        else:
+            losses += 1
+        last_self, last_ai = player_move, ai_move
+    return (strategy_name, bot_name), (wins, ties, losses), latencies, []
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+def latency_summary(values):
+    """Mean, p50, p90 and p99 in milliseconds"""
+    values = sorted(values)
+    mean = sum(values) / len(values) if values else 0.0
+    return tuple(1000 * v for v in (mean, percentile(values, 0.5), percentile(values, 0.9), percentile(values, 0.99)))
+
+
+class Results:
+    """Totals per pairing plus every move time per engine"""
+
+    def __init__(self):
+        self.records = {}
+        self.latencies = {}
+
+    def add(self, pairing, record, latency_a, latency_b):
+        total = self.records.setdefault(pairing, [0, 0, 0])
+        for i, count in enumerate(record):
+            total[i] += count
+        self.latencies.setdefault(pairing[0], []).extend(latency_a)
+        if latency_b:
+            self.latencies.setdefault(pairing[1], []).extend(latency_b)
+
+
+def run_tasks(pool, task, jobs):
+    results = Results()
+    futures = [pool.submit(task, *job) for job in jobs]
+    for future in futures:
+        results.add(*future.result())
+    return results
+
+
+def chunked(count, seed):
+    """(size, seed) pieces of a run so the pool can spread it out"""
+    pieces = []
+    for start in range(0, count, CHUNK):
+        pieces.append((min(CHUNK, count - start), seed + start))
+    return pieces
+
+
+def print_table(title, results, labels):
+    print(f"\n{title}")
+    for pairing, (wins, middle, losses) in results.records.items():
+        total = wins + middle + losses
+        print(f"  {pairing[0]:<15} vs {pairing[1]:<20} "
+              f"{labels[0]} {wins / total:6.1%}  {labels[1]} {middle / total:6.1%}  {labels[2]} {losses / total:6.1%}")
+    print("  move latency (ms)            mean      p50      p90      p99")
+    for name, values in results.latencies.items():
+        mean, p50, p90, p99 = latency_summary(values)
+        print(f"  {name:<25} {mean:8.3f} {p50:8.3f} {p90:8.3f} {p99:8.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pit the AI engines against each other without a camera or window")
+    parser.add_argument('--games', type=int, default=200, help="Tic Tac Toe games per pairing")
+    parser.add_argument('--rounds', type=int, default=2000, help="RPS rounds per strategy and bot")
+    parser.add_argument('--engines', nargs='+', default=list(TTT_ENGINES), choices=list(TTT_ENGINES))
+    parser.add_argument('--strategies', nargs='+', default=list(STRATEGIES), choices=list(STRATEGIES))
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--check', action='store_true', help="Exit 1 if a perfect engine loses")
+    parser.add_argument('--max-p99-ms', type=float, help="With --check, also fail if any p99 move time exceeds this")
+    args = parser.parse_args()
+
+    ttt_jobs = []
+    for i, name_a in enumerate(args.engines):
+        for name_b in args.engines[i:]:
+            for size, seed in chunked(args.games, args.seed):
+                ttt_jobs.append((name_a, name_b, size, seed))
+    rps_jobs = []
+    for strategy in args.strategies:
+        for bot in BOTS:
+            rps_jobs.append((strategy, bot.name, args.rounds, args.seed))
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        ttt = run_tasks(pool, ttt_match, ttt_jobs)
+        rps = run_tasks(pool, rps_match, rps_jobs)
+    elapsed = time.perf_counter() - start
+
+    print_table(f"Tic Tac Toe, {args.games} games per pairing (first engine's view)", ttt, ("win", "draw", "loss"))
+    print_table(f"Rock Paper Scissors, {args.rounds} rounds per match (strategy's view)", rps, ("win", "tie", "loss"))
+    print(f"\n{len(ttt_jobs) + len(rps_jobs)} tasks on {args.workers} workers in {elapsed:.1f}s")
+
+    if args.check:
+        failures = []
+        for (name_a, name_b), (wins, draws, losses) in ttt.records.items():
+            if name_a in PERFECT_ENGINES and losses:
+                failures.append(f"{name_a} lost {losses} games to {name_b}")
+            if name_b in PERFECT_ENGINES and wins:
+                failures.append(f"{name_b} lost {wins} games to {name_a}")
+        if args.max_p99_ms is not None:
+            for results in (ttt, rps):
+                for name, values in results.latencies.items():
+                    p99 = latency_summary(values)[3]
+                    if p99 > args.max_p99_ms:
+                        failures.append(f"{name} p99 move time {p99:.3f}ms over {args.max_p99_ms}ms")
+        for failure in failures:
+            print(f"FAIL: {failure}")
+        sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,100 +1,124 @@
 import random
 
+from bitboard import EMPTY_CELLS, FULL, BitBoard, canonical, winner
+from ttt_table import get_table
+
+# Medium picks at random among this many of the best moves
+MEDIUM_CHOICES = 3
+
 def check_winner(b):
     """Check if there's a winner on the board"""
-    # Check rows
-    for i in range(3):
-        if b[i][0] == b[i][1] == b[i][2] != ' ':
-            return b[i][0]
-    # Check columns
-    for i in range(3):
-        if b[0][i] == b[1][i] == b[2][i] != ' ':
-            return b[0][i]
-    # Check diagonals
-    if b[0][0] == b[1][1] == b[2][2] != ' ':
-        return b[0][0]
-    if b[0][2] == b[1][1] == b[2][0] != ' ':
-        return b[0][2]
-    return None
+    return _as_bitboard(b).winner()
 
 def is_board_full(board):
     """Check if the board is full (tie condition)"""
-    return all(board[i][j] != ' ' for i in range(3) for j in range(3))
+    return _as_bitboard(board).is_full()
+
+def _as_bitboard(board):
+    """Accept a BitBoard or the 3x3 list view"""
+    if isinstance(board, BitBoard):
+        return board
+    return BitBoard.from_lists(board)
+
+def _to_move(index):
+    return (index // 3, index % 3)
+
+# Minimax values keyed on (X to move, canonical position); lives for the whole process
+_transpositions = {}
+# Hard-mode answers keyed on the exact position, so ties still break the same way
+_best_moves = {}
+
+def _minimax(x, o, is_maximizing):
+    # Terminal positions are scored before the table: a board with lines for both
+    # players (only reachable from already-won boards) depends on which line is found first
+    result = winner(x, o)
+    if result == 'X':
+        return 1
+    if result == 'O':
+        return -1
+    occupied = x | o
+    if occupied == FULL:
+        return 0
+
+    key = (is_maximizing, canonical(x, o))
+    score = _transpositions.get(key)
+    if score is not None:
+        return score
+
+    if is_maximizing:
+        score = -2
+        for i in EMPTY_CELLS[occupied]:
+            score = max(score, _minimax(x | 1 << i, o, False))
+    else:
+        score = 2
+        for i in EMPTY_CELLS[occupied]:
+            score = min(score, _minimax(x, o | 1 << i, True))
+
+    _transpositions[key] = score
+    return score
+
+def search_scores(x, o):
+    """Minimax score of X playing each empty cell, keyed by cell index"""
+    return {i: _minimax(x | 1 << i, o, False) for i in EMPTY_CELLS[x | o]}
 
 def call_tt(board):
     """Instant AI move using minimax algorithm (Hard difficulty)"""
-   
-    def minimax(b, is_maximizing):
-        winner = check_winner(b)
-        if winner == 'X':
-            return 1
-        if winner == 'O':
-            return -1
-        if is_board_full(b):
-            return 0
-       
-        if is_maximizing:
-            best_score = -float('inf')
-            for i in range(3):
-                for j in range(3):
-                    if b[i][j] == ' ':
-                        b[i][j] = 'X'
-                        score = minimax(b, False)
-                        b[i][j] = ' '
-                        best_score = max(score, best_score)
-            return best_score
-        else:
-            best_score = float('inf')
-            for i in range(3):
-                for j in range(3):
-                    if b[i][j] == ' ':
-                        b[i][j] = 'O'
-                        score = minimax(b, True)
-                        b[i][j] = ' '
-                        best_score = min(score, best_score)
-            return best_score
-   
-    # Find best move for X
+    bits = _as_bitboard(board)
+    table = get_table()
+    if table is not None:
+        cell = table.best_move(bits.x, bits.o)
+        return None if cell is None else _to_move(cell)
+    return search_tt(bits)
+
+def search_tt(board):
+    """call_tt without the solved table: cached minimax search"""
+    bits = _as_bitboard(board)
+    key = (bits.x, bits.o)
+    if key in _best_moves:
+        return _best_moves[key]
+
+    # Find best move for X, first best in row-major order like before
     best_score = -float('inf')
     best_move = None
-    for i in range(3):
-        for j in range(3):
-            if board[i][j] == ' ':
-                board[i][j] = 'X'
-                score = minimax(board, False)
-                board[i][j] = ' '
-                if score > best_score:
-                    best_score = score
-                    best_move = (i, j)
-   
+    for i in bits.legal_moves():
+        score = _minimax(bits.x | 1 << i, bits.o, False)
+        if score > best_score:
+            best_score = score
+            best_move = _to_move(i)
+
+    _best_moves[key] = best_move
     return best_move
 
+def warm_tt():
+    """Make sure every later hard move is a lookup: map the table, or solve the game"""
+    if get_table() is None:
+        _minimax(0, 0, True)
+        _minimax(0, 0, False)
+
 def easy_tt_random(board):
     """Easy AI move by selecting a random available square"""
-    available_moves = [(i, j) for i in range(3) for j in range(3) if board[i][j] == ' ']
+    available_moves = [_to_move(i) for i in _as_bitboard(board).legal_moves()]
     return random.choice(available_moves) if available_moves else None
 
 def medium_tt(board):
-    """Medium AI move: block opponent's winning move or pick random"""
+    """Medium AI move: block opponent's winning move, else one of the best few"""
+    bits = _as_bitboard(board)
+    moves = bits.legal_moves()
+    if not moves:
+        return None
+
     # Check if O can win next move, block it
-    for i in range(3):
-        for j in range(3):
-            if board[i][j] == ' ':
-                board[i][j] = 'O'
-                if check_winner(board) == 'O':
-                    board[i][j] = ' '
-                    return (i, j)
-                board[i][j] = ' '
-    
+    for i in moves:
+        if winner(bits.x, bits.o | 1 << i) == 'O':
+            return _to_move(i)
+
     # Check if X can win next move, take it
-    for i in range(3):
-        for j in range(3):
-            if board[i][j] == ' ':
-                board[i][j] = 'X'
-                if check_winner(board) == 'X':
-                    board[i][j] = ' '
-                    return (i, j)
-                board[i][j] = ' '
-    
-    # Otherwise, pick random
-    return easy_tt_random(board)
\ No newline at end of file
+    for i in moves:
+        if winner(bits.x | 1 << i, bits.o) == 'X':
+            return _to_move(i)
+
+    # Otherwise, pick among the best few moves so it plays well but not perfectly
+    table = get_table()
+    if table is None:
+        return easy_tt_random(bits)
+    return _to_move(random.choice(table.ranked_moves(bits.x, bits.o)[:MEDIUM_CHOICES]))
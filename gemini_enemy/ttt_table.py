@@ -0,0 +1,149 @@
+# ttt_table.py - Solved 3x3 Tic Tac Toe table: build, lazy mmap load and verify
+#
+#   python gemini_enemy/ttt_table.py build    # write ttt_table.bin
+#   python gemini_enemy/ttt_table.py verify   # check it against the minimax search
+import argparse
+import mmap
+import os
+import sys
+from array import array
+
+from bitboard import EMPTY_CELLS, FULL
+
+TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ttt_table.bin')
+MAGIC = b'TTT1'
+
+# Every board has an entry, indexed in base 3 (cell i is digit i: 0 empty, 1 X, 2 O).
+# An entry is the value for X to move, then the minimax score of X playing each cell.
+POSITIONS = 3 ** 9
+ENTRY_SIZE = 10
+# Score stored for an occupied cell
+OCCUPIED = -128
+
+# Base-3 weight of each 9-bit mask, so index = TERNARY[x] + 2 * TERNARY[o]
+TERNARY = tuple(sum(3 ** i for i in range(9) if mask >> i & 1) for mask in range(FULL + 1))
+
+
+def board_index(x, o):
+    return TERNARY[x] + 2 * TERNARY[o]
+
+
+def index_to_masks(index):
+    x = o = 0
+    for i in range(9):
+        index, digit = divmod(index, 3)
+        if digit == 1:
+            x |= 1 << i
+        elif digit == 2:
+            o |= 1 << i
+    return x, o
+
+
+class SolvedTable:
+    """Read-only view of the table file"""
+
+    def __init__(self, path=TABLE_PATH):
+        with open(path, 'rb') as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.map[:len(MAGIC)] != MAGIC or len(self.map) != len(MAGIC) + POSITIONS * ENTRY_SIZE:
+            self.map.close()
+            raise ValueError(f"{path} is not a Tic Tac Toe table")
+        self.entries = memoryview(self.map)[len(MAGIC):].cast('b')
+
+    def value(self, x, o):
+        """1 if X (to move) wins with perfect play, 0 for a draw, -1 if O wins"""
+        return self.entries[board_index(x, o) * ENTRY_SIZE]
+
+    def move_scores(self, x, o):
+        """Score of X playing each cell, or OCCUPIED"""
+        start = board_index(x, o) * ENTRY_SIZE + 1
+        return self.entries[start:start + 9].tolist()
+
+    def best_move(self, x, o):
+        """First optimal cell in row-major order, or None if the board is full"""
+        start = board_index(x, o) * ENTRY_SIZE
+        value = self.entries[start]
+        for cell in EMPTY_CELLS[x | o]:
+            if self.entries[start + 1 + cell] == value:
+                return cell
+        return None
+
+    def ranked_moves(self, x, o):
+        """Empty cells from best to worst for X; ties stay in row-major order"""
+        scores = self.move_scores(x, o)
+        return sorted(EMPTY_CELLS[x | o], key=lambda cell: -scores[cell])
+
+
+_table = None
+_table_missing = False
+
+
+def get_table():
+    """Map the table on first use; None if it has not been built"""
+    global _table, _table_missing
+    if _table is None and not _table_missing:
+        try:
+            _table = SolvedTable()
+        except (OSError, ValueError):
+            _table_missing = True
+    return _table
+
+
+def build(path=TABLE_PATH):
+    """Solve every board with the minimax search and write the table"""
+    from ttai import search_scores
+
+    entries = array('b', [OCCUPIED]) * (POSITIONS * ENTRY_SIZE)
+    for index in range(POSITIONS):
+        x, o = index_to_masks(index)
+        start = index * ENTRY_SIZE
+        value = 0
+        scores = search_scores(x, o)
+        if scores:
+            value = max(scores.values())
+        for cell, score in scores.items():
+            entries[start + 1 + cell] = score
+        entries[start] = value
+
+    with open(path, 'wb') as f:
+        f.write(MAGIC)
+        entries.tofile(f)
+    return path
+
+
+def verify(path=TABLE_PATH):
+    """Compare every entry against the search call_tt falls back to; returns mismatches"""
+    from ttai import search_scores, search_tt
+    from bitboard import BitBoard
+
+    table = SolvedTable(path)
+    mismatches = 0
+    for index in range(POSITIONS):
+        x, o = index_to_masks(index)
+        scores = search_scores(x, o)
+        expected = search_tt(BitBoard(x, o))
+        move = table.best_move(x, o)
+        actual = None if move is None else (move // 3, move % 3)
+        stored = {cell: score for cell, score in enumerate(table.move_scores(x, o)) if score != OCCUPIED}
+        if actual != expected or stored != scores:
+            mismatches += 1
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or verify the solved Tic Tac Toe table")
+    parser.add_argument('command', choices=('build', 'verify'))
+    parser.add_argument('--path', default=TABLE_PATH)
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        build(args.path)
+        print(f"wrote {args.path} ({os.path.getsize(args.path)} bytes)")
+    else:
+        mismatches = verify(args.path)
+        print(f"{POSITIONS} positions checked, {mismatches} mismatches")
+        sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+# camera.py - Threaded camera capture with a latest-frame ring buffer
+import threading
+import time
+
+import cv2
+import numpy as np
+
+
+class CameraStream:
+    """Read a camera on a background thread so consumers never wait on I/O"""
+
+    def __init__(self, source=0, buffer_size=3):
+        self.source = source
+        self.buffer_size = max(2, buffer_size)
+        # Anything with a VideoCapture-style read() can stand in for a device
+        self.cap = source if hasattr(source, 'read') else cv2.VideoCapture(source)
+
+        # Ring buffer is allocated once the first frame tells us the shape
+        self.frames = None
+        self.timestamps = [0.0] * self.buffer_size
+        self.write_index = -1
+
+        # Frame bookkeeping
+        self.frame_id = 0
+        self.read_id = 0
+        self.dropped_frames = 0
+
+        self.lock = threading.Lock()
+        self.frame_ready = threading.Condition(self.lock)
+        self.running = False
+        # Set once a finite source (a replay) has handed out its last frame
+        self.ended = False
+        self.thread = None
+
+        if self.cap.isOpened():
+            self.start()
+
+    def start(self):
+        """Start the capture thread"""
+        if self.running:
+            return
+        self.running = True
+        self.thread = threading.Thread(target=self._capture_loop, name="CameraStream", daemon=True)
+        self.thread.start()
+
+    def _capture_loop(self):
+        while self.running:
+            if self.frames is None:
+                ret, frame = self.cap.read()
+                if not ret:
+                    if self._source_finished():
+                        break
+                    time.sleep(0.01)
+                    continue
+                self.frames = np.empty((self.buffer_size,) + frame.shape, dtype=frame.dtype)
+                slot = 0
+                self.frames[slot] = frame
+            else:
+                # Write straight into the next slot, never the one consumers read
+                slot = (self.write_index + 1) % self.buffer_size
+                target = self.frames[slot]
+                ret, frame = self.cap.read(target)
+                if not ret:
+                    if self._source_finished():
+                        break
+                    time.sleep(0.01)
+                    continue
+                # A matching frame was decoded in place; anything else came back in a new array
+                if frame is not target:
+                    if frame.shape == self.frames.shape[1:] and frame.dtype == self.frames.dtype:
+                        target[...] = frame
+                    else:
+                        self._reallocate(frame)
+
+            with self.lock:
+                if self.read_id < self.frame_id:
+                    self.dropped_frames += 1
+                self.write_index = slot
+                self.timestamps[slot] = time.perf_counter()
+                self.frame_id += 1
+                self.frame_ready.notify_all()
+
+    def _source_finished(self):
+        """A replay that has run out stops the thread; a camera that hiccups is retried"""
+        if not getattr(self.cap, 'finished', False):
+            return False
+        with self.frame_ready:
+            self.ended = True
+            self.frame_ready.notify_all()
+        return True
+
+    def _reallocate(self, frame):
+        """The source changed resolution; rebuild the ring around the new frame shape"""
+        print(f"Camera frame changed from {self.frames.shape[1:]} to {frame.shape}; resizing the frame buffer")
+        frames = np.empty((self.buffer_size,) + frame.shape, dtype=frame.dtype)
+        # Every slot holds the new frame, so whichever slot a reader picks is valid
+        frames[:] = frame
+        with self.lock:
+            self.frames = frames
+
+    def read_latest(self, image=None):
+        """Return (frame, timestamp, frame_id) for the newest frame without blocking"""
+        with self.lock:
+            if self.write_index < 0:
+                return None, 0.0, 0
+            slot = self.write_index
+            if image is not None and image.shape == self.frames.shape[1:]:
+                np.copyto(image, self.frames[slot])
+                frame = image
+            else:
+                frame = self.frames[slot].copy()
+            self.read_id = self.frame_id
+            return frame, self.timestamps[slot], self.frame_id
+
+    def wait_for_frame(self, last_id, timeout=None):
+        """Block until a frame newer than last_id arrives; return the newest id"""
+        with self.frame_ready:
+            self.frame_ready.wait_for(lambda: self.frame_id != last_id or not self.running, timeout)
+            return self.frame_id
+
+    def read(self, image=None):
+        """cv2.VideoCapture compatible read that returns the newest frame"""
+        frame, _, _ = self.read_latest(image)
+        return frame is not None, frame
+
+    @property
+    def latest_timestamp(self):
+        with self.lock:
+            if self.write_index < 0:
+                return 0.0
+            return self.timestamps[self.write_index]
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def release(self):
+        """Stop the capture thread and release the device"""
+        with self.frame_ready:
+            self.running = False
+            self.frame_ready.notify_all()
+        if self.thread and self.thread is not threading.current_thread():
+            self.thread.join(timeout=1.0)
+        self.thread = None
+        self.cap.release()
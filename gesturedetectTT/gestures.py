@@ -1,7 +1,20 @@
+# Bone connections between the 21 MediaPipe hand landmarks
+HAND_CONNECTIONS = (
+    (0, 1), (1, 2), (2, 3), (3, 4),
+    (0, 5), (5, 6), (6, 7), (7, 8),
+    (5, 9), (9, 10), (10, 11), (11, 12),
+    (9, 13), (13, 14), (14, 15), (15, 16),
+    (13, 17), (17, 18), (18, 19), (19, 20), (0, 17)
+)
+
 def get_hand_landmarks(hand):
     """Extract landmarks once to avoid redundant processing"""
     return [(p.x, p.y, p.z) for p in hand.landmark]
 
+def crop_landmarks(landmarks, width, height, size):
+    """Re-normalize full frame landmarks to the top-left size x size crop"""
+    return [(x * width / size, y * height / size, z) for x, y, z in landmarks]
+
 def rock(landmarks):
     index_tip, middle_tip, ring_tip, pinky_tip = landmarks[8], landmarks[12], landmarks[16], landmarks[20]
     index_base, middle_base, ring_base, pinky_base = landmarks[5], landmarks[9], landmarks[13], landmarks[17]
@@ -71,4 +84,20 @@ def o_sign(landmarks):
         x = (thumb_tip[0] + index_tip[0]) / 2
         y = (thumb_tip[1] + index_tip[1]) / 2
         return True, x, y
-    return False, None, None
\ No newline at end of file
+    return False, None, None
+
+def detect_gesture(landmarks):
+    """Return the first matching gesture name in priority order, or None"""
+    if not landmarks:
+        return None
+    
+    is_o, _, _ = o_sign(landmarks)
+    if is_o:
+        return "o_sign"
+    elif scissors(landmarks):
+        return "scissors"
+    elif paper(landmarks):
+        return "paper"
+    elif rock(landmarks):
+        return "rock"
+    return None
@@ -1,26 +1,31 @@
-import cv2
-import mediapipe as mp
 import pygame
 
+from gestures import detect_gesture
+from profiler import get_profiler
+from vision import MENU_CONFIG, get_vision_service
+
 class HandTracker:
-    def __init__(self, window_width, window_height):
+    def __init__(self, window_width, window_height, backend=None, render_text=None, glow_surface=None):
         self.window_width = window_width
         self.window_height = window_height
         
-        # Initialize camera and MediaPipe
-        self.cap = cv2.VideoCapture(0)
-        self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            max_num_hands=1,
-            min_detection_confidence=0.7,
-            min_tracking_confidence=0.7
-        )
-        self.mp_draw = mp.solutions.drawing_utils
+        # The UI passes its shared text cache; standalone use keeps its own fonts
+        self.render_text = render_text or self.render_label
+        self.fonts = {}
+        # Likewise its cached effect surfaces for the indicator glow
+        self.glow_surface = glow_surface or self.build_glow
+        
+        # Subscribe to the shared camera and hand model
+        service = get_vision_service()
+        if backend:
+            service.set_backend(backend)
+        self.vision = service.subscribe("menu", **MENU_CONFIG)
         
         # Hand data
         self.landmarks = None
         self.hand_detected = False
         self.current_gesture = None
+        self.last_frame_id = 0
 
         self.prev_gesture = None
         self.gesture_stable_frames = 0
@@ -30,76 +35,6 @@ class HandTracker:
         self.smoothed_pos = None
         self.smoothing_factor = 0.3  # Lower = smoother but more lag
         
-    def get_hand_landmarks(self, hand):
-        """Extract landmarks once to avoid redundant processing"""
-        return [(p.x, p.y, p.z) for p in hand.landmark]
-    
-    def rock(self, landmarks):
-        index_tip, middle_tip, ring_tip, pinky_tip = landmarks[8], landmarks[12], landmarks[16], landmarks[20]
-        index_base, middle_base, ring_base, pinky_base = landmarks[5], landmarks[9], landmarks[13], landmarks[17]
-        
-        all_contracted = (
-            index_tip[1] > index_base[1] and
-            middle_tip[1] > middle_base[1] and
-            ring_tip[1] > ring_base[1] and
-            pinky_tip[1] > pinky_base[1]
-        )
-        return all_contracted
-
-    def paper(self, landmarks):
-        thumb_tip, index_tip, middle_tip, ring_tip, pinky_tip = landmarks[4], landmarks[8], landmarks[12], landmarks[16], landmarks[20]
-        thumb_base, index_base, middle_base, ring_base, pinky_base = landmarks[2], landmarks[5], landmarks[9], landmarks[13], landmarks[17]
-        
-        all_extended = (
-            thumb_tip[1] < thumb_base[1] and
-            index_tip[1] < index_base[1] and
-            middle_tip[1] < middle_base[1] and
-            ring_tip[1] < ring_base[1] and
-            pinky_tip[1] < pinky_base[1]
-        )
-        return all_extended
-
-    def scissors(self, landmarks):
-        index_tip = landmarks[8]
-        middle_tip = landmarks[12]
-        ring_tip = landmarks[16]
-        pinky_tip = landmarks[20]
-        
-        ring_base = landmarks[13]
-        pinky_base = landmarks[17]
-        
-        distance = ((index_tip[0] - middle_tip[0])**2 + (index_tip[1] - middle_tip[1])**2)**0.5
-        
-        fingers_separated = distance > 0.1
-        other_fingers_curled = ring_tip[1] > ring_base[1] and pinky_tip[1] > pinky_base[1]
-        
-        return fingers_separated and other_fingers_curled
-
-    def o_sign(self, landmarks):
-        thumb_tip = landmarks[4]
-        index_tip = landmarks[8]
-        middle_tip = landmarks[12]
-        ring_tip = landmarks[16]
-        pinky_tip = landmarks[20]
-        
-        distance = ((thumb_tip[0] - index_tip[0])**2 + (thumb_tip[1] - index_tip[1])**2)**0.5
-        
-        middle_base = landmarks[9]
-        ring_base = landmarks[13]
-        pinky_base = landmarks[17]
-        
-        other_fingers_extended = (
-            middle_tip[1] < middle_base[1] and
-            ring_tip[1] < ring_base[1] and
-            pinky_tip[1] < pinky_base[1]
-        )
-        
-        if distance < 0.07 and other_fingers_extended:
-            x = (thumb_tip[0] + index_tip[0]) / 2
-            y = (thumb_tip[1] + index_tip[1]) / 2
-            return True, x, y
-        return False, None, None
-    
     def get_index_finger_pos(self, smooth=True):
         """Get pygame coordinates of index finger tip"""
         if self.landmarks:
@@ -124,20 +59,7 @@ class HandTracker:
 
     def detect_gesture(self):
         """Detect which gesture is being made"""
-        if not self.landmarks:
-            return None
-        
-        # Check gestures in priority order
-        is_o, o_x, o_y = self.o_sign(self.landmarks)
-        if is_o:
-            return "o_sign"
-        elif self.scissors(self.landmarks):
-            return "scissors"
-        elif self.paper(self.landmarks):
-            return "paper"
-        elif self.rock(self.landmarks):
-            return "rock"
-        return None
+        return detect_gesture(self.landmarks)
     
     def is_click_gesture(self):
         """Check if o_sign gesture just started (rising edge detection)"""
@@ -153,31 +75,28 @@ class HandTracker:
         return False
     
     def update(self):
-        """Process camera frame and detect hand"""
-        ret, frame = self.cap.read()
-        if not ret:
+        """Pick up the latest hand state from the vision pipeline"""
+        profiler = get_profiler()
+        started = profiler.start()
+        self._update()
+        profiler.stop("hand_tracker", started)
+
+    def _update(self):
+        state = self.vision.read()
+        if state is None:
             self.hand_detected = False
             return
         
-        # Flip frame horizontally for mirror effect
-        frame = cv2.flip(frame, 1)
-        
-        # Convert BGR to RGB for MediaPipe
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.hands.process(rgb_frame)
+        # Only advance once per camera frame, not per render frame
+        if state.frame_id == self.last_frame_id:
+            return
+        self.last_frame_id = state.frame_id
         
         # Reset data
-        self.hand_detected = False
-        self.landmarks = None
         prev_gesture = self.current_gesture
-        self.current_gesture = None
-        
-        if results.multi_hand_landmarks:
-            for hand in results.multi_hand_landmarks:
-                self.hand_detected = True
-                self.landmarks = self.get_hand_landmarks(hand)
-                self.current_gesture = self.detect_gesture()
-                break  # Only process first hand
+        self.hand_detected = state.landmarks is not None
+        self.landmarks = state.landmarks
+        self.current_gesture = state.gesture
         
         # Track gesture stability
         if self.current_gesture == prev_gesture:
@@ -191,7 +110,7 @@ class HandTracker:
             self.click_cooldown -= 1
             
     def draw_indicator(self, surface):
-        """Draw indicator at index finger position"""
+        """Draw indicator at index finger position; returns the area drawn, or None"""
         pos = self.get_index_finger_pos()
         if pos:
             x, y = pos
@@ -205,13 +124,14 @@ class HandTracker:
             }
             color = colors.get(self.current_gesture, (52, 152, 219))
             
+            # The outermost glow ring bounds the dot
+            area = pygame.Rect(x - 30, y - 30, 60, 60)
+            
             # Draw outer glow
             for i in range(3, 0, -1):
                 alpha = 100 - (i * 30)
                 radius = 15 + (i * 5)
-                glow_surface = pygame.Surface((radius*2, radius*2), pygame.SRCALPHA)
-                pygame.draw.circle(glow_surface, (*color, alpha), (radius, radius), radius)
-                surface.blit(glow_surface, (x - radius, y - radius))
+                surface.blit(self.glow_surface(radius, (*color, alpha)), (x - radius, y - radius))
             
             # Draw main dot
             pygame.draw.circle(surface, color, (x, y), 10)
@@ -220,20 +140,41 @@ class HandTracker:
             
             # Draw gesture name
             if self.current_gesture:
-                font = pygame.font.Font(None, 24)
-                text = font.render(self.current_gesture.upper(), True, (255, 255, 255))
-                surface.blit(text, (x + 15, y - 10))
+                text = self.render_text(self.current_gesture.upper(), 24, (255, 255, 255))
+                area.union_ip(surface.blit(text, (x + 15, y - 10)))
+            return area
+        return None
+    
+    def render_label(self, text, size, color):
+        """Fallback text renderer: one Font per size, rendered every call"""
+        font = self.fonts.get(size)
+        if font is None:
+            font = pygame.font.Font(None, size)
+            self.fonts[size] = font
+        return font.render(text, True, color)
+    
+    @staticmethod
+    def build_glow(radius, color):
+        """Fallback glow: a translucent disc drawn on a new surface every call"""
+        glow = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(glow, color, (radius, radius), radius)
+        return glow
     
     def cleanup(self):
-        """Release camera resources"""
-        self.cap.release()
+        """Release our hold on the shared camera"""
+        self.vision.release()
     
 
-def setup_hand_tracking(main_menu):
+def setup_hand_tracking(main_menu, backend=None, render_text=None, glow_surface=None):
     """Initialize hand tracking for the main menu"""
+    if hasattr(main_menu, 'hand_tracker'):
+        return
     main_menu.hand_tracker = HandTracker(
         main_menu.WINDOW_WIDTH,
-        main_menu.WINDOW_HEIGHT
+        main_menu.WINDOW_HEIGHT,
+        backend,
+        render_text,
+        glow_surface
     )
 
 def update_hand_tracking(main_menu):
@@ -254,9 +195,10 @@ def get_current_gesture(main_menu):
     return None
 
 def draw_hand_indicator(main_menu):
-    """Draw hand tracking indicator"""
+    """Draw hand tracking indicator; returns the area drawn, or None"""
     if hasattr(main_menu, 'hand_tracker'):
-        main_menu.hand_tracker.draw_indicator(main_menu.screen)
+        return main_menu.hand_tracker.draw_indicator(main_menu.screen)
+    return None
 
 def cleanup_hand_tracking(main_menu):
     """Clean up hand tracking resources"""
@@ -267,4 +209,9 @@ def is_hand_click(main_menu):
     """Check if hand made a click gesture"""
     if hasattr(main_menu, 'hand_tracker'):
         return main_menu.hand_tracker.is_click_gesture()
-    return False
\ No newline at end of file
+    return False
+
+def set_hand_tracking_fidelity(main_menu, level):
+    """Tell the vision service how much input the menu needs (see scheduler.py)"""
+    if hasattr(main_menu, 'hand_tracker'):
+        main_menu.hand_tracker.vision.set_fidelity(level)
@@ -0,0 +1,269 @@
+# inference_backend.py - Where MediaPipe Hands actually runs
+import multiprocessing as mp_proc
+import os
+import threading
+import traceback
+from multiprocessing import shared_memory
+
+import numpy as np
+
+THREAD_BACKEND = "thread"
+PROCESS_BACKEND = "process"
+
+DEFAULT_BACKEND = os.environ.get("GESTURE_BACKEND", THREAD_BACKEND)
+# Times a dead process worker is restarted before inference moves into this process
+MAX_RESTARTS = 2
+
+
+def _config_key(config):
+    return tuple(sorted(config.items()))
+
+
+def _build_model(config):
+    import mediapipe as mp
+    return mp.solutions.hands.Hands(static_image_mode=False, **config)
+
+
+def _extract_hand(results):
+    """Reduce MediaPipe results to a (21, 3) float32 array, handedness label and score"""
+    if not results.multi_hand_landmarks:
+        return None, None, None
+    hand = results.multi_hand_landmarks[0]
+    landmarks = np.array([(p.x, p.y, p.z) for p in hand.landmark], dtype=np.float32)
+    handedness, score = None, None
+    if results.multi_handedness:
+        classification = results.multi_handedness[0].classification[0]
+        handedness, score = classification.label, classification.score
+    return landmarks, handedness, score
+
+
+class ThreadBackend:
+    """Run Hands in this process; models are cached per settings"""
+
+    name = THREAD_BACKEND
+
+    def __init__(self):
+        self.models = {}
+        self.model = None
+
+    def preload(self, config):
+        key = _config_key(config)
+        if key not in self.models:
+            self.models[key] = _build_model(config)
+        return self.models[key]
+
+    def configure(self, config):
+        self.model = self.preload(config)
+
+    def process(self, rgb_frame, frame_id=None):
+        """Return (landmarks, handedness, score) for the first hand in the frame; frame_id is unused"""
+        if self.model is None:
+            return None, None, None
+        return _extract_hand(self.model.process(rgb_frame))
+
+    def close(self):
+        for model in self.models.values():
+            model.close()
+        self.models = {}
+        self.model = None
+
+
+class InferenceError(RuntimeError):
+    """The inference worker failed on a request; the message carries its traceback"""
+
+
+def _inference_worker(conn):
+    """Child process loop: read frames from shared memory, send back landmarks"""
+    models = {}
+    model = None
+    buffers = {}
+
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            # The parent went away
+            break
+        command = message[0]
+        if command == "close":
+            break
+
+        # A failing request gets an error reply; the worker keeps serving
+        try:
+            if command == "frame":
+                _, shm_name, shape = message
+                if shm_name not in buffers:
+                    # The parent reallocated; drop the old mapping
+                    for buffer in buffers.values():
+                        buffer.close()
+                    buffers = {shm_name: shared_memory.SharedMemory(name=shm_name)}
+                # The buffer may be larger than this frame; use its prefix
+                frame = np.ndarray(shape, dtype=np.uint8, buffer=buffers[shm_name].buf)
+                reply = (None, None, None) if model is None else _extract_hand(model.process(frame))
+
+            elif command in ("configure", "preload"):
+                config = message[1]
+                key = _config_key(config)
+                if key not in models:
+                    models[key] = _build_model(config)
+                if command == "configure":
+                    model = models[key]
+                reply = True
+
+            else:
+                raise ValueError(f"Unknown inference command: {command}")
+        except Exception:
+            reply = InferenceError(traceback.format_exc())
+        conn.send(reply)
+
+    for buffer in buffers.values():
+        buffer.close()
+    for cached in models.values():
+        cached.close()
+    conn.close()
+
+
+class ProcessBackend:
+    """Run Hands in a child process so it never competes for our GIL
+
+    A worker that dies is restarted up to MAX_RESTARTS times with the same settings;
+    after that inference falls back to a ThreadBackend in this process.
+    """
+
+    name = PROCESS_BACKEND
+
+    def __init__(self):
+        self.context = mp_proc.get_context("spawn")
+        self.conn = None
+        self.process_handle = None
+        self.restarts = 0
+        self.fallback = None
+        # Settings to replay into a restarted worker
+        self.preloaded = {}
+        self.config = None
+
+        # Frames are copied into shared memory rather than pickled
+        self.shm = None
+        self.lock = threading.Lock()
+        self._start_worker()
+
+    def _start_worker(self):
+        self.conn, child_conn = self.context.Pipe()
+        self.process_handle = self.context.Process(target=_inference_worker, args=(child_conn,),
+                                                   name="HandInference", daemon=True)
+        self.process_handle.start()
+        child_conn.close()
+
+    def _stop_worker(self):
+        if self.process_handle.is_alive():
+            self.process_handle.terminate()
+            self.process_handle.join(timeout=2.0)
+        self.conn.close()
+
+    def _request(self, *message):
+        self.conn.send(message)
+        reply = self.conn.recv()
+        if isinstance(reply, InferenceError):
+            raise reply
+        return reply
+
+    def _recover(self, error):
+        """Replace a dead worker, or switch to in-process inference once restarts run out"""
+        while True:
+            print(f"Hand inference worker died ({type(error).__name__}: {error})")
+            self._stop_worker()
+            if self.restarts >= MAX_RESTARTS:
+                print("Hand inference falls back to the thread backend")
+                self.fallback = ThreadBackend()
+                for config in self.preloaded.values():
+                    self.fallback.preload(config)
+                if self.config is not None:
+                    self.fallback.configure(self.config)
+                return
+            self.restarts += 1
+            print(f"Restarting hand inference worker ({self.restarts}/{MAX_RESTARTS})")
+            self._start_worker()
+            try:
+                for config in self.preloaded.values():
+                    self._request("preload", config)
+                if self.config is not None:
+                    self._request("configure", self.config)
+                return
+            except (EOFError, OSError) as e:
+                error = e
+
+    def _run(self, remote, local):
+        """remote() against the worker, retried after recovery; local(fallback) once it has fallen back"""
+        while self.fallback is None:
+            try:
+                return remote()
+            except (EOFError, OSError) as e:
+                # EOFError, BrokenPipeError and ConnectionResetError all mean the child is gone
+                self._recover(e)
+        return local(self.fallback)
+
+    def preload(self, config):
+        config = dict(config)
+        with self.lock:
+            self._run(lambda: self._request("preload", config), lambda backend: backend.preload(config))
+            # Only settings that loaded are replayed after a restart
+            self.preloaded[_config_key(config)] = config
+
+    def configure(self, config):
+        config = dict(config)
+        with self.lock:
+            self._run(lambda: self._request("configure", config), lambda backend: backend.configure(config))
+            self.config = config
+
+    def _ensure_buffer(self, nbytes):
+        # Only grow, so ROI crops of varying size reuse the same block
+        if self.shm is not None and self.shm.size >= nbytes:
+            return
+        if self.shm:
+            self.shm.close()
+            self.shm.unlink()
+        self.shm = shared_memory.SharedMemory(create=True, size=nbytes)
+
+    def _process_remote(self, rgb_frame):
+        self._ensure_buffer(rgb_frame.nbytes)
+        view = np.ndarray(rgb_frame.shape, dtype=np.uint8, buffer=self.shm.buf)
+        np.copyto(view, rgb_frame)
+        del view
+        return self._request("frame", self.shm.name, rgb_frame.shape)
+
+    def process(self, rgb_frame, frame_id=None):
+        """Return (landmarks, handedness, score) for the first hand in the frame; frame_id is unused"""
+        with self.lock:
+            return self._run(lambda: self._process_remote(rgb_frame),
+                             lambda backend: backend.process(rgb_frame))
+
+    def close(self):
+        with self.lock:
+            self._shutdown()
+
+    def _shutdown(self):
+        if self.fallback:
+            self.fallback.close()
+        if self.process_handle.is_alive():
+            try:
+                self.conn.send(("close",))
+            except (BrokenPipeError, OSError):
+                pass
+            self.process_handle.join(timeout=2.0)
+            if self.process_handle.is_alive():
+                self.process_handle.terminate()
+        self.conn.close()
+        if self.shm:
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
+
+
+def make_backend(name=None):
+    """Create an inference backend by name ('thread' or 'process')"""
+    name = name or DEFAULT_BACKEND
+    if name == THREAD_BACKEND:
+        return ThreadBackend()
+    if name == PROCESS_BACKEND:
+        return ProcessBackend()
+    raise ValueError(f"Unknown inference backend: {name}")
@@ -0,0 +1,233 @@
+# pipeline.py - Threaded capture -> preprocess -> inference -> classify pipeline
+import collections
+import threading
+import time
+
+import cv2
+
+from gestures import crop_landmarks, detect_gesture
+from profiler import get_profiler
+from roi_tracker import RoiTracker
+from scheduler import FIDELITY_PRESENCE, InferenceScheduler
+
+# Back-pressure policies for the queues between stages
+DROP_OLDEST = "drop_oldest"
+BLOCK = "block"
+
+
+class StageQueue:
+    """Bounded hand-off between two stages"""
+
+    def __init__(self, maxsize=1, policy=DROP_OLDEST):
+        if policy not in (DROP_OLDEST, BLOCK):
+            raise ValueError(f"Unknown back-pressure policy: {policy}")
+        self.maxsize = max(1, maxsize)
+        self.policy = policy
+        self.items = collections.deque()
+        self.dropped = 0
+        self.closed = False
+        self.cond = threading.Condition()
+
+    def put(self, item):
+        with self.cond:
+            if self.policy == BLOCK:
+                self.cond.wait_for(lambda: len(self.items) < self.maxsize or self.closed)
+            elif len(self.items) >= self.maxsize:
+                self.items.popleft()
+                self.dropped += 1
+            if self.closed:
+                return
+            self.items.append(item)
+            self.cond.notify_all()
+
+    def get(self, timeout=None):
+        """Return the next item, or None once the queue is closed"""
+        with self.cond:
+            self.cond.wait_for(lambda: self.items or self.closed, timeout)
+            if not self.items:
+                return None
+            item = self.items.popleft()
+            self.cond.notify_all()
+            return item
+
+    def close(self):
+        with self.cond:
+            self.closed = True
+            self.items.clear()
+            self.cond.notify_all()
+
+
+class StageStats:
+    """Rolling latency numbers for one pipeline stage"""
+
+    def __init__(self, name):
+        self.name = name
+        # Samples also go to the frame profiler under this name while it is recording
+        self.profile_name = "vision." + name
+        self.profiler = get_profiler()
+        self.count = 0
+        self.last_ms = 0.0
+        self.avg_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, seconds):
+        ms = seconds * 1000.0
+        self.count += 1
+        self.last_ms = ms
+        self.max_ms = max(self.max_ms, ms)
+        # Exponential moving average keeps this O(1)
+        self.avg_ms = ms if self.count == 1 else self.avg_ms * 0.9 + ms * 0.1
+        self.profiler.record(self.profile_name, seconds)
+
+    def __repr__(self):
+        return f"{self.name}: avg {self.avg_ms:.2f}ms last {self.last_ms:.2f}ms max {self.max_ms:.2f}ms"
+
+
+class HandState:
+    """Result of running one camera frame through the pipeline"""
+
+    def __init__(self, frame_id, timestamp, frame):
+        self.frame_id = frame_id
+        self.timestamp = timestamp
+        self.frame = frame            # Mirrored BGR frame
+        self.rgb = None               # Mirrored RGB frame fed to the model
+        self.landmarks = None         # 21 (x, y, z) tuples normalized to the full frame
+        self.square_landmarks = None  # Same landmarks normalized to the top-left square crop
+        self.handedness = None
+        self.score = None
+        self.gesture = None
+        self.completed = 0.0
+
+    @property
+    def latency(self):
+        """Seconds from capture to classification"""
+        return self.completed - self.timestamp
+
+
+class HandPipeline:
+    """Run each stage on its own worker so the render loop only reads results"""
+
+    STAGES = ("capture", "preprocess", "inference", "classify")
+
+    def __init__(self, camera, backend, queue_size=1, policy=DROP_OLDEST, roi_tracking=False,
+                 scheduler=None, recorder=None):
+        self.camera = camera
+        self.backend = backend
+        self.recorder = recorder
+        self.roi_tracker = RoiTracker() if roi_tracking else None
+        self.scheduler = scheduler or InferenceScheduler()
+        self.last_result = (None, None, None)
+        self.last_error = None
+        self.queues = [StageQueue(queue_size, policy) for _ in range(3)]
+        self.stats = {name: StageStats(name) for name in self.STAGES}
+
+        self.latest = None
+        self.result_ready = threading.Condition()
+        self.running = False
+        self.threads = []
+
+    def start(self):
+        if self.running:
+            return
+        self.running = True
+        workers = [self._capture, self._preprocess, self._inference, self._classify]
+        for name, worker in zip(self.STAGES, workers):
+            thread = threading.Thread(target=worker, name=f"HandPipeline-{name}", daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    def stop(self):
+        self.running = False
+        for queue in self.queues:
+            queue.close()
+        for thread in self.threads:
+            thread.join(timeout=1.0)
+        self.threads = []
+
+    def _capture(self):
+        last_id = 0
+        while self.running:
+            if self.camera.wait_for_frame(last_id, timeout=0.1) == last_id:
+                continue
+            start = time.perf_counter()
+            frame, timestamp, last_id = self.camera.read_latest()
+            if frame is None:
+                continue
+            self.stats["capture"].record(time.perf_counter() - start)
+            self.queues[0].put(HandState(last_id, timestamp, frame))
+
+    def _preprocess(self):
+        while self.running:
+            state = self.queues[0].get(timeout=0.1)
+            if state is None:
+                continue
+            start = time.perf_counter()
+            state.frame = cv2.flip(state.frame, 1)
+            state.rgb = cv2.cvtColor(state.frame, cv2.COLOR_BGR2RGB)
+            self.stats["preprocess"].record(time.perf_counter() - start)
+            self.queues[1].put(state)
+
+    def _inference(self):
+        while self.running:
+            state = self.queues[1].get(timeout=0.1)
+            if state is None:
+                continue
+            if not self.scheduler.should_run():
+                # Presence mode keeps showing the last result between its low-rate runs
+                if self.scheduler.level != FIDELITY_PRESENCE:
+                    self.last_result = (None, None, None)
+                if self.roi_tracker:
+                    self.roi_tracker.reset()
+                landmarks, state.handedness, state.score = self.last_result
+                self.queues[2].put((state, landmarks))
+                continue
+
+            start = time.perf_counter()
+            try:
+                if self.roi_tracker:
+                    landmarks, state.handedness, state.score = self.roi_tracker.process(self.backend, state.rgb)
+                else:
+                    landmarks, state.handedness, state.score = self.backend.process(state.rgb, state.frame_id)
+            except Exception as e:
+                # Keep frames flowing so screens stay live; they see no hand until inference recovers
+                self.report_error(e)
+                landmarks, state.handedness, state.score = None, None, None
+                if self.roi_tracker:
+                    self.roi_tracker.reset()
+            self.last_result = (landmarks, state.handedness, state.score)
+            self.stats["inference"].record(time.perf_counter() - start)
+            self.queues[2].put((state, landmarks))
+
+    def report_error(self, error):
+        """Print an inference failure, once per distinct message"""
+        message = f"{type(error).__name__}: {error}"
+        if message != self.last_error:
+            self.last_error = message
+            print(f"Hand inference failed: {message}")
+
+    def _classify(self):
+        while self.running:
+            item = self.queues[2].get(timeout=0.1)
+            if item is None:
+                continue
+            state, landmarks = item
+            start = time.perf_counter()
+            if landmarks is not None:
+                state.landmarks = landmarks.tolist()
+                h, w, _ = state.frame.shape
+                state.square_landmarks = crop_landmarks(state.landmarks, w, h, min(h, w))
+                state.gesture = detect_gesture(state.landmarks)
+            state.completed = time.perf_counter()
+            self.stats["classify"].record(state.completed - start)
+            if self.recorder:
+                self.recorder.record(state)
+            with self.result_ready:
+                self.latest = state
+                self.result_ready.notify_all()
+
+    def wait_for_result(self, last_id, timeout=None):
+        """Block until a result for a frame newer than last_id is out; return it (or None on timeout)"""
+        with self.result_ready:
+            self.result_ready.wait_for(
+                lambda: self.latest is not None and self.latest.frame_id != last_id, timeout)
+            return self.latest
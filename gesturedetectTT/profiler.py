@@ -0,0 +1,188 @@
+# profiler.py - Per-stage frame timing with rolling windows, an on-screen overlay and CSV/JSON dumps
+import json
+import os
+import threading
+import time
+
+import numpy as np
+
+# Samples kept per stage; about four seconds at 60 FPS
+WINDOW = 256
+# Histogram bin edges in milliseconds for the dump; the last bin catches everything slower
+BIN_EDGES_MS = (0, 1, 2, 4, 8, 12, 16.7, 25, 33.3, 50, 100, float('inf'))
+MAX_STAGES = 32
+# Set to a path prefix to record from startup and write <prefix>.csv / <prefix>.json on exit
+PROFILE_PATH = os.environ.get("GESTURE_PROFILE")
+DEFAULT_DUMP_PREFIX = "frame_profile"
+
+OVERLAY_BG = (0, 0, 0, 170)
+OVERLAY_TEXT = (230, 230, 230)
+OVERLAY_SLOW = (255, 120, 90)
+
+
+class FrameProfiler:
+    """Time named stages into fixed ring buffers; start() and stop() do nothing while disabled"""
+
+    def __init__(self, window=WINDOW, enabled=False):
+        self.window = window
+        self.enabled = enabled
+        self.overlay = False
+        # One row of samples (seconds) per stage, allocated once
+        self.samples = np.zeros((MAX_STAGES, window), dtype=np.float64)
+        self.counts = np.zeros(MAX_STAGES, dtype=np.int64)
+        self.stages = {}
+        self.names = []
+        self.last_frame = None
+        self.font = None
+        self.panel = None
+        # Stage registration can race between the render loop and the pipeline threads
+        self.lock = threading.Lock()
+
+    def slot(self, name):
+        index = self.stages.get(name)
+        if index is None:
+            with self.lock:
+                index = self.stages.get(name)
+                if index is None:
+                    if len(self.names) == MAX_STAGES:
+                        raise ValueError(f"more than {MAX_STAGES} profiler stages")
+                    index = len(self.names)
+                    self.names.append(name)
+                    self.stages[name] = index
+        return index
+
+    def start(self):
+        """Timestamp to pass to stop(); 0.0 while disabled"""
+        return time.perf_counter() if self.enabled else 0.0
+
+    def stop(self, name, started):
+        if self.enabled and started:
+            self.record(name, time.perf_counter() - started)
+
+    def record(self, name, seconds):
+        """Add one sample; safe to call from the pipeline threads"""
+        if not self.enabled:
+            return
+        index = self.slot(name)
+        count = self.counts[index]
+        self.samples[index, count % self.window] = seconds
+        self.counts[index] = count + 1
+
+    def frame(self):
+        """Call once per rendered frame; frame-to-frame time gives the FPS"""
+        if not self.enabled:
+            self.last_frame = None
+            return
+        now = time.perf_counter()
+        if self.last_frame is not None:
+            self.record("frame", now - self.last_frame)
+        self.last_frame = now
+
+    def toggle_overlay(self):
+        """Show or hide the overlay; recording runs while it is shown, or always with GESTURE_PROFILE"""
+        self.overlay = not self.overlay
+        self.enabled = self.overlay or PROFILE_PATH is not None
+        if not self.enabled:
+            self.last_frame = None
+
+    def window_of(self, index):
+        count = min(self.counts[index], self.window)
+        return self.samples[index, :count]
+
+    def summary(self):
+        """{stage: {count, mean_ms, p50_ms, p95_ms, max_ms}} over the rolling window"""
+        result = {}
+        for index, name in enumerate(self.names):
+            window = self.window_of(index) * 1000.0
+            if not len(window):
+                continue
+            p50, p95 = np.percentile(window, (50, 95))
+            result[name] = {
+                'count': int(self.counts[index]),
+                'mean_ms': float(window.mean()),
+                'p50_ms': float(p50),
+                'p95_ms': float(p95),
+                'max_ms': float(window.max()),
+            }
+        return result
+
+    def fps(self):
+        index = self.stages.get("frame")
+        if index is None:
+            return 0.0
+        window = self.window_of(index)
+        return len(window) / window.sum() if window.sum() > 0 else 0.0
+
+    def histograms(self):
+        """Counts per BIN_EDGES_MS bin for each stage's rolling window"""
+        return {name: np.histogram(self.window_of(index) * 1000.0, bins=BIN_EDGES_MS)[0].tolist()
+                for index, name in enumerate(self.names)}
+
+    def render_line(self, text, size, color):
+        """Render with the profiler's own font; the numbers change every frame, so caching them
+        would only churn the shared text cache"""
+        if self.font is None:
+            import pygame
+            self.font = pygame.font.Font(None, size)
+        return self.font.render(text, True, color)
+
+    def draw_overlay(self, surface):
+        """Per-stage mean and p95 with the FPS in the top-left corner; returns the area drawn"""
+        if not self.overlay:
+            return None
+        import pygame
+
+        summary = self.summary()
+        lines = [(f"FPS {self.fps():5.1f}", OVERLAY_TEXT)]
+        for name, stats in summary.items():
+            # Anything over a 60 FPS frame budget stands out
+            color = OVERLAY_SLOW if stats['p95_ms'] > 16.7 and name != "frame" else OVERLAY_TEXT
+            lines.append((f"{name:<16} {stats['mean_ms']:6.2f} ms  p95 {stats['p95_ms']:6.2f}", color))
+
+        line_height = 20
+        size = (330, line_height * len(lines) + 12)
+        # One panel, reallocated only when a new stage adds a line
+        if self.panel is None or self.panel.get_size() != size:
+            self.panel = pygame.Surface(size, pygame.SRCALPHA)
+        self.panel.fill(OVERLAY_BG)
+        for i, (text, color) in enumerate(lines):
+            self.panel.blit(self.render_line(text, 22, color), (8, 6 + i * line_height))
+        return surface.blit(self.panel, (10, 10))
+
+    def dump(self, prefix=None):
+        """Write <prefix>.csv and <prefix>.json; returns the paths, or None if nothing was recorded"""
+        if not self.names:
+            return None
+        prefix = prefix or PROFILE_PATH or DEFAULT_DUMP_PREFIX
+        summary = self.summary()
+        histograms = self.histograms()
+        bins = [f"{low}-{high}ms" if high != float('inf') else f">{low}ms"
+                for low, high in zip(BIN_EDGES_MS, BIN_EDGES_MS[1:])]
+
+        csv_path = prefix + ".csv"
+        with open(csv_path, "w") as f:
+            f.write(",".join(["stage", "count", "mean_ms", "p50_ms", "p95_ms", "max_ms"] + bins) + "\n")
+            for name, stats in summary.items():
+                row = [name, stats['count']] + [f"{stats[key]:.4f}" for key in ("mean_ms", "p50_ms", "p95_ms", "max_ms")]
+                f.write(",".join(str(value) for value in row + histograms[name]) + "\n")
+
+        json_path = prefix + ".json"
+        with open(json_path, "w") as f:
+            json.dump({
+                'fps': self.fps(),
+                'window': self.window,
+                'bin_edges_ms': [edge if edge != float('inf') else None for edge in BIN_EDGES_MS],
+                'stages': {name: dict(stats, histogram=histograms[name]) for name, stats in summary.items()},
+            }, f, indent=2)
+        return csv_path, json_path
+
+
+_profiler = None
+
+
+def get_profiler():
+    """Process-wide profiler; recording starts on if GESTURE_PROFILE is set"""
+    global _profiler
+    if _profiler is None:
+        _profiler = FrameProfiler(enabled=PROFILE_PATH is not None)
+    return _profiler
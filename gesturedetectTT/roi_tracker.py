@@ -0,0 +1,117 @@
+# roi_tracker.py - Crop inference to the region around the last seen hand
+import cv2
+import numpy as np
+
+
+class RoiTracker:
+    """Predict where the hand will be and only send that region to the model"""
+
+    def __init__(self, margin=0.35, velocity_gain=1.5, max_side=256, min_score=0.8, edge=0.03):
+        # Extra space around the hand, relative to its size
+        self.margin = margin
+        # How far ahead to pad in the direction of motion
+        self.velocity_gain = velocity_gain
+        # ROI crops are downscaled to at most this many pixels
+        self.max_side = max_side
+        # Below this score the ROI result is not trusted
+        self.min_score = min_score
+        # Landmarks this close to the crop edge mean the hand is leaving it
+        self.edge = edge
+
+        # Last hand bounding box in pixels and its movement per frame
+        self.box = None
+        self.velocity = (0.0, 0.0)
+
+        # Stats
+        self.roi_attempts = 0
+        self.roi_hits = 0
+        self.full_frames = 0
+
+    @property
+    def hit_rate(self):
+        """Share of ROI attempts that found the hand without a full-frame retry"""
+        if self.roi_attempts == 0:
+            return 0.0
+        return self.roi_hits / self.roi_attempts
+
+    def reset(self):
+        self.box = None
+        self.velocity = (0.0, 0.0)
+
+    def region(self, frame_shape):
+        """Square crop region (x0, y0, side) for the next frame, or None for full frame"""
+        if self.box is None:
+            return None
+        h, w = frame_shape[:2]
+        x0, y0, x1, y1 = self.box
+        vx, vy = self.velocity
+
+        side = max(x1 - x0, y1 - y0) * (1.0 + 2.0 * self.margin)
+        side += self.velocity_gain * 2.0 * max(abs(vx), abs(vy))
+        side = int(min(max(side, 32), min(h, w)))
+
+        cx = (x0 + x1) / 2.0 + vx * self.velocity_gain
+        cy = (y0 + y1) / 2.0 + vy * self.velocity_gain
+        left = int(min(max(cx - side / 2.0, 0), w - side))
+        top = int(min(max(cy - side / 2.0, 0), h - side))
+        return left, top, side
+
+    def crop(self, rgb_frame, region):
+        """Cut the region out of the frame and shrink it for the model"""
+        left, top, side = region
+        crop = rgb_frame[top:top + side, left:left + side]
+        if side > self.max_side:
+            return cv2.resize(crop, (self.max_side, self.max_side), interpolation=cv2.INTER_AREA)
+        return np.ascontiguousarray(crop)
+
+    def to_frame(self, landmarks, region, frame_shape):
+        """Map crop-normalized landmarks back to full-frame normalized coordinates"""
+        h, w = frame_shape[:2]
+        left, top, side = region
+        mapped = landmarks.copy()
+        mapped[:, 0] = (left + landmarks[:, 0] * side) / w
+        mapped[:, 1] = (top + landmarks[:, 1] * side) / h
+        # MediaPipe scales z roughly like x
+        mapped[:, 2] = landmarks[:, 2] * side / w
+        return mapped
+
+    def accepts(self, landmarks, score):
+        """Whether an ROI result is good enough to skip the full-frame retry"""
+        if landmarks is None or score is None or score < self.min_score:
+            return False
+        xy = landmarks[:, :2]
+        return bool(np.all(xy > self.edge) and np.all(xy < 1.0 - self.edge))
+
+    def update(self, landmarks, frame_shape):
+        """Remember where the hand was this frame (full-frame normalized landmarks)"""
+        if landmarks is None:
+            self.reset()
+            return
+        h, w = frame_shape[:2]
+        xs = landmarks[:, 0] * w
+        ys = landmarks[:, 1] * h
+        box = (float(xs.min()), float(ys.min()), float(xs.max()), float(ys.max()))
+        if self.box is not None:
+            old_cx = (self.box[0] + self.box[2]) / 2.0
+            old_cy = (self.box[1] + self.box[3]) / 2.0
+            new_cx = (box[0] + box[2]) / 2.0
+            new_cy = (box[1] + box[3]) / 2.0
+            self.velocity = (new_cx - old_cx, new_cy - old_cy)
+        self.box = box
+
+    def process(self, backend, rgb_frame):
+        """Run the backend on the ROI when we have one, falling back to the full frame"""
+        region = self.region(rgb_frame.shape)
+        if region is not None:
+            self.roi_attempts += 1
+            landmarks, handedness, score = backend.process(self.crop(rgb_frame, region))
+            if self.accepts(landmarks, score):
+                self.roi_hits += 1
+                landmarks = self.to_frame(landmarks, region, rgb_frame.shape)
+                self.update(landmarks, rgb_frame.shape)
+                return landmarks, handedness, score
+
+        self.full_frames += 1
+        landmarks, handedness, score = backend.process(rgb_frame)
+        self.update(landmarks, rgb_frame.shape)
+        return landmarks, handedness, score
@@ -0,0 +1,56 @@
+# scheduler.py - Decide how often hand inference runs based on what screens need
+import time
+
+# Input fidelity levels a screen can ask for
+FIDELITY_NONE = 0       # Camera preview only, no inference
+FIDELITY_PRESENCE = 1   # Low-rate, lightweight model; enough to show a hand is there
+FIDELITY_TRACKING = 2   # Every frame at the requested model complexity
+
+FIDELITY_NAMES = {
+    FIDELITY_NONE: "none",
+    FIDELITY_PRESENCE: "presence",
+    FIDELITY_TRACKING: "tracking",
+}
+
+
+class InferenceScheduler:
+    """Gate the inference stage according to the current fidelity level"""
+
+    def __init__(self, presence_hz=5.0):
+        self.presence_interval = 1.0 / presence_hz
+        self.level = FIDELITY_TRACKING
+        self.last_run = 0.0
+
+        # Stats
+        self.runs = 0
+        self.skips = 0
+
+    def set_level(self, level):
+        if level != self.level:
+            self.level = level
+            # Let the first frame at a new level through immediately
+            self.last_run = 0.0
+
+    def should_run(self, now=None):
+        """Whether the inference stage should process the current frame"""
+        if self.level == FIDELITY_NONE:
+            run = False
+        elif self.level == FIDELITY_PRESENCE:
+            now = time.perf_counter() if now is None else now
+            run = now - self.last_run >= self.presence_interval
+        else:
+            run = True
+
+        if run:
+            self.last_run = time.perf_counter() if now is None else now
+            self.runs += 1
+        else:
+            self.skips += 1
+        return run
+
+    def adjust_config(self, config):
+        """Model settings to use at the current level"""
+        if self.level == FIDELITY_PRESENCE and config.get('model_complexity', 1) != 0:
+            config = dict(config)
+            config['model_complexity'] = 0
+        return config
@@ -0,0 +1,324 @@
+# session.py - Record hand tracking sessions to disk and replay them without a camera
+import glob
+import os
+import queue
+import threading
+import time
+from types import SimpleNamespace
+
+import cv2
+import numpy as np
+
+from gesture_classifier import GESTURES, NO_GESTURE
+
+HANDEDNESS = ("Left", "Right")
+CHUNK_PATTERN = "chunk_{:05d}.npz"
+
+
+def gesture_code(name):
+    """GESTURES index for a gesture name, or NO_GESTURE"""
+    return GESTURES.index(name) if name in GESTURES else NO_GESTURE
+
+
+class SessionRecorder:
+    """Append HandStates to a directory of fixed-size .npz chunks"""
+
+    def __init__(self, path, chunk_size=120, record_frames=False, label=None):
+        self.path = path
+        self.chunk_size = chunk_size
+        self.record_frames = record_frames
+        # Ground truth gesture the user is performing, for offline evaluation
+        self.label = gesture_code(label)
+        os.makedirs(path, exist_ok=True)
+
+        # Keep numbering after any chunks already in the directory
+        self.chunk_index = len(glob.glob(os.path.join(path, "chunk_*.npz")))
+        self.start_time = None
+        self.chunk = None
+        self.count = 0
+        self.recorded = 0
+
+        # Chunks are written on their own thread so the pipeline never waits on disk
+        self.pending = queue.Queue()
+        self.writer = threading.Thread(target=self._write_loop, name="SessionRecorder", daemon=True)
+        self.writer.start()
+
+    def set_label(self, name):
+        """Label the frames recorded from now on with a gesture name (or None)"""
+        self.label = gesture_code(name)
+
+    def _new_chunk(self, frame_shape):
+        chunk = {
+            'frame_ids': np.zeros(self.chunk_size, dtype=np.int64),
+            'timestamps': np.zeros(self.chunk_size, dtype=np.float64),
+            'landmarks': np.full((self.chunk_size, 21, 3), np.nan, dtype=np.float32),
+            'handedness': np.full(self.chunk_size, -1, dtype=np.int8),
+            'scores': np.full(self.chunk_size, np.nan, dtype=np.float32),
+            'gestures': np.full(self.chunk_size, NO_GESTURE, dtype=np.int8),
+            'labels': np.full(self.chunk_size, NO_GESTURE, dtype=np.int8),
+            'frame_shape': np.array(frame_shape, dtype=np.int32),
+        }
+        if self.record_frames:
+            chunk['frames'] = np.empty((self.chunk_size,) + tuple(frame_shape), dtype=np.uint8)
+        return chunk
+
+    def record(self, state):
+        """Store one completed HandState"""
+        if self.start_time is None:
+            self.start_time = state.timestamp
+        if self.chunk is None:
+            self.chunk = self._new_chunk(state.frame.shape)
+            self.count = 0
+
+        i = self.count
+        chunk = self.chunk
+        chunk['frame_ids'][i] = state.frame_id
+        chunk['timestamps'][i] = state.timestamp - self.start_time
+        if state.landmarks is not None:
+            chunk['landmarks'][i] = state.landmarks
+            chunk['scores'][i] = state.score if state.score is not None else np.nan
+            if state.handedness in HANDEDNESS:
+                chunk['handedness'][i] = HANDEDNESS.index(state.handedness)
+        chunk['gestures'][i] = gesture_code(state.gesture)
+        chunk['labels'][i] = self.label
+        if self.record_frames and state.frame.shape == chunk['frames'].shape[1:]:
+            # Mirrored BGR frame, as the screens saw it
+            chunk['frames'][i] = state.frame
+
+        self.count += 1
+        self.recorded += 1
+        if self.count == self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        """Queue the partly filled chunk for writing"""
+        if self.chunk is None or self.count == 0:
+            return
+        chunk = {key: (value if key == 'frame_shape' else value[:self.count])
+                 for key, value in self.chunk.items()}
+        self.pending.put((os.path.join(self.path, CHUNK_PATTERN.format(self.chunk_index)), chunk))
+        self.chunk_index += 1
+        self.chunk = None
+        self.count = 0
+
+    def _write_loop(self):
+        while True:
+            item = self.pending.get()
+            if item is None:
+                break
+            filename, chunk = item
+            np.savez(filename, **chunk)
+
+    def close(self):
+        """Write whatever is left and wait for the writer to finish"""
+        self.flush()
+        self.pending.put(None)
+        self.writer.join()
+
+
+class ReplaySession:
+    """A recorded session loaded back into memory"""
+
+    def __init__(self, path):
+        files = sorted(glob.glob(os.path.join(path, "chunk_*.npz")))
+        if not files:
+            raise FileNotFoundError(f"No recorded chunks in {path}")
+
+        chunks = [np.load(filename) for filename in files]
+        self.frame_shape = tuple(int(v) for v in chunks[0]['frame_shape'])
+        self.timestamps = np.concatenate([c['timestamps'] for c in chunks])
+        self.landmarks = np.concatenate([c['landmarks'] for c in chunks])
+        self.handedness = np.concatenate([c['handedness'] for c in chunks])
+        self.scores = np.concatenate([c['scores'] for c in chunks])
+        self.gestures = np.concatenate([c['gestures'] for c in chunks])
+        self.labels = np.concatenate([c['labels'] for c in chunks])
+        self.frames = None
+        if all('frames' in c.files for c in chunks):
+            self.frames = np.concatenate([c['frames'] for c in chunks])
+        for chunk in chunks:
+            chunk.close()
+
+        # Index of the frame the replay capture handed out last, and the last one processed
+        self.position = -1
+        self.consumed = -1
+        # Newest frame id a screen has read; lockstep replay hands out the next frame after it
+        self.seen_id = 0
+        self.closed = False
+        self.cond = threading.Condition()
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def hand(self, index):
+        """(landmarks, handedness, score) recorded for a frame, like a backend returns"""
+        landmarks = self.landmarks[index]
+        if np.isnan(landmarks[0, 0]):
+            return None, None, None
+        handedness = self.handedness[index]
+        label = HANDEDNESS[handedness] if handedness >= 0 else None
+        return landmarks.copy(), label, float(self.scores[index])
+
+    def index_for(self, frame_id):
+        """Recorded index of a replayed frame
+
+        CameraStream numbers frames from 1 in the order read() returns them, and the replay
+        capture reads the recording in order, so the id alone says which frame it is.
+        """
+        return (frame_id - 1) % len(self)
+
+    def advance(self, index):
+        with self.cond:
+            self.position = index
+
+    def current_hand(self):
+        """Result for the frame the capture handed out last; for single-threaded read/process loops"""
+        with self.cond:
+            index = self.position
+            self.consumed = index
+            self.cond.notify_all()
+        if index < 0:
+            return None, None, None
+        return self.hand(index)
+
+    def mark_seen(self, frame_id):
+        """A screen has read the result for this frame"""
+        with self.cond:
+            if frame_id > self.seen_id:
+                self.seen_id = frame_id
+                self.cond.notify_all()
+
+    def wait_seen(self, frame_id):
+        """Block until the frame has been read by a screen; False once the session is closed"""
+        with self.cond:
+            self.cond.wait_for(lambda: self.seen_id >= frame_id or self.closed)
+            return not self.closed
+
+    def close(self):
+        """Wake any reader waiting in lockstep"""
+        with self.cond:
+            self.closed = True
+            self.cond.notify_all()
+
+
+class ReplayCapture:
+    """cv2.VideoCapture stand-in that plays back a recorded session"""
+
+    def __init__(self, session, realtime=True, loop=False):
+        self.session = session
+        # Realtime follows the recorded timing, and a slow pipeline skips frames like with a camera.
+        # Otherwise it runs in lockstep: a frame is only handed out once a screen has read the
+        # previous one, so every recorded frame is seen, in order, however slow the consumer is.
+        self.realtime = realtime
+        self.loop = loop
+        self.index = 0
+        # Frames handed out so far; matches CameraStream's frame ids
+        self.reads = 0
+        self.start_time = None
+        self.opened = True
+        self.blank = np.zeros(session.frame_shape, dtype=np.uint8)
+
+    def isOpened(self):
+        return self.opened
+
+    @property
+    def finished(self):
+        """Every recorded frame has been handed out and nothing more will come"""
+        return not self.loop and self.index >= len(self.session)
+
+    def read(self, image=None):
+        if not self.opened:
+            return False, None
+        if not self.realtime and not self.session.wait_seen(self.reads):
+            return False, None
+        if self.index >= len(self.session):
+            if not self.loop:
+                return False, None
+            self.index = 0
+            self.start_time = None
+
+        if self.realtime:
+            now = time.perf_counter()
+            if self.start_time is None:
+                self.start_time = now - self.session.timestamps[self.index]
+            delay = self.start_time + self.session.timestamps[self.index] - now
+            if delay > 0:
+                time.sleep(delay)
+
+        frame = self.blank
+        if self.session.frames is not None:
+            # Recorded frames are already mirrored; undo it so the pipeline's flip restores them
+            frame = cv2.flip(self.session.frames[self.index], 1)
+        if image is not None and image.shape == frame.shape:
+            np.copyto(image, frame)
+            frame = image
+        else:
+            frame = frame.copy()
+
+        self.session.advance(self.index)
+        self.index += 1
+        self.reads += 1
+        return True, frame
+
+    def get(self, prop):
+        if prop == cv2.CAP_PROP_FRAME_COUNT:
+            return float(len(self.session))
+        if prop == cv2.CAP_PROP_POS_FRAMES:
+            return float(self.index)
+        if prop == cv2.CAP_PROP_FRAME_HEIGHT:
+            return float(self.session.frame_shape[0])
+        if prop == cv2.CAP_PROP_FRAME_WIDTH:
+            return float(self.session.frame_shape[1])
+        return 0.0
+
+    def release(self):
+        self.opened = False
+        self.session.close()
+
+
+class ReplayHands:
+    """mp.solutions.hands.Hands stand-in returning the recorded landmarks
+
+    Answers for the frame the capture handed out last, so read() and process() must alternate
+    on one thread; the threaded pipeline uses ReplayBackend, which goes by frame id.
+    """
+
+    def __init__(self, session):
+        self.session = session
+
+    def process(self, rgb_frame):
+        landmarks, handedness, score = self.session.current_hand()
+        if landmarks is None:
+            return SimpleNamespace(multi_hand_landmarks=None, multi_handedness=None)
+        points = [SimpleNamespace(x=float(x), y=float(y), z=float(z)) for x, y, z in landmarks]
+        classification = SimpleNamespace(label=handedness, score=score)
+        return SimpleNamespace(
+            multi_hand_landmarks=[SimpleNamespace(landmark=points)],
+            multi_handedness=[SimpleNamespace(classification=[classification])],
+        )
+
+    def close(self):
+        pass
+
+
+class ReplayBackend:
+    """Inference backend that answers from a recorded session instead of MediaPipe"""
+
+    name = "replay"
+
+    def __init__(self, session):
+        self.session = session
+
+    def preload(self, config):
+        pass
+
+    def configure(self, config):
+        pass
+
+    def process(self, rgb_frame, frame_id=None):
+        """Return (landmarks, handedness, score) recorded for the frame with this id"""
+        if frame_id is None:
+            return self.session.current_hand()
+        return self.session.hand(self.session.index_for(frame_id))
+
+    def close(self):
+        pass
@@ -0,0 +1,255 @@
+# vision.py - Process-wide camera and MediaPipe Hands service
+import os
+
+from camera import CameraStream
+from inference_backend import make_backend
+from pipeline import BLOCK, DROP_OLDEST, HandPipeline
+from scheduler import FIDELITY_TRACKING, InferenceScheduler
+from session import ReplayBackend, ReplayCapture, ReplaySession, SessionRecorder
+
+# Settings used by the menu hand tracker
+MENU_CONFIG = {
+    'max_num_hands': 1,
+    'model_complexity': 1,
+    'min_detection_confidence': 0.7,
+    'min_tracking_confidence': 0.7,
+}
+
+# Settings used by the game windows
+GAME_CONFIG = {
+    'max_num_hands': 1,
+    'model_complexity': 0,
+    'min_detection_confidence': 0.6,
+    'min_tracking_confidence': 0.6,
+}
+
+
+class VisionSubscription:
+    """A screen's handle on the shared camera and hand model"""
+
+    def __init__(self, service, name, config):
+        self.service = service
+        self.name = name
+        self.config = dict(config)
+        self.fidelity = FIDELITY_TRACKING
+        self.active = True
+
+    def read(self):
+        """Return the newest completed HandState, or None"""
+        if not self.active:
+            return None
+        return self.service.poll()
+
+    def configure(self, **params):
+        """Change model parameters for this subscription at runtime"""
+        self.config.update(params)
+        self.service.apply_config()
+
+    def set_fidelity(self, level):
+        """Tell the service how much hand input this screen needs right now"""
+        if level != self.fidelity:
+            self.fidelity = level
+            self.service.apply_config()
+
+    def release(self):
+        if self.active:
+            self.active = False
+            self.service.unsubscribe(self)
+
+
+class VisionService:
+    """Own one camera and one inference backend shared by every screen"""
+
+    def __init__(self, source=0, queue_size=1, policy=DROP_OLDEST, backend=None, roi_tracking=None,
+                 replay=None, record=None):
+        self.source = source
+        self.queue_size = queue_size
+        self.policy = policy
+        if roi_tracking is None:
+            roi_tracking = os.environ.get("GESTURE_ROI_TRACKING", "0") == "1"
+        self.roi_tracking = roi_tracking
+
+        # Replay a recorded session instead of the camera and model
+        self.replay = replay or os.environ.get("GESTURE_REPLAY")
+        self.replay_session = None
+        if self.replay:
+            # Recorded landmarks are full-frame and looked up by frame id. With
+            # GESTURE_REPLAY_REALTIME=0 the capture waits for each frame to be polled before
+            # reading the next, so with BLOCK queues every frame reaches the screen in order
+            self.roi_tracking = False
+            self.policy = BLOCK
+        # Record every processed frame to this directory
+        self.record = record or os.environ.get("GESTURE_RECORD")
+        self.recorder = None
+        self.backend_name = backend
+        self.camera = None
+        self.backend = None
+        self.pipeline = None
+        self.subscriptions = []
+        self.config_key = None
+        self.scheduler = InferenceScheduler()
+        if self.replay:
+            # Presence mode is paced by wall time; in replay every frame gets its recorded result
+            self.scheduler.presence_interval = 0.0
+
+    def subscribe(self, name, **config):
+        """Hand out a subscription; the newest one decides the model settings"""
+        settings = dict(MENU_CONFIG)
+        settings.update(config)
+        subscription = VisionSubscription(self, name, settings)
+
+        if self.camera is None:
+            self.open_camera()
+        if self.backend is None:
+            self.backend = self.make_backend(self.backend_name)
+        if self.record and self.recorder is None:
+            self.recorder = SessionRecorder(
+                self.record,
+                record_frames=os.environ.get("GESTURE_RECORD_FRAMES", "0") == "1",
+                label=os.environ.get("GESTURE_RECORD_LABEL"),
+            )
+        self.subscriptions.append(subscription)
+        self.apply_config()
+
+        if self.pipeline is None:
+            self.start_pipeline()
+        return subscription
+
+    def open_camera(self):
+        source = self.source
+        if self.replay:
+            self.replay_session = ReplaySession(self.replay)
+            realtime = os.environ.get("GESTURE_REPLAY_REALTIME", "1") == "1"
+            source = ReplayCapture(self.replay_session, realtime=realtime)
+        self.camera = CameraStream(source)
+        if not self.camera.isOpened():
+            print("Error: Could not open camera")
+
+    def make_backend(self, name):
+        if self.replay_session is not None:
+            return ReplayBackend(self.replay_session)
+        return make_backend(name)
+
+    def start_pipeline(self):
+        self.pipeline = HandPipeline(self.camera, self.backend, self.queue_size,
+                                     self.policy, self.roi_tracking, self.scheduler,
+                                     self.recorder)
+        self.pipeline.start()
+
+    def set_backend(self, name):
+        """Swap the inference backend ('thread' or 'process') while running"""
+        if self.backend is not None and self.backend.name == name:
+            return
+        self.backend_name = name
+        if self.backend is None:
+            return
+
+        if self.replay_session is not None:
+            return
+
+        running = self.pipeline is not None
+        if running:
+            self.pipeline.stop()
+        self.backend.close()
+        self.backend = make_backend(name)
+        self.config_key = None
+        self.apply_config()
+        if running:
+            self.start_pipeline()
+
+    def unsubscribe(self, subscription):
+        if subscription in self.subscriptions:
+            self.subscriptions.remove(subscription)
+        if self.subscriptions:
+            self.apply_config()
+        else:
+            self.shutdown()
+
+    def preload(self, **config):
+        """Build a model ahead of time so the first switch to it is instant"""
+        if self.backend is None:
+            return
+        settings = dict(MENU_CONFIG)
+        settings.update(config)
+        self.backend.preload(settings)
+
+    def apply_config(self):
+        """Switch to the settings of the most recent subscription"""
+        if not self.subscriptions or self.backend is None:
+            return
+        # The most demanding subscriber sets the inference rate
+        self.scheduler.set_level(max(sub.fidelity for sub in self.subscriptions))
+        config = self.scheduler.adjust_config(self.subscriptions[-1].config)
+        key = tuple(sorted(config.items()))
+        if key != self.config_key:
+            self.config_key = key
+            self.backend.configure(config)
+
+    def poll(self):
+        """Return the latest HandState without waiting on the pipeline"""
+        if self.pipeline is None:
+            return None
+        state = self.pipeline.latest
+        if state is not None and self.replay_session is not None:
+            # Lockstep replay reads the next frame once a screen has seen this one
+            self.replay_session.mark_seen(state.frame_id)
+        return state
+
+    def wait_for_result(self, last_id, timeout=None):
+        """Block until a HandState newer than last_id is out; None on timeout"""
+        if self.pipeline is None:
+            return None
+        state = self.pipeline.wait_for_result(last_id, timeout)
+        if state is None or state.frame_id == last_id:
+            return None
+        return state
+
+    def replay_finished(self):
+        """A replay has run out and its last frame has come through the pipeline"""
+        if self.camera is None or not self.camera.ended or self.pipeline is None:
+            return False
+        latest = self.pipeline.latest
+        return latest is not None and latest.frame_id >= self.camera.frame_id
+
+    def roi_hit_rate(self):
+        """Share of frames the ROI tracking mode served without a full-frame pass"""
+        if self.pipeline is None or self.pipeline.roi_tracker is None:
+            return None
+        return self.pipeline.roi_tracker.hit_rate
+
+    def stage_stats(self):
+        """Per-stage latency stats, keyed by stage name"""
+        if self.pipeline is None:
+            return {}
+        return self.pipeline.stats
+
+    def shutdown(self):
+        """Release the camera and the inference backend"""
+        if self.pipeline:
+            self.pipeline.stop()
+            self.pipeline = None
+        if self.replay_session is not None:
+            # Wake a capture thread waiting in lockstep before joining it
+            self.replay_session.close()
+        if self.camera:
+            self.camera.release()
+            self.camera = None
+        self.replay_session = None
+        if self.recorder:
+            self.recorder.close()
+            self.recorder = None
+        if self.backend:
+            self.backend.close()
+            self.backend = None
+        self.config_key = None
+
+
+_service = None
+
+
+def get_vision_service():
+    """Return the process-wide vision service"""
+    global _service
+    if _service is None:
+        _service = VisionService()
+    return _service